@@ -0,0 +1,325 @@
+"""Scaling benchmarks for the scheduling engines and the metrics step.
+
+Every case is a seeded workload, so two runs on the same machine time the
+same work. Results are written as JSON; "compare" (or run --baseline)
+flags cases that got slower than a saved baseline.
+
+Examples:
+    python -m benchmarks.bench run -o baseline.json
+    python -m benchmarks.bench run --max-count 10000 --baseline baseline.json
+    python -m benchmarks.bench compare baseline.json current.json
+"""
+
+import argparse
+import datetime
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from logic.compare import ALGORITHMS
+from logic.metrics import compute_metrics
+from logic.process_table import ProcessTable
+from logic.scheduler import MLFQ_BOOST, QUANTUM_ALGORITHMS, Scheduler
+
+# Workload grid; every combination is one case per algorithm
+COUNTS = (100, 1000, 10000, 100000, 1000000)
+BURST_SCALES = (10, 1000)  # Mean burst length
+DENSITIES = (0.1, 10.0)  # Mean arrivals per time unit
+QUANTA = (2, 16)  # Round Robin and MLFQ (its top-level quantum) only
+
+# Cases estimated to need more engine events than this are skipped
+MAX_EVENTS = 2000000
+
+# Engine methods, called directly so cache lookups and metrics stay out of
+# the engine timing
+ENGINES = {
+    "FCFS": "_fcfs_table",
+    "SRTF": "_srtf_table",
+    "Priority": "_priority_table",
+    "Round Robin": "_round_robin_table",
+    "EDF": "_edf_table",
+    "RMS": "_rms_table",
+    "MLFQ": "_multilevel_feedback_table",
+}
+
+# Timing differences below this many seconds are treated as noise
+NOISE_SECONDS = 0.005
+
+
+def generate_workload(count, burst_scale, density, seed):
+    """Poisson arrivals with exponential bursts, priorities 1-10 and
+    deadlines twice the burst plus up to burst_scale after arrival."""
+    rng = np.random.default_rng([seed, count, burst_scale, int(density * 1000)])
+    arrival = np.cumsum(rng.exponential(1 / density, count)).astype(np.int64)
+    burst = 1 + rng.exponential(burst_scale - 1, count).astype(np.int64)
+    priority = rng.integers(1, 11, count)
+    deadline = arrival + burst * 2 + rng.integers(0, burst_scale, count)
+    return ProcessTable(arrival, burst, priority=priority, deadline=deadline)
+
+
+def estimated_events(table, algorithm, quantum):
+    """Rough upper bound on the events an engine handles for this case."""
+    if algorithm == "Round Robin":
+        return int(np.ceil(table.burst / quantum).sum())
+    if algorithm == "MLFQ":
+        # At most Round Robin's slices, plus arrivals and a boost every
+        # MLFQ_BOOST busy time units
+        slices = int(np.ceil(table.burst / quantum).sum())
+        return slices + len(table) + int(table.burst.sum()) // MLFQ_BOOST
+    # One arrival and at most one completion or preemption per process
+    return 2 * len(table)
+
+
+def build_cases(counts, algorithms):
+    cases = []
+    for count, burst_scale, density in itertools.product(
+        counts, BURST_SCALES, DENSITIES
+    ):
+        for algorithm in algorithms:
+            quanta = QUANTA if algorithm in QUANTUM_ALGORITHMS else (None,)
+            for quantum in quanta:
+                cases.append(
+                    {
+                        "algorithm": algorithm,
+                        "count": count,
+                        "burst_scale": burst_scale,
+                        "density": density,
+                        "quantum": quantum,
+                    }
+                )
+    return cases
+
+
+def case_id(case):
+    quantum = f"/q{case['quantum']}" if case["quantum"] is not None else ""
+    return (
+        f"{case['algorithm']}{quantum}/n{case['count']}"
+        f"/b{case['burst_scale']}/d{case['density']:g}"
+    )
+
+
+def run_case(table, case, repeat):
+    """Best-of-repeat wall time for the engine and the metrics step, then
+    one extra traced run for the peak memory of both together."""
+    engine_times = []
+    metrics_times = []
+    for _ in range(repeat):
+        scheduler = Scheduler(table, case["algorithm"], case["quantum"])
+        start = time.perf_counter()
+        schedule = getattr(scheduler, ENGINES[case["algorithm"]])()
+        engine_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        compute_metrics(schedule)
+        metrics_times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        scheduler = Scheduler(table, case["algorithm"], case["quantum"])
+        schedule = getattr(scheduler, ENGINES[case["algorithm"]])()
+        compute_metrics(schedule)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return dict(
+        case,
+        id=case_id(case),
+        engine_seconds=min(engine_times),
+        metrics_seconds=min(metrics_times),
+        peak_bytes=peak,
+        segments=len(schedule),
+        events=scheduler.events_processed,
+    )
+
+
+def run_benchmarks(counts, algorithms, seed, repeat, max_events, report=None):
+    results = []
+    workloads = {}
+    for case in build_cases(counts, algorithms):
+        key = (case["count"], case["burst_scale"], case["density"])
+        if key not in workloads:
+            # Workloads are shared by every algorithm of the same shape
+            workloads.clear()
+            workloads[key] = generate_workload(*key, seed)
+        table = workloads[key]
+        if estimated_events(table, case["algorithm"], case["quantum"]) > max_events:
+            result = dict(case, id=case_id(case), skipped=True)
+        else:
+            result = run_case(table, case, repeat)
+        results.append(result)
+        if report is not None:
+            report(result)
+    return {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold):
+    """Per-case slowdown ratios; returns (rows, regressions)."""
+    previous = {
+        result["id"]: result
+        for result in baseline["results"]
+        if not result.get("skipped")
+    }
+    rows = []
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(result["id"])
+        if result.get("skipped") or old is None:
+            continue
+        for field in ("engine_seconds", "metrics_seconds", "peak_bytes"):
+            before, after = old[field], result[field]
+            ratio = after / before if before else float("inf")
+            row = {
+                "id": result["id"],
+                "field": field,
+                "before": before,
+                "after": after,
+                "ratio": ratio,
+            }
+            rows.append(row)
+            noise = NOISE_SECONDS if field.endswith("seconds") else 0
+            if ratio > 1 + threshold and after - before > noise:
+                regressions.append(row)
+    return rows, regressions
+
+
+def print_result(result):
+    if result.get("skipped"):
+        print(f"{result['id']:<40} skipped", file=sys.stderr)
+        return
+    print(
+        f"{result['id']:<40} engine {result['engine_seconds']:9.4f}s"
+        f"  metrics {result['metrics_seconds']:8.4f}s"
+        f"  peak {result['peak_bytes'] / 2**20:8.1f} MiB",
+        file=sys.stderr,
+    )
+
+
+def print_regressions(regressions, threshold):
+    if not regressions:
+        print(f"No regressions above {threshold:.0%}", file=sys.stderr)
+        return
+    print(f"{len(regressions)} regression(s) above {threshold:.0%}:", file=sys.stderr)
+    for row in regressions:
+        print(
+            f"  {row['id']:<40} {row['field']:<16}"
+            f" {row['before']:.4g} -> {row['after']:.4g} ({row['ratio']:.2f}x)",
+            file=sys.stderr,
+        )
+
+
+def run_command(args):
+    counts = [count for count in COUNTS if count <= args.max_count]
+    results = run_benchmarks(
+        counts,
+        args.algorithm or ALGORITHMS,
+        args.seed,
+        args.repeat,
+        args.max_events,
+        report=None if args.quiet else print_result,
+    )
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        json.dump(results, output, indent=2)
+        output.write("\n")
+    finally:
+        if args.output:
+            output.close()
+
+    if args.baseline:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        _, regressions = compare_results(baseline, results, args.threshold)
+        print_regressions(regressions, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+def compare_command(args):
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)
+    with open(args.current, "r") as file:
+        current = json.load(file)
+    _, regressions = compare_results(baseline, current, args.threshold)
+    print_regressions(regressions, args.threshold)
+    return 1 if regressions else 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="ShadFlow scheduler benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmark grid")
+    run_parser.add_argument(
+        "-a",
+        "--algorithm",
+        action="append",
+        choices=ALGORITHMS,
+        help="Algorithm to benchmark (repeatable); defaults to all of them",
+    )
+    run_parser.add_argument(
+        "--max-count",
+        type=int,
+        default=max(COUNTS),
+        help="Skip process counts above this",
+    )
+    run_parser.add_argument("-s", "--seed", type=int, default=0)
+    run_parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="Timed runs per case (best kept)"
+    )
+    run_parser.add_argument(
+        "--max-events",
+        type=int,
+        default=MAX_EVENTS,
+        help="Skip cases estimated to need more engine events",
+    )
+    run_parser.add_argument("-o", "--output", help="Results file (default stdout)")
+    run_parser.add_argument(
+        "--baseline", help="Flag slowdowns against this earlier results file"
+    )
+    run_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that counts as a regression (default 0.2)",
+    )
+    run_parser.add_argument(
+        "--quiet", action="store_true", help="Don't print per-case timings"
+    )
+    run_parser.set_defaults(handler=run_command)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Compare two saved results files"
+    )
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.2)
+    compare_parser.set_defaults(handler=compare_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,485 @@
+"""Headless command-line runner for the scheduling engine.
+
+Only the logic package is imported, so this runs on machines without a
+display and without Qt or matplotlib installed.
+
+Examples:
+    python cli.py run processes.csv -a SRTF -a "Round Robin" --quantum 4
+    python cli.py run trace.jsonl --cores 8 --queues per-core
+    python cli.py run trace.jsonl -a MLFQ --level-quanta 2,8,32 --boost 200
+    cat processes.json | python cli.py run - --format csv > metrics.csv
+    python cli.py sweep config.txt --replicas 2000 --seed 7
+    python cli.py history list -a SRTF --since 2024-05-01
+"""
+
+import argparse
+import csv
+import datetime
+import json
+import os
+import sys
+
+from logic.compare import ALGORITHMS, available_algorithms, compare_algorithms
+from logic.metrics import summary_fields
+from logic.multicore import GLOBAL_QUEUE, QUEUE_MODES
+from logic.run_history import HISTORY_FILE, RunHistory
+from logic.scheduler import (
+    MLFQ_BOOST,
+    MLFQ_LEVELS,
+    QUANTUM_ALGORITHMS,
+    Scheduler,
+    mlfq_options,
+)
+from logic.sweep import parse_config, run_sweep
+from logic.trace_import import import_trace
+from logic.workload import Workload
+
+SCHEDULE_COLUMNS = ["input", "algorithm", "Process", "Start", "Finish"]
+
+# The database the GUI records its runs in
+DEFAULT_HISTORY = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "output", HISTORY_FILE
+)
+
+
+def run_command(args):
+    if args.quantum < 1:
+        raise ValueError("Quantum must be at least 1")
+    if args.cores < 1:
+        raise ValueError("A machine needs at least one core")
+    mlfq = mlfq_options(
+        args.quantum,
+        args.levels,
+        args.boost or None,
+        parse_quanta(args.level_quanta) if args.level_quanta else None,
+    )
+    # Multi-CPU schedules say which core ran each segment
+    columns = SCHEDULE_COLUMNS + (["CPU"] if args.cores > 1 else [])
+
+    # Without --schedules the segments are only needed in the CSV, so they
+    # are streamed there instead of being kept in memory
+    stream_file = None
+    if args.schedule_output and not args.schedules:
+        stream_file = open(args.schedule_output, "w", newline="")
+        stream_writer = csv.writer(stream_file)
+        stream_writer.writerow(columns)
+
+    runs = []
+    try:
+        for path in args.inputs or ["-"]:
+            # Same default as the GUI comparison: every process gets priority 1
+            trace = import_trace(path, args.input_format, default_priority=1)
+            table = trace["processes"]
+            # By default EDF and RMS only run on traces with deadlines, and
+            # MLFQ only on one core
+            algorithms = args.algorithm or available_algorithms(table, cores=args.cores)
+            if not args.quiet:
+                print(
+                    f"{path}: {trace['rows']:,} processes in"
+                    f" {trace['seconds']:.2f} s"
+                    f" ({trace['rows_per_second']:,.0f} rows/s)",
+                    file=sys.stderr,
+                )
+            if stream_file is None:
+                results = compare_algorithms(
+                    table,
+                    algorithms,
+                    args.quantum,
+                    cores=args.cores,
+                    queues=args.queues,
+                    mlfq=mlfq,
+                )
+            else:
+                results = stream_algorithms(
+                    table,
+                    algorithms,
+                    args.quantum,
+                    path,
+                    stream_writer,
+                    args.cores,
+                    args.queues,
+                    mlfq,
+                )
+            for result in results:
+                run = {
+                    "input": path,
+                    "algorithm": result["algorithm"],
+                    "quantum": quantum_of(result["algorithm"], args.quantum, mlfq),
+                    "metrics": summary_fields(result["metrics"]),
+                }
+                if args.schedules:
+                    run["schedule"] = result["schedule"].to_dicts()
+                runs.append(run)
+    finally:
+        if stream_file is not None:
+            stream_file.close()
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(runs, output, indent=2)
+            output.write("\n")
+        else:
+            write_metrics_csv(runs, output)
+    finally:
+        if args.output:
+            output.close()
+
+    if args.schedule_output and args.schedules:
+        with open(args.schedule_output, "w", newline="") as file:
+            write_schedules_csv(runs, file, columns)
+
+
+def parse_quanta(text):
+    """Per-level MLFQ quanta from a comma-separated list, top level first."""
+    try:
+        return [int(value) for value in text.split(",")]
+    except ValueError:
+        raise ValueError(f"Level quanta must be whole numbers, got {text!r}")
+
+
+def quantum_of(algorithm, quantum, mlfq):
+    """The quantum to report for a run: MLFQ's is its top-level quantum."""
+    if algorithm == "MLFQ":
+        return mlfq["quanta"][0]
+    return quantum if algorithm in QUANTUM_ALGORITHMS else None
+
+
+def stream_algorithms(
+    table,
+    algorithms,
+    quantum,
+    path,
+    writer,
+    cores=1,
+    queues=GLOBAL_QUEUE,
+    mlfq=None,
+):
+    """Run each algorithm, writing its segments to a schedule CSV as they come.
+
+    Yields result dicts like compare_algorithms, without the schedule.
+    """
+    table = Workload.of(table)
+
+    def write(chunk):
+        rows = ([path, algorithm, *row] for row in chunk.rows())
+        if chunk.cpu is not None:
+            rows = (row + [cpu] for row, cpu in zip(rows, chunk.cpu.tolist()))
+        writer.writerows(rows)
+
+    for algorithm in algorithms:
+        scheduler = Scheduler(
+            table,
+            algorithm,
+            quantum if algorithm in QUANTUM_ALGORITHMS else None,
+            cores=cores,
+            queues=queues,
+            mlfq=mlfq,
+        )
+        scheduler.run_stream(write)
+        yield {"algorithm": algorithm, "metrics": scheduler.metrics}
+
+
+def sweep_command(args):
+    algorithms = args.algorithm or ALGORITHMS
+    if args.replicas < 1:
+        raise ValueError("Replicas must be at least 1")
+    with open(args.config, "r") as file:
+        config = parse_config(file.read())
+
+    def report(done, total):
+        print(f"\r{done}/{total} replicas", end="", file=sys.stderr, flush=True)
+
+    result = run_sweep(
+        config,
+        args.replicas,
+        seed=args.seed,
+        algorithms=algorithms,
+        quantum=args.quantum,
+        workers=args.workers,
+        progress=None if args.quiet else report,
+    )
+    if not args.quiet:
+        print(file=sys.stderr)
+
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "json":
+            json.dump(dict(result, config=config), output, indent=2)
+            output.write("\n")
+        else:
+            writer = csv.writer(output)
+            writer.writerow(["algorithm", "metric", "mean", "std", "ci_low", "ci_high"])
+            for algorithm, metrics in result["metrics"].items():
+                for key, stats in metrics.items():
+                    writer.writerow(
+                        [
+                            algorithm,
+                            key,
+                            stats["mean"],
+                            stats["std"],
+                            stats["ci_low"],
+                            stats["ci_high"],
+                        ]
+                    )
+    finally:
+        if args.output:
+            output.close()
+
+
+def history_list_command(args):
+    history = open_history(args.db)
+    runs = history.runs(
+        algorithm=args.algorithm,
+        workload=args.workload,
+        since=parse_date(args.since),
+        until=parse_date(args.until),
+        limit=args.limit,
+    )
+    if args.format == "json":
+        json.dump(runs, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+    writer = csv.writer(sys.stdout)
+    writer.writerow(
+        [
+            "id",
+            "created",
+            "algorithm",
+            "quantum",
+            "processes",
+            "avg_waiting_time",
+            "avg_turnaround_time",
+            "workload",
+        ]
+    )
+    for run in runs:
+        writer.writerow(
+            [
+                run["id"],
+                datetime.datetime.fromtimestamp(run["created"]).isoformat(
+                    " ", "seconds"
+                ),
+                run["algorithm"],
+                run["quantum"],
+                run["process_count"],
+                run["avg_waiting_time"],
+                run["avg_turnaround_time"],
+                run["workload_hash"],
+            ]
+        )
+
+
+def history_show_command(args):
+    run = open_history(args.db).load(args.run_id)
+    summary = {
+        "id": run["id"],
+        "created": datetime.datetime.fromtimestamp(run["created"]).isoformat(),
+        "algorithm": run["algorithm"],
+        "quantum": run["quantum"],
+        "workload": run["workload_hash"],
+        "comparison": run["comparison"],
+        "metrics": summary_fields(run["metrics"]),
+    }
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    if args.schedule_output:
+        schedule = run["schedule"]
+        rows = (
+            [run["algorithm"], process, start, finish]
+            for process, start, finish in schedule.rows()
+        )
+        columns = SCHEDULE_COLUMNS[1:]
+        if schedule.cpu is not None:
+            # Multi-core runs say which core ran each segment
+            columns = columns + ["CPU"]
+            rows = (row + [cpu] for row, cpu in zip(rows, schedule.cpu.tolist()))
+        with open(args.schedule_output, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(columns)
+            writer.writerows(rows)
+
+
+def open_history(path):
+    # RunHistory would create an empty database; a typo should fail instead
+    if not os.path.exists(path):
+        raise ValueError(f"No run history at {path}")
+    return RunHistory(path)
+
+
+def parse_date(text):
+    """Unix timestamp of an ISO date or date and time, or None."""
+    if text is None:
+        return None
+    return datetime.datetime.fromisoformat(text).timestamp()
+
+
+def write_metrics_csv(runs, file):
+    """One row per (input, algorithm) with the flattened metrics."""
+    if not runs:
+        return
+    # Some metrics only exist for some algorithms, e.g. "feasible" for EDF
+    # and RMS; other rows leave those columns empty
+    fieldnames = ["input", "algorithm", "quantum"] + list(
+        dict.fromkeys(key for run in runs for key in run["metrics"])
+    )
+    writer = csv.DictWriter(file, fieldnames=fieldnames)
+    writer.writeheader()
+    for run in runs:
+        writer.writerow(
+            dict(
+                run["metrics"],
+                input=run["input"],
+                algorithm=run["algorithm"],
+                quantum=run["quantum"],
+            )
+        )
+
+
+def write_schedules_csv(runs, file, columns=SCHEDULE_COLUMNS):
+    """One row per schedule segment of every run."""
+    writer = csv.writer(file)
+    writer.writerow(columns)
+    for run in runs:
+        for entry in run["schedule"]:
+            writer.writerow(
+                [run["input"], run["algorithm"]]
+                + [entry[column] for column in columns[2:]]
+            )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="ShadFlow CPU scheduler (headless batch runner)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="Run algorithms on one or more process sets"
+    )
+    run_parser.add_argument(
+        "inputs",
+        nargs="*",
+        help='CSV, JSON or JSONL process files; "-" or nothing reads stdin',
+    )
+    run_parser.add_argument(
+        "-a",
+        "--algorithm",
+        action="append",
+        choices=ALGORITHMS,
+        help="Algorithm to run (repeatable); defaults to all of them",
+    )
+    run_parser.add_argument("-q", "--quantum", type=int, default=2)
+    run_parser.add_argument(
+        "--levels",
+        type=int,
+        default=MLFQ_LEVELS,
+        help="MLFQ levels; level i gets quantum * 2**i",
+    )
+    run_parser.add_argument(
+        "--level-quanta",
+        help="Comma-separated MLFQ quanta, top level first; overrides --levels",
+    )
+    run_parser.add_argument(
+        "--boost",
+        type=int,
+        default=MLFQ_BOOST,
+        help="Period of the MLFQ priority boost; 0 turns it off",
+    )
+    run_parser.add_argument(
+        "--input-format",
+        choices=["csv", "json"],
+        help="Input format; guessed from the extension or content by default",
+    )
+    run_parser.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    run_parser.add_argument(
+        "-o", "--output", help="Metrics output file (default stdout)"
+    )
+    run_parser.add_argument(
+        "--schedules",
+        action="store_true",
+        help="Include every schedule segment in the JSON output",
+    )
+    run_parser.add_argument(
+        "--schedule-output", help="Also write all schedule segments to this CSV file"
+    )
+    run_parser.add_argument(
+        "-c", "--cores", type=int, default=1, help="CPU cores to simulate"
+    )
+    run_parser.add_argument(
+        "--queues",
+        choices=QUEUE_MODES,
+        default=GLOBAL_QUEUE,
+        help="One ready queue for all cores, or one per core with work stealing",
+    )
+    run_parser.add_argument(
+        "--quiet", action="store_true", help="Don't report import speed on stderr"
+    )
+    run_parser.set_defaults(handler=run_command)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="Monte Carlo sweep over replicas of a workload config"
+    )
+    sweep_parser.add_argument(
+        "config", help='Workload config file in the "Load From File" format'
+    )
+    sweep_parser.add_argument("-n", "--replicas", type=int, default=1000)
+    sweep_parser.add_argument("-s", "--seed", type=int, default=0)
+    sweep_parser.add_argument(
+        "-a",
+        "--algorithm",
+        action="append",
+        choices=ALGORITHMS,
+        help="Algorithm to run (repeatable); defaults to all of them",
+    )
+    sweep_parser.add_argument("-q", "--quantum", type=int, default=2)
+    sweep_parser.add_argument(
+        "-w", "--workers", type=int, help="Worker processes (default: CPU count)"
+    )
+    sweep_parser.add_argument("-f", "--format", choices=["json", "csv"], default="json")
+    sweep_parser.add_argument("-o", "--output", help="Output file (default stdout)")
+    sweep_parser.add_argument(
+        "--quiet", action="store_true", help="Don't report progress on stderr"
+    )
+    sweep_parser.set_defaults(handler=sweep_command)
+
+    history_parser = subparsers.add_parser(
+        "history", help="Query runs recorded by the GUI"
+    )
+    history_parser.add_argument(
+        "--db", default=DEFAULT_HISTORY, help="Run history database"
+    )
+    history_subparsers = history_parser.add_subparsers(
+        dest="history_command", required=True
+    )
+    list_parser = history_subparsers.add_parser("list", help="List runs, newest first")
+    list_parser.add_argument("-a", "--algorithm", choices=ALGORITHMS)
+    list_parser.add_argument("--workload", help="Workload hash or a prefix of one")
+    list_parser.add_argument("--since", help="ISO date or date and time")
+    list_parser.add_argument("--until", help="ISO date or date and time")
+    list_parser.add_argument("-n", "--limit", type=int, default=100)
+    list_parser.add_argument("-f", "--format", choices=["json", "csv"], default="csv")
+    list_parser.set_defaults(handler=history_list_command)
+    show_parser = history_subparsers.add_parser(
+        "show", help="Print the metrics of one run"
+    )
+    show_parser.add_argument("run_id", type=int)
+    show_parser.add_argument(
+        "--schedule-output", help="Also write the run's schedule to this CSV file"
+    )
+    show_parser.set_defaults(handler=history_show_command)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        args.handler(args)
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+
+from logic.multicore import GLOBAL_QUEUE
+from logic.scheduler import DEADLINE_ALGORITHMS, QUANTUM_ALGORITHMS, Scheduler
+from logic.workload import Workload
+
+ALGORITHMS = ["FCFS", "SRTF", "Priority", "Round Robin", "EDF", "RMS", "MLFQ"]
+
+# Below this many processes a worker pool costs more than it saves
+PARALLEL_THRESHOLD = 5000
+
+
+def run_algorithm(
+    table,
+    algorithm,
+    quantum=None,
+    cache=None,
+    cores=1,
+    queues=GLOBAL_QUEUE,
+    mlfq=None,
+):
+    """Run one algorithm and return its result dict.
+
+    Defined at module level so worker processes can unpickle it.
+    """
+    scheduler = Scheduler(
+        table, algorithm, quantum, cache=cache, cores=cores, queues=queues, mlfq=mlfq
+    )
+    schedule, avg_waiting_time, avg_turnaround_time = scheduler.run_table()
+    return {
+        "algorithm": algorithm,
+        "quantum": quantum,
+        "cores": cores,
+        "queues": queues,
+        "mlfq": mlfq,
+        "schedule": schedule,
+        "avg_waiting_time": avg_waiting_time,
+        "avg_turnaround_time": avg_turnaround_time,
+        "metrics": scheduler.metrics,
+        "cached": scheduler.cache_hit,
+    }
+
+
+def available_algorithms(processes, algorithms=ALGORITHMS, cores=1):
+    """The algorithms that can run on processes: EDF and RMS need deadlines,
+    and MLFQ runs on a single core only."""
+    if processes.deadline is None:
+        algorithms = [a for a in algorithms if a not in DEADLINE_ALGORITHMS]
+    if cores > 1:
+        algorithms = [a for a in algorithms if a != "MLFQ"]
+    return list(algorithms)
+
+
+def _run_in_worker(table, algorithm, quantum, cores, queues, mlfq):
+    result = run_algorithm(
+        table, algorithm, quantum, cores=cores, queues=queues, mlfq=mlfq
+    )
+    # The parent already has the process table; don't pickle it back
+    result["schedule"].processes = None
+    return result
+
+
+def _store(cache, table, quantum, result):
+    if cache is not None:
+        cache.put(
+            table,
+            result["algorithm"],
+            quantum,
+            False,
+            result["schedule"],
+            result["metrics"],
+            result["cores"],
+            result["queues"],
+            result["mlfq"],
+        )
+
+
+def compare_algorithms(
+    processes,
+    algorithms=None,
+    quantum=2,
+    workers=None,
+    cancel_event=None,
+    cache=None,
+    cores=1,
+    queues=GLOBAL_QUEUE,
+    mlfq=None,
+):
+    """Run several algorithms on one process set, yielding results as they finish.
+
+    Large process sets run one algorithm per worker process. Setting
+    cancel_event stops the comparison and terminates any running workers.
+    Results found in cache are yielded first without running anything.
+    cores and queues describe the simulated machine and mlfq holds the MLFQ
+    settings, as for Scheduler. algorithms defaults to every algorithm the
+    process set and machine support.
+    """
+    # Validated and sorted once, then shared by every algorithm
+    table = Workload.of(processes)
+    if algorithms is None:
+        algorithms = available_algorithms(table, cores=cores)
+
+    def quantum_for(algorithm):
+        return quantum if algorithm in QUANTUM_ALGORITHMS else None
+
+    if cache is not None:
+        remaining = []
+        for algorithm in algorithms:
+            cached = cache.get(
+                table, algorithm, quantum_for(algorithm), False, cores, queues, mlfq
+            )
+            if cached is None:
+                remaining.append(algorithm)
+                continue
+            schedule, metrics = cached
+            yield {
+                "algorithm": algorithm,
+                "quantum": quantum_for(algorithm),
+                "cores": cores,
+                "queues": queues,
+                "mlfq": mlfq,
+                "schedule": schedule,
+                "avg_waiting_time": metrics["waiting"]["mean"],
+                "avg_turnaround_time": metrics["turnaround"]["mean"],
+                "metrics": metrics,
+                "cached": True,
+            }
+        algorithms = remaining
+
+    if len(table) < PARALLEL_THRESHOLD or len(algorithms) < 2:
+        for algorithm in algorithms:
+            if cancel_event is not None and cancel_event.is_set():
+                return
+            result = run_algorithm(
+                table,
+                algorithm,
+                quantum_for(algorithm),
+                cores=cores,
+                queues=queues,
+                mlfq=mlfq,
+            )
+            _store(cache, table, quantum_for(algorithm), result)
+            yield result
+        return
+
+    if workers is None:
+        workers = min(len(algorithms), os.cpu_count() or 1)
+    # Spawn rather than fork: the parent may be running Qt threads
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers) as pool:
+        pending = [
+            pool.apply_async(
+                _run_in_worker,
+                (table, algorithm, quantum_for(algorithm), cores, queues, mlfq),
+            )
+            for algorithm in algorithms
+        ]
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                # Leaving the with-block terminates the pool
+                return
+            done = [async_result for async_result in pending if async_result.ready()]
+            if not done:
+                pending[0].wait(0.05)
+                continue
+            for async_result in done:
+                pending.remove(async_result)
+                result = async_result.get()
+                result["schedule"].processes = table
+                _store(cache, table, quantum_for(result["algorithm"]), result)
+                yield result
@@ -0,0 +1,350 @@
+import heapq
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from logic.metrics import compute_metrics
+from logic.process_table import ProcessTable, ScheduleTable
+
+INCREMENTAL_ALGORITHMS = ("FCFS", "Priority")
+
+# At most about this many engine state checkpoints are kept per schedule
+MAX_CHECKPOINTS = 64
+MIN_CHECKPOINT_INTERVAL = 32
+
+
+class IncrementalScheduler:
+    """FCFS or non-preemptive Priority schedule that is patched after edits.
+
+    Both algorithms dispatch whole processes from a ready heap, so editing,
+    inserting or deleting one process cannot change any dispatch made before
+    that process could have been in the heap. The engine state (time,
+    arrival cursor, heap) is saved every few dispatches. An edit replays
+    from the last checkpoint before the process could be seen. As soon as
+    the replay reaches a state that matches an old checkpoint, the rest of
+    the old schedule is reused. FCFS always runs in arrival order, so its
+    suffix is recomputed in closed form instead, which stays fast even when
+    the change ripples through a long busy period.
+
+    The instance keeps its own copy of the process table; pid i is row i.
+    """
+
+    def __init__(self, processes, algorithm):
+        if algorithm not in INCREMENTAL_ALGORITHMS:
+            raise ValueError(f"{algorithm} can't be rescheduled incrementally")
+        if algorithm == "Priority" and processes.priority is None:
+            raise ValueError("Priority scheduling needs a priority for every process")
+        self.algorithm = algorithm
+        self.table = ProcessTable(
+            processes.arrival.copy(),
+            processes.burst.copy(),
+            priority=None if processes.priority is None else processes.priority.copy(),
+            deadline=None if processes.deadline is None else processes.deadline.copy(),
+            names=None if processes.names is None else list(processes.names),
+        )
+        self.interval = max(MIN_CHECKPOINT_INTERVAL, len(self.table) // MAX_CHECKPOINTS)
+        self._index()
+        self.schedule = None
+        if algorithm == "FCFS":
+            self._fcfs_suffix(0, 0)
+        else:
+            pids, starts, finishes, self.checkpoints, _ = self._dispatch(0, 0, 0, [])
+            self._set_schedule(pids, starts, finishes)
+
+    def update(self, pid, arrival=None, burst=None, priority=None):
+        """Change one process; returns the (first, end) range of changed rows."""
+        table = self.table
+        old_position = new_position = int(self.position[pid])
+        # Dispatch decisions before this process's own run don't depend on
+        # its burst, so a burst-only edit can replay from that run
+        dispatched = None
+        if (arrival is None or arrival == table.arrival[pid]) and (
+            priority is None or not self.keys_used or priority == table.priority[pid]
+        ):
+            arrival = None
+            dispatched = int(np.flatnonzero(self.schedule.pid == pid)[0])
+        if arrival is not None:
+            table.arrival[pid] = arrival
+            # Move the process to its new place in the arrival order
+            del self.order[old_position], self.arrivals[old_position]
+            new_position = self._sorted_position(table.arrival[pid].item(), pid)
+            self.order.insert(new_position, pid)
+            self.arrivals.insert(new_position, table.arrival[pid].item())
+            low, high = sorted((old_position, new_position))
+            self.position[self.order[low : high + 1]] = np.arange(low, high + 1)
+        if burst is not None:
+            table.burst[pid] = burst
+            self.burst[pid] = table.burst[pid].item()
+        if priority is not None and table.priority is not None:
+            table.priority[pid] = priority
+            if self.algorithm == "Priority":
+                self.keys[pid] = table.priority[pid].item()
+        return self._reschedule(
+            low=min(old_position, new_position),
+            old_high=max(old_position, new_position),
+            delta=0,
+            remap_pid=None,
+            dispatched=dispatched,
+        )
+
+    def insert(self, pid, arrival, burst, priority=None, name=None):
+        """Insert a process as row pid; returns the changed row range."""
+        table = self.table
+        if table.priority is not None and priority is None:
+            raise ValueError("Priority scheduling needs a priority for every process")
+        table.arrival = np.insert(table.arrival, pid, arrival)
+        table.burst = np.insert(table.burst, pid, burst)
+        if table.priority is not None:
+            table.priority = np.insert(table.priority, pid, priority)
+        if table.deadline is not None:
+            # Deadlines don't affect these algorithms; keep the column aligned
+            table.deadline = np.insert(table.deadline, pid, arrival + burst)
+        if table.names is not None:
+            table.names.insert(pid, name if name is not None else f"P{pid + 1}")
+
+        # Later rows move down by one; the new row goes in by arrival
+        order = np.asarray(self.order, dtype=np.int64)
+        order += order >= pid
+        self.order = order.tolist()
+        new_position = self._sorted_position(table.arrival[pid].item(), pid)
+        self.order.insert(new_position, pid)
+        self.arrivals.insert(new_position, table.arrival[pid].item())
+        self.burst.insert(pid, table.burst[pid].item())
+        self.keys.insert(pid, table.priority[pid].item() if self.keys_used else 0)
+        self._index_positions()
+        return self._reschedule(
+            low=new_position,
+            old_high=new_position - 1,
+            delta=1,
+            remap_pid=lambda pids: pids + (pids >= pid),
+        )
+
+    def delete(self, pid):
+        """Remove process pid; returns the changed row range."""
+        old_position = int(self.position[pid])
+        table = self.table
+        table.arrival = np.delete(table.arrival, pid)
+        table.burst = np.delete(table.burst, pid)
+        if table.priority is not None:
+            table.priority = np.delete(table.priority, pid)
+        if table.deadline is not None:
+            table.deadline = np.delete(table.deadline, pid)
+        if table.names is not None:
+            del table.names[pid]
+
+        del self.arrivals[old_position], self.burst[pid], self.keys[pid]
+        order = np.delete(np.asarray(self.order, dtype=np.int64), old_position)
+        order -= order > pid
+        self.order = order.tolist()
+        self._index_positions()
+        return self._reschedule(
+            low=old_position,
+            old_high=old_position,
+            delta=-1,
+            remap_pid=lambda pids: pids - (pids > pid),
+        )
+
+    @property
+    def keys_used(self):
+        return self.algorithm == "Priority"
+
+    @property
+    def metrics(self):
+        """compute_metrics() of the current schedule, computed on first use."""
+        if self._metrics is None:
+            self._metrics = compute_metrics(self.schedule)
+        return self._metrics
+
+    def average_times(self):
+        """Average waiting and turnaround time without the full metrics."""
+        # Each process is one segment, so these are plain column sums
+        if len(self.schedule) == 0:
+            return 0.0, 0.0
+        arrival = self.table.arrival[self.schedule.pid]
+        turnaround = float((self.schedule.finish - arrival).mean())
+        return turnaround - float(self.table.burst.mean()), turnaround
+
+    def _index(self):
+        """Lookup lists for the engine loop, kept up to date by every edit."""
+        table = self.table
+        order = table.arrival_order()
+        self.order = order.tolist()
+        self.arrivals = table.arrival[order].tolist()
+        self.burst = table.burst.tolist()
+        if self.keys_used:
+            self.keys = table.priority.tolist()
+        else:
+            self.keys = [0] * len(order)
+        self._index_positions()
+
+    def _index_positions(self):
+        self.position = np.empty(len(self.order), dtype=np.int64)
+        self.position[self.order] = np.arange(len(self.order))
+
+    def _sorted_position(self, arrival, pid):
+        """Where (arrival, pid) belongs in the stable arrival order."""
+        low = bisect_left(self.arrivals, arrival)
+        high = bisect_right(self.arrivals, arrival, low)
+        # Equal arrivals stay in pid order
+        return bisect_left(self.order, pid, low, high)
+
+    def _dispatch(self, dispatch, current_time, next_arrival, ready, old=None):
+        """Run the engine from a saved state.
+
+        old, when given, is (checkpoints, low, old_high, delta) of the previous
+        schedule. The replay stops at the first old checkpoint whose state
+        matches, and (old dispatch index, time offset) to resume from is
+        returned last.
+        """
+        order, arrivals, burst, keys = self.order, self.arrivals, self.burst, self.keys
+        n = len(order)
+        pids, starts, finishes = [], [], []
+        checkpoints = {dispatch: (current_time, next_arrival, list(ready))}
+        next_checkpoint = dispatch + self.interval
+        while next_arrival < n or ready:
+            if old is not None and dispatch - old[3] in old[0]:
+                if self._matches(current_time, next_arrival, ready, old, dispatch):
+                    index = dispatch - old[3]
+                    return (
+                        pids,
+                        starts,
+                        finishes,
+                        checkpoints,
+                        (index, current_time - old[0][index][0]),
+                    )
+            if dispatch == next_checkpoint:
+                checkpoints[dispatch] = (current_time, next_arrival, list(ready))
+                next_checkpoint += self.interval
+            # CPU idle: jump straight to the next arrival
+            if not ready:
+                current_time = max(current_time, arrivals[next_arrival])
+            while next_arrival < n and arrivals[next_arrival] <= current_time:
+                heapq.heappush(ready, (keys[order[next_arrival]], next_arrival))
+                next_arrival += 1
+            _, position = heapq.heappop(ready)
+            pid = order[position]
+            finish = current_time + burst[pid]
+            pids.append(pid)
+            starts.append(current_time)
+            finishes.append(finish)
+            current_time = finish
+            dispatch += 1
+        return pids, starts, finishes, checkpoints, None
+
+    def _matches(self, current_time, next_arrival, ready, old, dispatch):
+        """Whether the replay state equals an old checkpoint past the edit."""
+        checkpoints, low, old_high, delta = old
+        old_time, old_next, old_ready = checkpoints[dispatch - delta]
+        if (
+            old_next + delta != next_arrival
+            or old_next <= old_high
+            or len(old_ready) != len(ready)
+        ):
+            return False
+        # Pending arrivals are admitted by time, so the clocks must agree;
+        # once everything has arrived the order only depends on the heap
+        if old_time != current_time and next_arrival != len(self.order):
+            return False
+        # The edited rows must all have run, and the rest shift by delta
+        if any(low <= position <= old_high for _, position in old_ready):
+            return False
+        # A position's key can only have changed inside the edited range
+        return {position for _, position in ready} == {
+            position + delta if position >= low else position
+            for _, position in old_ready
+        }
+
+    def _reschedule(self, low, old_high, delta, remap_pid, dispatched=None):
+        """Replay from the last checkpoint that never looked at positions >= low.
+
+        A checkpoint whose arrival cursor is at low may have stopped admitting
+        because of the arrival now at low, so the cursor must be below it.
+        The first checkpoint is always safe. When only a burst changed,
+        dispatched is the process's old dispatch index and any checkpoint up
+        to it is safe.
+        """
+        if self.algorithm == "FCFS":
+            return self._fcfs_suffix(low, delta)
+        old_checkpoints = self.checkpoints
+        indexes = sorted(old_checkpoints)
+        if dispatched is not None:
+            restore = indexes[bisect_right(indexes, dispatched) - 1]
+        else:
+            # Arrival cursors never decrease along the schedule
+            cursors = [old_checkpoints[index][1] for index in indexes]
+            restore = indexes[max(0, bisect_left(cursors, low) - 1)]
+        current_time, next_arrival, ready = old_checkpoints[restore]
+
+        old = self.schedule
+        old_pid = old.pid if remap_pid is None else remap_pid(old.pid)
+        pids, starts, finishes, checkpoints, resume = self._dispatch(
+            restore,
+            current_time,
+            next_arrival,
+            list(ready),
+            old=(old_checkpoints, low, old_high, delta),
+        )
+        resume, offset = resume if resume is not None else (len(old_pid), 0)
+
+        # Keep the checkpoints before the replay and shift the reused ones
+        for index in indexes:
+            if index < restore:
+                checkpoints[index] = old_checkpoints[index]
+            elif index >= resume:
+                old_time, old_next, old_ready = old_checkpoints[index]
+                checkpoints[index + delta] = (
+                    old_time + offset,
+                    old_next + delta,
+                    # Heaps are never modified in place, so edits can share them
+                    (
+                        old_ready
+                        if delta == 0
+                        else [
+                            (key, position + delta if position >= low else position)
+                            for key, position in old_ready
+                        ]
+                    ),
+                )
+        self.checkpoints = checkpoints
+
+        # The edited process is never in the reused prefix or suffix
+        self._set_schedule(
+            np.concatenate([old_pid[:restore], pids, old_pid[resume:]]),
+            np.concatenate([old.start[:restore], starts, old.start[resume:] + offset]),
+            np.concatenate(
+                [old.finish[:restore], finishes, old.finish[resume:] + offset]
+            ),
+        )
+        end = restore + len(pids) if offset == 0 else len(self.schedule)
+        return restore, end
+
+    def _fcfs_suffix(self, low, delta):
+        """Recompute FCFS from arrival position low onwards in closed form."""
+        order = np.asarray(self.order, dtype=np.int64)
+        old = self.schedule
+        # Positions before low keep their old times
+        ready_time = old.finish[low - 1] if low > 0 else 0
+        arrival = self.table.arrival[order[low:]]
+        burst = self.table.burst[order[low:]]
+        queued = np.cumsum(burst) - burst
+        start = queued + np.maximum(np.maximum.accumulate(arrival - queued), ready_time)
+        finish = start + burst
+
+        end = len(order)
+        if old is not None:
+            if delta == 0:
+                # An idle gap usually absorbs the change; rows after it match
+                changed = np.flatnonzero(
+                    (order[low:] != old.pid[low:])
+                    | (start != old.start[low:])
+                    | (finish != old.finish[low:])
+                )
+                end = low + int(changed[-1]) + 1 if len(changed) else low
+            start = np.concatenate([old.start[:low], start])
+            finish = np.concatenate([old.finish[:low], finish])
+        self._set_schedule(order, start, finish)
+        return low, end
+
+    def _set_schedule(self, pids, starts, finishes):
+        self.schedule = ScheduleTable(pids, starts, finishes, self.table)
+        self._metrics = None
@@ -0,0 +1,196 @@
+import numpy as np
+
+# Summary statistics reported for every per-process metric
+PERCENTILES = (50, 95, 99)
+PER_PROCESS_METRICS = ("waiting", "turnaround", "response", "slowdown")
+
+# Segments per pass of compute_metrics(), bounding its temporary arrays
+METRICS_CHUNK = 1 << 20
+
+
+def summarize(values):
+    """Mean, percentiles and max of a 1-D array as plain floats."""
+    if len(values) == 0:
+        summary = {"mean": 0.0, "max": 0.0}
+        summary.update({f"p{q}": 0.0 for q in PERCENTILES})
+        return summary
+    summary = {"mean": float(values.mean()), "max": float(values.max())}
+    for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        summary[f"p{q}"] = float(value)
+    return summary
+
+
+def compute_metrics(schedule):
+    """Per-process and summary metrics for a ScheduleTable.
+
+    Per-process arrays cover only processes that appear in the schedule and
+    are aligned with the "pid" array.
+    """
+    accumulator = MetricsAccumulator(schedule.processes, schedule.cores)
+    # In chunks, so e.g. a memory-mapped schedule is never copied whole
+    for chunk in schedule.chunks(METRICS_CHUNK):
+        accumulator.add(chunk)
+    return accumulator.result()
+
+
+class MetricsAccumulator:
+    """Builds compute_metrics() output from a schedule fed in chunks.
+
+    State is a few arrays with one entry per process, so memory does not
+    grow with the number of segments. Chunks must arrive in schedule order;
+    on several cores that only has to hold per core and per process.
+    """
+
+    def __init__(self, processes, cores=1):
+        self.processes = processes
+        self.cores = cores
+        n = len(processes)
+        time_type = np.result_type(processes.arrival, processes.burst)
+        # Completion is the last finish and response the first start per
+        # process. Filling with the dtype's extremes keeps the unbuffered
+        # ufunc.at calls on their fast path.
+        if np.issubdtype(time_type, np.integer):
+            lowest, highest = np.iinfo(time_type).min, np.iinfo(time_type).max
+        else:
+            lowest, highest = -np.inf, np.inf
+        self.completion = np.full(n, lowest, dtype=time_type)
+        self.first_start = np.full(n, highest, dtype=time_type)
+        self.segment_count = np.zeros(n, dtype=np.int64)
+        self.busy = 0.0
+        self.min_start = None
+        self.max_finish = None
+        self.last_pid = None
+        self.context_switches = 0
+        if cores > 1:
+            self.core_busy = np.zeros(cores)
+            # -1 until a core has run something / a process has run
+            self.core_last_pid = np.full(cores, -1, dtype=np.int64)
+            self.last_cpu = np.full(n, -1, dtype=np.int64)
+            self.migrations = 0
+
+    def add(self, chunk):
+        if len(chunk) == 0:
+            return
+        pid, start, finish = chunk.pid, chunk.start, chunk.finish
+        self.segment_count += np.bincount(pid, minlength=len(self.segment_count))
+        np.maximum.at(self.completion, pid, finish)
+        np.minimum.at(self.first_start, pid, start)
+        self.busy += float((finish - start).sum())
+
+        chunk_min, chunk_max = start.min(), finish.max()
+        if self.min_start is None:
+            self.min_start, self.max_finish = chunk_min, chunk_max
+        else:
+            self.min_start = min(self.min_start, chunk_min)
+            self.max_finish = max(self.max_finish, chunk_max)
+
+        if self.cores > 1:
+            self._add_cores(chunk)
+            return
+        switches = int(np.count_nonzero(pid[1:] != pid[:-1]))
+        if self.last_pid is not None and pid[0] != self.last_pid:
+            switches += 1
+        self.context_switches += switches
+        self.last_pid = pid[-1]
+
+    def _add_cores(self, chunk):
+        """Per-core busy time, context switches and migrations of a chunk."""
+        pid, cpu = chunk.pid, chunk.cpu
+        self.core_busy += np.bincount(
+            cpu, weights=chunk.finish - chunk.start, minlength=self.cores
+        )
+        # A context switch is a core running a different process than the
+        # one before; a migration is a process resuming on another core
+        self.context_switches += _changes(cpu, pid, self.core_last_pid)
+        self.migrations += _changes(pid, cpu, self.last_cpu)
+
+    def result(self):
+        table = self.processes
+        scheduled = np.flatnonzero(self.segment_count)
+        arrival = table.arrival[scheduled]
+        burst = table.burst[scheduled]
+        turnaround = self.completion[scheduled] - arrival
+        waiting = turnaround - burst
+        response = self.first_start[scheduled] - arrival
+        slowdown = np.divide(
+            turnaround,
+            burst,
+            out=np.ones(len(scheduled)),
+            where=burst > 0,
+        )
+
+        if self.max_finish is not None:
+            span = float(self.max_finish - min(self.min_start, table.arrival.min()))
+        else:
+            span = 0.0
+
+        metrics = {
+            "per_process": {
+                "pid": scheduled,
+                "waiting": waiting,
+                "turnaround": turnaround,
+                "response": response,
+                "slowdown": slowdown,
+            },
+            "completed": len(scheduled),
+            "makespan": span,
+            "cpu_utilisation": self.busy / span if span > 0 else 0.0,
+            "throughput": len(scheduled) / span if span > 0 else 0.0,
+            "context_switches": self.context_switches,
+        }
+        if self.cores > 1:
+            metrics["cores"] = self.cores
+            metrics["cpu_utilisation"] /= self.cores
+            metrics["core_utilisation"] = (
+                (self.core_busy / span).tolist() if span > 0 else [0.0] * self.cores
+            )
+            metrics["migrations"] = self.migrations
+        for key in PER_PROCESS_METRICS:
+            metrics[key] = summarize(metrics["per_process"][key])
+        if table.deadline is not None:
+            # Positive lateness is a missed deadline; negative is slack
+            lateness = self.completion[scheduled] - table.deadline[scheduled]
+            misses = int(np.count_nonzero(lateness > 0))
+            metrics["per_process"]["lateness"] = lateness
+            metrics["lateness"] = summarize(lateness)
+            metrics["deadline_misses"] = misses
+            metrics["deadline_miss_rate"] = (
+                misses / len(scheduled) if len(scheduled) else 0.0
+            )
+        return metrics
+
+
+def _changes(group, value, last):
+    """Count value changes between consecutive entries of each group.
+
+    last[g] holds the value group g ended on in earlier chunks (-1 for
+    none) and is updated in place.
+    """
+    order = np.argsort(group, kind="stable")
+    group, value = group[order], value[order]
+    same_group = group[1:] == group[:-1]
+    changes = int(np.count_nonzero(same_group & (value[1:] != value[:-1])))
+    first = np.concatenate([[True], ~same_group])
+    previous = last[group[first]]
+    changes += int(np.count_nonzero((previous >= 0) & (previous != value[first])))
+    last_of_group = np.concatenate([~same_group, [True]])
+    last[group[last_of_group]] = value[last_of_group]
+    return changes
+
+
+def summary_fields(metrics):
+    """Flatten the summary metrics into one level, e.g. "waiting_p95"."""
+    fields = {}
+    for key, value in metrics.items():
+        if key == "per_process":
+            continue
+        if isinstance(value, dict):
+            for stat, stat_value in value.items():
+                fields[f"{key}_{stat}"] = stat_value
+        elif isinstance(value, list):
+            # Per-core values, e.g. "core_utilisation_0"
+            for index, item in enumerate(value):
+                fields[f"{key}_{index}"] = item
+        else:
+            fields[key] = value
+    return fields
@@ -0,0 +1,278 @@
+import heapq
+
+import numpy as np
+
+from logic.process_table import ScheduleTable
+
+# Where ready processes wait on a multi-CPU machine
+GLOBAL_QUEUE = "global"  # One queue shared by every core
+PER_CORE_QUEUES = "per-core"  # A queue per core; idle cores steal work
+QUEUE_MODES = (GLOBAL_QUEUE, PER_CORE_QUEUES)
+
+MULTICORE_ALGORITHMS = ("FCFS", "SRTF", "Priority", "Round Robin", "EDF", "RMS")
+
+
+class MultiCoreEngine:
+    """Runs FCFS, SRTF, Priority, Round Robin, EDF or RMS on several cores.
+
+    The simulation advances over a single heap of core events (a running
+    process finishing or using up its quantum) merged with the arrival
+    cursor, so the cost grows with the number of events, not with cores
+    times simulated time.
+
+    With GLOBAL_QUEUE every core takes the best ready process from one
+    shared queue. With PER_CORE_QUEUES arrivals go to an idle core if
+    there is one, otherwise to the cores in turn, and a preempted process
+    returns to the queue of the core it ran on; a core whose own queue is
+    empty steals the next process of the nearest core that has one. SRTF,
+    EDF and RMS preempt the running process with the largest key (remaining
+    time, deadline or relative deadline), globally or on the core that
+    received the arrival; the other algorithms only switch when a process
+    finishes or its quantum ends.
+    """
+
+    def __init__(self, scheduler, cores, queues=GLOBAL_QUEUE):
+        if cores < 1:
+            raise ValueError("A machine needs at least one core")
+        if queues not in QUEUE_MODES:
+            raise ValueError(f"Unknown queue mode: {queues}")
+        self.scheduler = scheduler
+        self.table = scheduler.table
+        self.algorithm = scheduler.algorithm
+        self.quantum = scheduler.quantum
+        self.cores = cores
+        self.queues = queues
+        self.steals = 0
+
+    def chunks(self):
+        """Yield the schedule as ScheduleTable chunks with a cpu column.
+
+        Segments come out in the order they end, so each core's and each
+        process's segments are in time order, but the chunk as a whole is
+        not sorted by start.
+        """
+        scheduler = self.scheduler
+        table = self.table
+        algorithm = self.algorithm
+        cores = self.cores
+        order, arrivals = table.order_list, table.arrival_list
+        count = len(order)
+        # Everything below is indexed by arrival position, not process ID
+        remaining = list(table.sorted_burst_list)
+        if algorithm == "Priority":
+            priority = table.priority_list
+            priorities = [priority[pid] for pid in order]
+        if algorithm == "EDF":
+            deadlines = table.sorted_deadline_list
+        elif algorithm == "RMS":
+            deadlines = [d - a for d, a in zip(table.sorted_deadline_list, arrivals)]
+        preemptive = algorithm in ("SRTF", "EDF", "RMS")
+        quantum = self.quantum if algorithm == "Round Robin" else None
+        if quantum is not None and quantum < 1:
+            raise ValueError("Quantum must be at least 1")
+        shared = self.queues == GLOBAL_QUEUE
+        # Ready heaps of (key, arrival position); one shared or one per core
+        ready = [[] for _ in range(1 if shared else cores)]
+        enqueued = 0  # Round Robin key: first in, first out
+
+        def key(position):
+            nonlocal enqueued
+            if algorithm == "SRTF":
+                return remaining[position]
+            if algorithm == "Priority":
+                return priorities[position]
+            if algorithm in ("EDF", "RMS"):
+                return deadlines[position]
+            if quantum is not None:
+                enqueued += 1
+                return enqueued
+            return position
+
+        running = [None] * cores  # Arrival position on each core, or None
+        started = [0] * cores
+        ends = [0] * cores
+        # A core's pending event is stale once its token has moved on
+        tokens = [0] * cores
+        events_heap = []  # (time, core, token)
+        # Preemptive algorithms with a global queue: running processes by
+        # largest key first, as (-key, -position, core, token), where SRTF
+        # uses the end time; stale entries are skipped lazily
+        latest = []
+        idle = list(range(cores))  # Min-heap of idle cores
+        next_core = 0  # Per-core placement when no core is idle
+
+        pids, starts, finishes, cpus = [], [], [], []
+
+        def start(core, position, now):
+            running[core] = position
+            started[core] = now
+            run = remaining[position]
+            if quantum is not None:
+                run = min(quantum, run)
+            ends[core] = now + run
+            tokens[core] += 1
+            heapq.heappush(events_heap, (ends[core], core, tokens[core]))
+            if preemptive and shared:
+                worst = ends[core] if algorithm == "SRTF" else deadlines[position]
+                heapq.heappush(latest, (-worst, -position, core, tokens[core]))
+
+        def stop(core, now):
+            """Take the process off the core; return it if it isn't done."""
+            position = running[core]
+            ran = now - started[core]
+            remaining[position] -= ran
+            if ran > 0 or remaining[position] == 0:
+                pids.append(order[position])
+                starts.append(started[core])
+                finishes.append(now)
+                cpus.append(core)
+            running[core] = None
+            tokens[core] += 1
+            return position if remaining[position] > 0 else None
+
+        def next_for(core):
+            """Pop the best ready process for a core, stealing if needed."""
+            if shared:
+                queue = ready[0]
+            else:
+                queue = ready[core]
+                if not queue:
+                    # Nearest core (in index order) with waiting work
+                    for offset in range(1, cores):
+                        victim = ready[(core + offset) % cores]
+                        if victim:
+                            queue = victim
+                            self.steals += 1
+                            break
+            if not queue:
+                return None
+            return heapq.heappop(queue)[1]
+
+        def dispatch(core, now):
+            position = next_for(core)
+            if position is None:
+                heapq.heappush(idle, core)
+            else:
+                start(core, position, now)
+
+        def preempt_if_better(core, queue, now):
+            """Swap the process on core for the head of queue if its key is
+            smaller."""
+            position = running[core]
+            if position is None or not queue:
+                return False
+            if algorithm == "SRTF":
+                running_key = ends[core] - now
+            else:
+                running_key = deadlines[position]
+            if queue[0] >= (running_key, position):
+                return False
+            requeue = stop(core, now)
+            heapq.heappush(queue, (key(requeue), requeue))
+            start(core, heapq.heappop(queue)[1], now)
+            return True
+
+        next_arrival = 0
+        now = 0
+        events = 0
+        next_checkpoint = scheduler._first_checkpoint()
+        while next_arrival < count or events_heap:
+            events += 1
+            if events == next_checkpoint:
+                next_checkpoint = scheduler._checkpoint(events, now)
+                if scheduler.streaming and pids:
+                    yield ScheduleTable(
+                        pids, starts, finishes, table, cpu=cpus, cores=cores
+                    )
+                    pids, starts, finishes, cpus = [], [], [], []
+
+            if next_arrival < count and (
+                not events_heap or arrivals[next_arrival] <= events_heap[0][0]
+            ):
+                now = arrivals[next_arrival]
+                # Cores whose slice ends at this instant are free before any
+                # running process is preempted for the arrivals
+                ended = []
+                while events_heap and events_heap[0][0] <= now:
+                    _, core, token = heapq.heappop(events_heap)
+                    if token == tokens[core]:
+                        ended.append((core, stop(core, now)))
+                        heapq.heappush(idle, core)
+                # Admit every arrival at this instant before anyone picks
+                woken = []
+                while next_arrival < count and arrivals[next_arrival] <= now:
+                    position = next_arrival
+                    next_arrival += 1
+                    entry = (key(position), position)
+                    if shared:
+                        heapq.heappush(ready[0], entry)
+                        continue
+                    if idle:
+                        core = heapq.heappop(idle)
+                        woken.append(core)
+                    else:
+                        core = next_core
+                        next_core = (next_core + 1) % cores
+                    heapq.heappush(ready[core], entry)
+                    if preemptive and core not in woken:
+                        woken.append(core)
+                # As on one core, arrivals queue ahead of the slices that
+                # just ended
+                for core, requeue in ended:
+                    if requeue is not None:
+                        entry = (key(requeue), requeue)
+                        heapq.heappush(ready[0 if shared else core], entry)
+                if shared:
+                    while idle and ready[0]:
+                        start(heapq.heappop(idle), heapq.heappop(ready[0])[1], now)
+                    while preemptive and ready[0] and latest:
+                        _, _, core, token = latest[0]
+                        if token != tokens[core]:
+                            heapq.heappop(latest)
+                            continue
+                        if not preempt_if_better(core, ready[0], now):
+                            break
+                else:
+                    for core, _ in ended:
+                        if core in idle:
+                            # No arrival placed here; take own or stolen work
+                            idle.remove(core)
+                            heapq.heapify(idle)
+                            dispatch(core, now)
+                    for core in woken:
+                        if running[core] is None:
+                            dispatch(core, now)
+                        elif preemptive:
+                            preempt_if_better(core, ready[core], now)
+                continue
+
+            time, core, token = heapq.heappop(events_heap)
+            if token != tokens[core]:
+                continue
+            now = time
+            requeue = stop(core, now)
+            if requeue is not None:
+                heapq.heappush(ready[0 if shared else core], (key(requeue), requeue))
+            dispatch(core, now)
+
+        scheduler.events_processed = events
+        if scheduler.progress is not None:
+            scheduler.progress(events, now)
+        yield ScheduleTable(pids, starts, finishes, table, cpu=cpus, cores=cores)
+
+    def run(self):
+        """The whole schedule as one ScheduleTable sorted by start time."""
+        chunks = list(self.chunks())
+        pid = np.concatenate([chunk.pid for chunk in chunks])
+        start = np.concatenate([chunk.start for chunk in chunks])
+        finish = np.concatenate([chunk.finish for chunk in chunks])
+        cpu = np.concatenate([chunk.cpu for chunk in chunks])
+        order = np.lexsort((cpu, start))
+        return ScheduleTable(
+            pid[order],
+            start[order],
+            finish[order],
+            self.table,
+            cpu=cpu[order],
+            cores=self.cores,
+        )
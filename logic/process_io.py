@@ -0,0 +1,107 @@
+import csv
+import io
+import json
+import os
+
+from logic.process_table import ProcessTable
+
+# Accepted spellings for each column, compared after normalize_column()
+COLUMN_ALIASES = {
+    "Process": ("process", "name", "pid", "id"),
+    "Arrival Time": ("arrivaltime", "arrival"),
+    "Burst Time": ("bursttime", "burst"),
+    "Priority": ("priority",),
+    "Deadline": ("deadline",),
+}
+
+
+def normalize_column(name):
+    return name.strip().lower().replace(" ", "").replace("_", "")
+
+
+def parse_number(text):
+    """Parse an int, falling back to float for values like "2.5"."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def canonical_columns(fieldnames):
+    """Map canonical column names to the names used in the file."""
+    columns = {}
+    for field in fieldnames:
+        normalized = normalize_column(field)
+        for canonical, aliases in COLUMN_ALIASES.items():
+            if normalized in aliases:
+                columns[canonical] = field
+    for required in ("Arrival Time", "Burst Time"):
+        if required not in columns:
+            raise ValueError(f"Missing required column: {required}")
+    return columns
+
+
+def _records_to_processes(records):
+    processes = []
+    columns = None
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f"Row {i + 1}: expected a JSON object")
+        if columns is None:
+            columns = canonical_columns(record.keys())
+        process = {}
+        for canonical, field in columns.items():
+            value = record.get(field)
+            if value is None or value == "":
+                continue
+            if canonical == "Process":
+                process[canonical] = str(value)
+            else:
+                try:
+                    process[canonical] = (
+                        parse_number(value) if isinstance(value, str) else value
+                    )
+                except ValueError:
+                    raise ValueError(
+                        f"Row {i + 1}: {canonical} must be a number, got {value!r}"
+                    )
+        process.setdefault("Process", f"P{i + 1}")
+        for required in ("Arrival Time", "Burst Time"):
+            if required not in process:
+                raise ValueError(f"Row {i + 1}: missing {required}")
+        processes.append(process)
+    return processes
+
+
+def detect_format(path, text=None):
+    """Guess "csv" or "json" from the file extension or the content."""
+    if path and path != "-":
+        extension = os.path.splitext(path)[1].lower()
+        if extension in (".json", ".jsonl"):
+            return "json"
+        if extension in (".csv", ".txt"):
+            return "csv"
+    if text is not None and text.lstrip()[:1] in ("[", "{"):
+        return "json"
+    return "csv"
+
+
+def read_processes(text, fmt="csv"):
+    """Parse a process set from CSV or JSON text into a ProcessTable.
+
+    JSON may be a list of process objects, an object with a "processes"
+    list, or one object per line.
+    """
+    if fmt == "json":
+        stripped = text.strip()
+        try:
+            data = json.loads(stripped) if stripped else []
+        except json.JSONDecodeError:
+            # One JSON object per line
+            data = [json.loads(line) for line in stripped.splitlines() if line.strip()]
+        if isinstance(data, dict):
+            data = data.get("processes", [])
+        records = data
+    else:
+        records = list(csv.DictReader(io.StringIO(text)))
+    return ProcessTable.from_dicts(_records_to_processes(records))
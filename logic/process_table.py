@@ -0,0 +1,179 @@
+import numpy as np
+
+
+class ProcessTable:
+    """Columnar process set. Row i holds the process with ID i."""
+
+    def __init__(self, arrival, burst, priority=None, deadline=None, names=None):
+        self.arrival = np.asarray(arrival)
+        self.burst = np.asarray(burst)
+        if self.arrival.shape != self.burst.shape or self.arrival.ndim != 1:
+            raise ValueError("Arrival and burst columns must be 1-D and equal length")
+        # Optional columns stay None when the process set doesn't define them
+        self.priority = None if priority is None else np.asarray(priority)
+        self.deadline = None if deadline is None else np.asarray(deadline)
+        self.names = names
+
+    def __len__(self):
+        return len(self.arrival)
+
+    @property
+    def pid(self):
+        return np.arange(len(self.arrival))
+
+    def name(self, pid):
+        if self.names is None:
+            return f"P{pid + 1}"
+        return self.names[pid]
+
+    def fill_missing_priority(self, value):
+        """Give every process the same priority if the column is absent."""
+        if self.priority is None:
+            self.priority = np.full(len(self), value)
+
+    @classmethod
+    def from_dicts(cls, processes):
+        """Build a table from the list-of-dicts process format used by the UI."""
+        priority = None
+        if processes and all("Priority" in p for p in processes):
+            priority = [p["Priority"] for p in processes]
+        deadline = None
+        if processes and all("Deadline" in p for p in processes):
+            deadline = [p["Deadline"] for p in processes]
+        return cls(
+            arrival=[p["Arrival Time"] for p in processes],
+            burst=[p["Burst Time"] for p in processes],
+            priority=priority,
+            deadline=deadline,
+            names=[p["Process"] for p in processes],
+        )
+
+    def to_dicts(self):
+        """Convert back to the list-of-dicts process format."""
+        processes = []
+        for pid, (arrival, burst) in enumerate(
+            zip(self.arrival.tolist(), self.burst.tolist())
+        ):
+            process = {
+                "Process": self.name(pid),
+                "Arrival Time": arrival,
+                "Burst Time": burst,
+            }
+            if self.priority is not None:
+                process["Priority"] = self.priority[pid].item()
+            if self.deadline is not None:
+                process["Deadline"] = self.deadline[pid].item()
+            processes.append(process)
+        return processes
+
+    def arrival_order(self):
+        """Process IDs sorted by arrival time, ties kept in input order."""
+        # Traces usually arrive pre-sorted; skip the O(n log n) sort then
+        if np.all(self.arrival[1:] >= self.arrival[:-1]):
+            return np.arange(len(self.arrival))
+        return np.argsort(self.arrival, kind="stable")
+
+
+class NameTable:
+    """Read-only process names decoded on demand from UTF-8 bytes.
+
+    Name i is data[starts[i]:ends[i]]. Millions of names cost a few bytes
+    each instead of one Python string each.
+    """
+
+    def __init__(self, starts, ends, data):
+        self.starts = starts
+        self.ends = ends
+        self.data = data
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, pid):
+        return bytes(self.data[self.starts[pid] : self.ends[pid]]).decode("utf-8")
+
+    def __iter__(self):
+        for pid in range(len(self)):
+            yield self[pid]
+
+    def take(self, order):
+        """The names reordered by an index array, sharing the same bytes."""
+        return NameTable(self.starts[order], self.ends[order], self.data)
+
+
+class ScheduleTable:
+    """A schedule as parallel pid/start/finish arrays over a ProcessTable.
+
+    Multi-CPU schedules also have a cpu column with the core of every
+    segment; cores is the machine's core count either way.
+    """
+
+    def __init__(self, pid, start, finish, processes, cpu=None, cores=None):
+        time_type = np.result_type(processes.arrival, processes.burst)
+        self.pid = np.asarray(pid, dtype=np.int64)
+        self.start = np.asarray(start, dtype=time_type)
+        self.finish = np.asarray(finish, dtype=time_type)
+        self.processes = processes
+        self.cpu = None if cpu is None else np.asarray(cpu, dtype=np.int32)
+        if cores is None:
+            cores = 1 if self.cpu is None or not len(self.cpu) else self.cpu.max() + 1
+        self.cores = int(cores)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def chunks(self, size):
+        """Consecutive ScheduleTable views of at most size segments."""
+        for begin in range(0, len(self), size):
+            yield ScheduleTable(
+                self.pid[begin : begin + size],
+                self.start[begin : begin + size],
+                self.finish[begin : begin + size],
+                self.processes,
+                cpu=None if self.cpu is None else self.cpu[begin : begin + size],
+                cores=self.cores,
+            )
+
+    def rows(self):
+        """Iterate (process name, start, finish) without building dicts."""
+        name = self.processes.name
+        for pid, start, finish in zip(
+            self.pid.tolist(), self.start.tolist(), self.finish.tolist()
+        ):
+            yield name(pid), start, finish
+
+    @classmethod
+    def from_dicts(cls, segments, processes):
+        """Build a schedule over processes from the list-of-dicts format.
+
+        Segments name their process; "CPU" keys are kept when every
+        segment has one.
+        """
+        pids = {processes.name(pid): pid for pid in range(len(processes))}
+        cpu = None
+        if segments and all("CPU" in segment for segment in segments):
+            cpu = [segment["CPU"] for segment in segments]
+        return cls(
+            [pids[segment["Process"]] for segment in segments],
+            [segment["Start"] for segment in segments],
+            [segment["Finish"] for segment in segments],
+            processes,
+            cpu=cpu,
+        )
+
+    def to_dicts(self):
+        """Convert to the list of {"Process", "Start", "Finish"} segments.
+
+        Multi-CPU segments also have a "CPU" key.
+        """
+        name = self.processes.name
+        segments = [
+            {"Process": name(pid), "Start": start, "Finish": finish}
+            for pid, start, finish in zip(
+                self.pid.tolist(), self.start.tolist(), self.finish.tolist()
+            )
+        ]
+        if self.cpu is not None:
+            for segment, cpu in zip(segments, self.cpu.tolist()):
+                segment["CPU"] = cpu
+        return segments
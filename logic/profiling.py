@@ -0,0 +1,123 @@
+import builtins
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+
+class RunStats:
+    """Wall time per phase plus counters for one scheduling run.
+
+    Pass an instance wherever a stats argument is accepted; with the default
+    of None the run path skips all bookkeeping. Peak memory uses tracemalloc,
+    which slows Python code down noticeably, so it is opt-in.
+    """
+
+    def __init__(self, track_memory=False):
+        self.track_memory = track_memory
+        self.phases = {}  # Phase name -> seconds, in first-seen order
+        self.events = 0
+        self.segments = 0
+        self.context_switches = 0
+        self.cache_hit = False
+        self.peak_memory = None  # Bytes, when track_memory is set
+
+    @contextmanager
+    def phase(self, name):
+        """Add the wall time of the with-block to the named phase."""
+        # Only the outermost traced phase starts and stops tracemalloc, and
+        # never when someone else is already tracing
+        trace = self.track_memory and not tracemalloc.is_tracing()
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+            if trace:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                self.peak_memory = max(self.peak_memory or 0, peak)
+
+    @property
+    def total_seconds(self):
+        return sum(self.phases.values())
+
+    def as_dict(self):
+        return {
+            "phases": dict(self.phases),
+            "total_seconds": self.total_seconds,
+            "events": self.events,
+            "segments": self.segments,
+            "context_switches": self.context_switches,
+            "cache_hit": self.cache_hit,
+            "peak_memory": self.peak_memory,
+        }
+
+    def format(self):
+        """Multi-line, human-readable report."""
+        lines = [
+            f"{name}: {seconds * 1000:.1f} ms" for name, seconds in self.phases.items()
+        ]
+        lines.append(f"total: {self.total_seconds * 1000:.1f} ms")
+        lines.append(f"events processed: {self.events:,}")
+        lines.append(f"schedule segments: {self.segments:,}")
+        lines.append(f"context switches: {self.context_switches:,}")
+        if self.cache_hit:
+            lines.append("result cache: hit")
+        if self.peak_memory is not None:
+            lines.append(f"peak memory: {self.peak_memory / 2**20:.1f} MiB")
+        return "\n".join(lines)
+
+
+def phase(stats, name):
+    """stats.phase(name), or a no-op context when stats is None."""
+    if stats is None:
+        return nullcontext()
+    return stats.phase(name)
+
+
+class ImportTimer:
+    """Self and cumulative import time per module, like python -X importtime.
+
+    Only imports that go through the import statement are timed; modules
+    loaded with importlib count towards the module that loaded them.
+    """
+
+    def __init__(self):
+        self.times = {}  # Module name -> (self seconds, cumulative seconds)
+        self._nested = []  # Time spent in nested imports, per open import
+        self._original = None
+
+    def start(self):
+        self._original = builtins.__import__
+        builtins.__import__ = self._import
+
+    def stop(self):
+        builtins.__import__ = self._original
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Repeated and relative imports are cheap or counted by their parent
+        if level or name in sys.modules:
+            return self._original(name, globals, locals, fromlist, level)
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self.times[name] = (elapsed - nested, elapsed)
+
+    def format(self, limit=25):
+        """The slowest modules by cumulative time, one per line."""
+        slowest = sorted(self.times.items(), key=lambda item: -item[1][1])
+        lines = [f"{'cumulative':>12} {'self':>9}  module"]
+        for name, (own, cumulative) in slowest[:limit]:
+            lines.append(f"{cumulative * 1000:9.1f} ms {own * 1000:6.1f} ms  {name}")
+        return "\n".join(lines)
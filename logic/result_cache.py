@@ -0,0 +1,264 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from logic.process_table import ScheduleTable
+from logic.workload import Workload, column_digest
+
+# Algorithms whose result depends on the optional process columns
+PRIORITY_ALGORITHMS = {"Priority"}
+QUANTUM_ALGORITHMS = {"Round Robin", "MLFQ"}
+
+# Default size limits of the in-memory entries and of the on-disk store
+MEMORY_BUDGET = 512 * 2**20
+DISK_BUDGET = 2 * 2**30
+
+
+def result_key(
+    table,
+    algorithm,
+    quantum=None,
+    merge_slices=False,
+    cores=1,
+    queues=None,
+    mlfq=None,
+):
+    """Canonical hash of everything a schedule depends on.
+
+    Process names are left out: they only label the result, so renaming a
+    process still hits the cache. Columns and options the algorithm
+    ignores are left out too, so e.g. FCFS hits regardless of priorities.
+    Deadlines are the exception: every run's lateness metrics use them.
+    The queue mode only matters, and cores only appear, above one core.
+    MLFQ settings (see mlfq_options) are part of the key for MLFQ only.
+    """
+    digest = hashlib.sha256()
+    columns = ["arrival", "burst"]
+    if algorithm in PRIORITY_ALGORITHMS:
+        columns.append("priority")
+    if table.deadline is not None:
+        columns.append("deadline")
+    if algorithm not in QUANTUM_ALGORITHMS:
+        quantum = None
+    if algorithm != "Round Robin":
+        merge_slices = False
+    options = [algorithm, quantum, bool(merge_slices), len(table)]
+    if algorithm == "MLFQ":
+        options.append(mlfq)
+    if cores > 1:
+        # The multi-core engine never merges slices
+        options[2:3] = [False, cores, queues]
+    digest.update(json.dumps(options).encode())
+    for name in columns:
+        if getattr(table, name) is None:
+            digest.update(b"-")
+        elif isinstance(table, Workload):
+            # A Workload hashes each column once for all its lookups
+            digest.update(table.column_digest(name))
+        else:
+            digest.update(column_digest(getattr(table, name)))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """LRU cache of schedules and metrics with an optional on-disk store.
+
+    Entries hold only arrays and plain values; the ScheduleTable handed back
+    is rebuilt over the caller's ProcessTable, so names always match the
+    current table. Safe to share between the GUI and worker threads.
+
+    Memory holds at most max_entries entries and max_bytes of arrays, least
+    recently used first out. The disk store is pruned to max_disk_bytes by
+    dropping the files used longest ago (loading a file touches it).
+    """
+
+    def __init__(
+        self,
+        max_entries=32,
+        directory=None,
+        max_bytes=MEMORY_BUDGET,
+        max_disk_bytes=DISK_BUDGET,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = directory
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.entries = OrderedDict()
+        self.sizes = {}  # Key -> array bytes of the entry
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(
+        self,
+        table,
+        algorithm,
+        quantum=None,
+        merge_slices=False,
+        cores=1,
+        queues=None,
+        mlfq=None,
+    ):
+        """(ScheduleTable, metrics) for a cached run, or None on a miss."""
+        key = result_key(table, algorithm, quantum, merge_slices, cores, queues, mlfq)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+        if entry is None and self.directory is not None:
+            entry = self._load(key)
+            if entry is not None:
+                with self.lock:
+                    self.disk_hits += 1
+                    self._remember(key, entry)
+        if entry is None:
+            with self.lock:
+                self.misses += 1
+            return None
+        pid, start, finish, cpu, metrics = entry
+        schedule = ScheduleTable(
+            pid, start, finish, table, cpu=cpu, cores=cores if cpu is not None else 1
+        )
+        return schedule, metrics
+
+    def put(
+        self,
+        table,
+        algorithm,
+        quantum,
+        merge_slices,
+        schedule,
+        metrics,
+        cores=1,
+        queues=None,
+        mlfq=None,
+    ):
+        key = result_key(table, algorithm, quantum, merge_slices, cores, queues, mlfq)
+        entry = (schedule.pid, schedule.start, schedule.finish, schedule.cpu, metrics)
+        with self.lock:
+            self._remember(key, entry)
+        if self.directory is not None:
+            self._save(key, entry)
+
+    def stats(self):
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def clear(self, disk=False):
+        with self.lock:
+            self.entries.clear()
+            self.sizes.clear()
+            self.bytes = 0
+            self.hits = self.disk_hits = self.misses = 0
+        if disk and self.directory is not None:
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, file_name))
+
+    def _remember(self, key, entry):
+        self.bytes -= self.sizes.get(key, 0)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        self.sizes[key] = _entry_bytes(entry)
+        self.bytes += self.sizes[key]
+        # An entry bigger than the whole budget is only kept on disk
+        while self.entries and (
+            len(self.entries) > self.max_entries or self.bytes > self.max_bytes
+        ):
+            oldest, _ = self.entries.popitem(last=False)
+            self.bytes -= self.sizes.pop(oldest)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _save(self, key, entry):
+        pid, start, finish, cpu, metrics = entry
+        arrays = {"pid": pid, "start": start, "finish": finish}
+        if cpu is not None:
+            arrays["cpu"] = cpu
+        for name, values in metrics["per_process"].items():
+            arrays[f"per_process_{name}"] = values
+        summary = {k: v for k, v in metrics.items() if k != "per_process"}
+        arrays["summary"] = np.array(json.dumps(summary))
+        # Write to a temporary file first so readers never see half a result
+        temporary = self._path(key) + ".tmp"
+        try:
+            with open(temporary, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temporary, self._path(key))
+        except OSError:
+            # The disk store is only an optimisation
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            return
+        self._prune_disk()
+
+    def _prune_disk(self):
+        """Delete the least recently used files until the store fits."""
+        files = []
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".npz"):
+                        info = entry.stat()
+                        files.append((info.st_mtime, info.st_size, entry.path))
+        except OSError:
+            return
+        total = sum(size for _, size, _ in files)
+        files.sort()
+        for _, size, path in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Another thread may have removed it already
+                pass
+            total -= size
+
+    def _load(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            # Mark the file as recently used for _prune_disk
+            os.utime(path)
+            with np.load(path, allow_pickle=False) as data:
+                metrics = json.loads(str(data["summary"]))
+                metrics["per_process"] = {
+                    name[len("per_process_") :]: data[name]
+                    for name in data.files
+                    if name.startswith("per_process_")
+                }
+                cpu = data["cpu"] if "cpu" in data.files else None
+                return data["pid"], data["start"], data["finish"], cpu, metrics
+        except (OSError, ValueError, KeyError):
+            # Unreadable or outdated entries count as misses
+            return None
+
+
+def _entry_bytes(entry):
+    pid, start, finish, cpu, metrics = entry
+    arrays = [pid, start, finish] + list(metrics["per_process"].values())
+    if cpu is not None:
+        arrays.append(cpu)
+    return sum(np.asarray(array).nbytes for array in arrays)
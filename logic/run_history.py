@@ -0,0 +1,333 @@
+import hashlib
+import io
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+
+import numpy as np
+
+from logic.metrics import compute_metrics
+from logic.process_table import ProcessTable, ScheduleTable
+from logic.workload import Workload, column_digest
+
+# Database file name inside the output directory
+HISTORY_FILE = "run_history.sqlite3"
+
+# Queued runs are written in transactions of up to this many
+WRITE_BATCH = 64
+
+RUN_COLUMNS = (
+    "id",
+    "created",
+    "algorithm",
+    "quantum",
+    "workload_hash",
+    "comparison",
+    "process_count",
+    "segments",
+    "avg_waiting_time",
+    "avg_turnaround_time",
+    "metrics",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workloads (
+    hash TEXT PRIMARY KEY,
+    arrival BLOB NOT NULL,
+    burst BLOB NOT NULL,
+    priority BLOB,
+    deadline BLOB,
+    names TEXT
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    created REAL NOT NULL,
+    algorithm TEXT NOT NULL,
+    quantum INTEGER,
+    workload_hash TEXT NOT NULL REFERENCES workloads (hash),
+    comparison TEXT,
+    process_count INTEGER NOT NULL,
+    segments INTEGER NOT NULL,
+    avg_waiting_time REAL NOT NULL,
+    avg_turnaround_time REAL NOT NULL,
+    metrics TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_by_created ON runs (created);
+CREATE INDEX IF NOT EXISTS runs_by_algorithm ON runs (algorithm, created);
+CREATE INDEX IF NOT EXISTS runs_by_workload ON runs (workload_hash, created);
+CREATE TABLE IF NOT EXISTS schedules (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id),
+    pid BLOB NOT NULL,
+    start BLOB NOT NULL,
+    finish BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS schedule_cores (
+    run_id INTEGER PRIMARY KEY REFERENCES runs (id),
+    cores INTEGER NOT NULL,
+    cpu BLOB NOT NULL
+);
+"""
+
+
+def workload_hash(processes):
+    """Content hash of a process set, names included."""
+    digest = hashlib.sha256()
+    for name in ("arrival", "burst", "priority", "deadline"):
+        if getattr(processes, name) is None:
+            digest.update(b"-")
+        elif isinstance(processes, Workload):
+            digest.update(processes.column_digest(name))
+        else:
+            digest.update(column_digest(getattr(processes, name)))
+    names = None if processes.names is None else list(processes.names)
+    digest.update(json.dumps(names).encode())
+    return digest.hexdigest()
+
+
+def _pack(array):
+    if array is None:
+        return None
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(array), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _unpack(blob):
+    if blob is None:
+        return None
+    return np.load(io.BytesIO(blob), allow_pickle=False)
+
+
+class RunHistory:
+    """Append-only store of past runs in an SQLite database.
+
+    record() only queues a run; a background thread writes queued runs in
+    batches, so callers never wait for the disk. Each process set is stored
+    once, keyed by its content hash. Queries see committed runs only; call
+    flush() first to include runs that are still queued.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            # WAL lets queries read while the writer thread commits
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+        self.last_error = None  # Message of the last failed write, if any
+        self.queue = queue.Queue()
+        self.writer = threading.Thread(
+            target=self._write_loop, name="run history writer", daemon=True
+        )
+        self.writer.start()
+
+    def record(self, processes, result, comparison=None):
+        """Queue one run: a result dict as returned by run_algorithm()."""
+        self.queue.put((time.time(), processes, result, comparison))
+
+    def record_comparison(self, processes, results):
+        """Queue every result of one comparison under a shared comparison ID."""
+        comparison = uuid.uuid4().hex
+        for result in results:
+            self.record(processes, result, comparison)
+        return comparison
+
+    def flush(self, timeout=None):
+        """Wait until every queued run has been written.
+
+        Returns False if timeout seconds pass first or the writer thread has
+        stopped.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                if not self.writer.is_alive():
+                    return False
+                wait = 0.1
+                if deadline is not None:
+                    wait = min(wait, deadline - time.monotonic())
+                    if wait <= 0:
+                        return False
+                self.queue.all_tasks_done.wait(wait)
+        return True
+
+    def close(self):
+        if self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join()
+
+    def runs(self, algorithm=None, workload=None, since=None, until=None, limit=100):
+        """Recorded runs without their schedules, newest first.
+
+        workload is a workload hash or a prefix of one; since and until are
+        Unix timestamps.
+        """
+        clauses, parameters = [], []
+        if algorithm is not None:
+            clauses.append("algorithm = ?")
+            parameters.append(algorithm)
+        if workload is not None:
+            if not workload or any(c not in "0123456789abcdef" for c in workload):
+                raise ValueError(f"Not a workload hash: {workload!r}")
+            # GLOB, unlike LIKE, can use the index for a prefix
+            clauses.append("workload_hash GLOB ?")
+            parameters.append(workload + "*")
+        if since is not None:
+            clauses.append("created >= ?")
+            parameters.append(since)
+        if until is not None:
+            clauses.append("created < ?")
+            parameters.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                f"SELECT {', '.join(RUN_COLUMNS)} FROM runs {where}"
+                " ORDER BY created DESC, id DESC LIMIT ?",
+                parameters + [limit],
+            ).fetchall()
+        runs = []
+        for row in rows:
+            run = dict(zip(RUN_COLUMNS, row))
+            run["metrics"] = json.loads(run["metrics"])
+            runs.append(run)
+        return runs
+
+    def load(self, run_id):
+        """A recorded run with its process set, schedule and full metrics."""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                f"SELECT {', '.join(RUN_COLUMNS)} FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"No recorded run with ID {run_id}")
+            run = dict(zip(RUN_COLUMNS, row))
+            arrival, burst, priority, deadline, names = connection.execute(
+                "SELECT arrival, burst, priority, deadline, names FROM workloads"
+                " WHERE hash = ?",
+                (run["workload_hash"],),
+            ).fetchone()
+            pid, start, finish = connection.execute(
+                "SELECT pid, start, finish FROM schedules WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            # Only multi-core runs have a row here
+            cores, cpu = connection.execute(
+                "SELECT cores, cpu FROM schedule_cores WHERE run_id = ?", (run_id,)
+            ).fetchone() or (1, None)
+        processes = ProcessTable(
+            _unpack(arrival),
+            _unpack(burst),
+            priority=_unpack(priority),
+            deadline=_unpack(deadline),
+            names=None if names is None else json.loads(names),
+        )
+        run["processes"] = processes
+        run["schedule"] = ScheduleTable(
+            _unpack(pid),
+            _unpack(start),
+            _unpack(finish),
+            processes,
+            cpu=_unpack(cpu),
+            cores=cores,
+        )
+        # Per-process metrics aren't stored; they are cheap to recompute.
+        # Stored values the schedule alone can't give (e.g. "feasible") stay
+        run["metrics"] = dict(
+            json.loads(run["metrics"]), **compute_metrics(run["schedule"])
+        )
+        return run
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _write_loop(self):
+        connection = None
+        known = set()  # Workload hashes already in the database
+        while True:
+            batch = [self.queue.get()]
+            while batch[-1] is not None and len(batch) < WRITE_BATCH:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if connection is None:
+                    connection = self._connect()
+                self._write(connection, [run for run in batch if run], known)
+            except Exception as e:
+                # History is a convenience: a failed write must neither stop
+                # runs nor end this thread and leave flush() waiting
+                self.last_error = str(e)
+            for _ in batch:
+                self.queue.task_done()
+            if batch[-1] is None:
+                if connection is not None:
+                    connection.close()
+                return
+
+    def _write(self, connection, batch, known):
+        hashes = {}  # id(processes) -> hash; comparisons share one table
+        added = set()
+        with connection:
+            for created, processes, result, comparison in batch:
+                key = hashes.get(id(processes))
+                if key is None:
+                    key = hashes[id(processes)] = workload_hash(processes)
+                if key not in known:
+                    connection.execute(
+                        "INSERT OR IGNORE INTO workloads VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            key,
+                            _pack(processes.arrival),
+                            _pack(processes.burst),
+                            _pack(processes.priority),
+                            _pack(processes.deadline),
+                            (
+                                None
+                                if processes.names is None
+                                else json.dumps(list(processes.names))
+                            ),
+                        ),
+                    )
+                    added.add(key)
+                schedule = result["schedule"]
+                metrics = result["metrics"]
+                summary = {k: v for k, v in metrics.items() if k != "per_process"}
+                cursor = connection.execute(
+                    f"INSERT INTO runs ({', '.join(RUN_COLUMNS[1:])})"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        created,
+                        result["algorithm"],
+                        result.get("quantum"),
+                        key,
+                        comparison,
+                        len(processes),
+                        len(schedule),
+                        result["avg_waiting_time"],
+                        result["avg_turnaround_time"],
+                        json.dumps(summary),
+                    ),
+                )
+                connection.execute(
+                    "INSERT INTO schedules VALUES (?, ?, ?, ?)",
+                    (
+                        cursor.lastrowid,
+                        _pack(schedule.pid),
+                        _pack(schedule.start),
+                        _pack(schedule.finish),
+                    ),
+                )
+                if schedule.cpu is not None:
+                    connection.execute(
+                        "INSERT INTO schedule_cores VALUES (?, ?, ?)",
+                        (cursor.lastrowid, schedule.cores, _pack(schedule.cpu)),
+                    )
+        # Only remember workloads once their transaction has committed
+        known.update(added)
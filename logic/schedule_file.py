@@ -0,0 +1,231 @@
+import json
+import os
+
+import numpy as np
+
+from logic.metrics import MetricsAccumulator
+from logic.process_table import NameTable, ProcessTable, ScheduleTable
+
+MAGIC = b"SHDFLOW\x00"
+VERSION = 1
+FILE_EXTENSION = ".shds"
+
+# The JSON header is padded to this size so the writer can rewrite it in
+# place once the segment count is known
+HEADER_SIZE = 4096
+# Every section starts at a multiple of this, so memory-mapped columns are
+# aligned for their dtype
+ALIGNMENT = 64
+# Segments converted to records at a time while writing
+WRITE_CHUNK = 1 << 20
+
+WORKLOAD_COLUMNS = ("arrival", "burst", "priority", "deadline")
+
+
+def record_dtype(time_type, cpu=False):
+    """Fixed-width pid/start/finish record for a schedule's time dtype.
+
+    Multi-CPU schedules add the core of each segment.
+    """
+    time_type = np.dtype(time_type).newbyteorder("<")
+    fields = [("pid", "<i8"), ("start", time_type), ("finish", time_type)]
+    if cpu:
+        fields.append(("cpu", "<i4"))
+    return np.dtype(fields)
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class ScheduleWriter:
+    """Writes a schedule file from chunks, e.g. straight from run_stream().
+
+    Layout: a HEADER_SIZE JSON header after the magic bytes, then the
+    workload columns and the name string table, then one fixed-width record
+    per segment up to the end of the file. The file appears under its name
+    only once close() has written the final header.
+    """
+
+    def __init__(
+        self,
+        path,
+        processes,
+        algorithm=None,
+        quantum=None,
+        metrics=None,
+        cores=1,
+    ):
+        self.path = path
+        self.processes = processes
+        self.time_type = np.result_type(processes.arrival, processes.burst)
+        self.dtype = record_dtype(self.time_type, cpu=cores > 1)
+        self.header = {
+            "version": VERSION,
+            "algorithm": algorithm,
+            "quantum": quantum,
+            "cores": cores,
+            "processes": len(processes),
+            "segments": 0,
+            "record_dtype": self.dtype.descr,
+            "columns": {},
+            "names": None,
+            "metrics": None,
+        }
+        # Known metrics are stored as given; otherwise they are computed
+        # while the segments pass through
+        self.metrics = metrics
+        self.accumulator = (
+            None if metrics is not None else MetricsAccumulator(processes, cores)
+        )
+        self.temporary = path + ".tmp"
+        self.file = open(self.temporary, "wb")
+        try:
+            self.file.write(b"\x00" * HEADER_SIZE)
+            for name in WORKLOAD_COLUMNS:
+                column = getattr(processes, name)
+                if column is not None:
+                    column = np.asarray(column)
+                    column = column.astype(column.dtype.newbyteorder("<"), copy=False)
+                    self.header["columns"][name] = self._section(column)
+            if processes.names is not None:
+                encoded = [str(name).encode("utf-8") for name in processes.names]
+                offsets = np.zeros(len(encoded) + 1, dtype="<i8")
+                np.cumsum([len(name) for name in encoded], out=offsets[1:])
+                self.header["names"] = {
+                    "offsets": self._section(offsets),
+                    "data": self._section(np.frombuffer(b"".join(encoded), np.uint8)),
+                }
+            self.header["records"] = self._pad()
+        except BaseException:
+            self.discard()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, kind, value, traceback):
+        if kind is None:
+            self.close()
+        else:
+            self.discard()
+
+    def write(self, chunk):
+        """Append a ScheduleTable chunk; chunks must come in schedule order."""
+        for part in chunk.chunks(WRITE_CHUNK):
+            records = np.empty(len(part), dtype=self.dtype)
+            records["pid"] = part.pid
+            records["start"] = part.start
+            records["finish"] = part.finish
+            if "cpu" in self.dtype.names:
+                records["cpu"] = part.cpu
+            self.file.write(records.tobytes())
+            self.header["segments"] += len(part)
+            if self.accumulator is not None:
+                self.accumulator.add(part)
+
+    def close(self):
+        metrics = self.metrics
+        if metrics is None:
+            metrics = self.accumulator.result()
+        self.header["metrics"] = {
+            key: value for key, value in metrics.items() if key != "per_process"
+        }
+        header = json.dumps(self.header).encode("utf-8")
+        if len(MAGIC) + 4 + len(header) > HEADER_SIZE:
+            self.discard()
+            raise ValueError("Schedule file header is too large")
+        try:
+            self.file.seek(0)
+            self.file.write(MAGIC + len(header).to_bytes(4, "little") + header)
+            self.file.close()
+            os.replace(self.temporary, self.path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self):
+        """Abandon the file without touching any existing one at path."""
+        self.file.close()
+        if os.path.exists(self.temporary):
+            os.remove(self.temporary)
+
+    def _pad(self):
+        offset = _aligned(self.file.tell())
+        self.file.write(b"\x00" * (offset - self.file.tell()))
+        return offset
+
+    def _section(self, array):
+        """Write an array at the next aligned offset and describe it."""
+        offset = self._pad()
+        self.file.write(array.tobytes())
+        return {"offset": offset, "dtype": array.dtype.str, "length": len(array)}
+
+
+def write_schedule(path, schedule, algorithm=None, quantum=None, metrics=None):
+    """Write a whole ScheduleTable and its process set to a schedule file."""
+    with ScheduleWriter(
+        path, schedule.processes, algorithm, quantum, metrics, schedule.cores
+    ) as writer:
+        writer.write(schedule)
+
+
+def load_schedule(path):
+    """Open a schedule file without reading its columns into memory.
+
+    Returns a dict with the algorithm, quantum, summary metrics, the
+    process set and the schedule; their arrays are read-only views of one
+    memory map, so only the pages actually used are read from disk.
+    """
+    with open(path, "rb") as file:
+        prefix = file.read(len(MAGIC) + 4)
+        if len(prefix) < len(MAGIC) + 4 or prefix[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a schedule file")
+        length = int.from_bytes(prefix[len(MAGIC) :], "little")
+        header = json.loads(file.read(length))
+    if header["version"] != VERSION:
+        raise ValueError(f"Unsupported schedule file version {header['version']}")
+
+    raw = np.memmap(path, dtype=np.uint8, mode="r")
+
+    def section(spec):
+        dtype = np.dtype(spec["dtype"])
+        end = spec["offset"] + spec["length"] * dtype.itemsize
+        if end > len(raw):
+            raise ValueError(f"{path} is truncated")
+        return raw[spec["offset"] : end].view(dtype)
+
+    columns = {name: section(spec) for name, spec in header["columns"].items()}
+    names = None
+    if header["names"] is not None:
+        offsets = section(header["names"]["offsets"])
+        names = NameTable(offsets[:-1], offsets[1:], section(header["names"]["data"]))
+    processes = ProcessTable(
+        columns["arrival"],
+        columns["burst"],
+        priority=columns.get("priority"),
+        deadline=columns.get("deadline"),
+        names=names,
+    )
+    dtype = np.dtype([tuple(field) for field in header["record_dtype"]])
+    records = section(
+        {
+            "offset": header["records"],
+            "dtype": dtype,
+            "length": header["segments"],
+        }
+    )
+    return {
+        "algorithm": header["algorithm"],
+        "quantum": header["quantum"],
+        "metrics": header["metrics"],
+        "processes": processes,
+        "schedule": ScheduleTable(
+            records["pid"],
+            records["start"],
+            records["finish"],
+            processes,
+            cpu=records["cpu"] if "cpu" in dtype.names else None,
+            cores=header.get("cores", 1),
+        ),
+    }
@@ -1,157 +1,719 @@
+import heapq
 import random
 from collections import deque
+from math import ceil
+
+import numpy as np
+
+from logic.metrics import MetricsAccumulator, compute_metrics
+from logic.multicore import GLOBAL_QUEUE, MULTICORE_ALGORITHMS, MultiCoreEngine
+from logic.process_table import ScheduleTable
+from logic.profiling import phase
+from logic.workload import Workload
+
+# Process sets at least this large use the NumPy FCFS engine
+FCFS_VECTORIZE_THRESHOLD = 1000
+
+# Algorithms that schedule by the Deadline column
+DEADLINE_ALGORITHMS = ("EDF", "RMS")
+
+# Algorithms that take a time quantum (MLFQ's is its top-level quantum)
+QUANTUM_ALGORITHMS = ("Round Robin", "MLFQ")
+
+# MLFQ defaults: queue levels, and the period of the priority boost
+MLFQ_LEVELS = 3
+MLFQ_BOOST = 100
+
+# Engines report progress and check for cancellation every this many events
+PROGRESS_INTERVAL = 10000
+
+
+class SchedulingCancelled(Exception):
+    """Raised from inside an engine once its cancel event is set."""
+
+
+def mlfq_options(quantum, levels=MLFQ_LEVELS, boost=MLFQ_BOOST, quanta=None):
+    """MLFQ settings: the quantum of each level, top first, and the boost period.
+
+    Without explicit quanta, level i gets quantum * 2**i. A boost of None
+    never moves processes back to the top level.
+    """
+    if quanta is None:
+        if quantum is None or quantum < 1:
+            raise ValueError("Quantum must be at least 1")
+        if levels < 1:
+            raise ValueError("MLFQ needs at least one level")
+        quanta = [quantum * 2**level for level in range(levels)]
+    if not quanta or min(quanta) < 1:
+        raise ValueError("Every MLFQ level needs a quantum of at least 1")
+    if boost is not None and boost <= 0:
+        raise ValueError("The MLFQ boost period must be positive")
+    return {"quanta": list(quanta), "boost": boost}
+
+
+class _ChainedQueue:
+    """FIFO queue built from whole deques, so appending a deque is O(1)."""
+
+    def __init__(self):
+        self.parts = deque([deque()])
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, item):
+        self.parts[-1].append(item)
+        self.size += 1
+
+    def appendleft(self, item):
+        self.parts[0].appendleft(item)
+        self.size += 1
+
+    def popleft(self):
+        while not self.parts[0]:
+            self.parts.popleft()
+        self.size -= 1
+        return self.parts[0].popleft()
+
+    def extend_with(self, items):
+        """Append every item of a deque; the deque becomes part of this queue."""
+        self.parts.append(items)
+        self.size += len(items)
+
 
 class Scheduler:
-    def __init__(self, processes, algorithm, quantum=None):
+    def __init__(
+        self,
+        processes,
+        algorithm,
+        quantum=None,
+        merge_slices=False,
+        progress=None,
+        cancel_event=None,
+        cache=None,
+        stats=None,
+        cores=1,
+        queues=GLOBAL_QUEUE,
+        mlfq=None,
+    ):
+        # Accept the list-of-dicts format, a ProcessTable or a Workload;
+        # passing one Workload to several schedulers sorts it only once
+        self.table = Workload.of(processes)
         self.processes = processes
         self.algorithm = algorithm
         self.quantum = quantum
+        # Round Robin only: merge back-to-back slices of the same process
+        self.merge_slices = merge_slices
+        self.metrics = None
+        # progress(events, current_time) is called every PROGRESS_INTERVAL
+        # events; setting cancel_event stops the engine at the same points
+        self.progress = progress
+        self.cancel_event = cancel_event
+        self.events_processed = 0
+        # Set by stream(): engines then hand out finished segments at every
+        # checkpoint instead of keeping the whole schedule
+        self.streaming = False
+        # Optional ResultCache; cache_hit tells whether run() used it
+        self.cache = cache
+        self.cache_hit = False
+        # Optional RunStats collecting phase timings and counters
+        self.stats = stats
+        # More than one core runs the MultiCoreEngine, which ignores
+        # merge_slices; queues is GLOBAL_QUEUE or PER_CORE_QUEUES
+        self.cores = cores
+        self.queues = queues
+        # MLFQ only: settings from mlfq_options(); None derives them from
+        # quantum with the default levels and boost
+        self.mlfq = mlfq
 
     def run(self):
+        schedule, avg_waiting_time, avg_turnaround_time = self.run_table()
+        with phase(self.stats, "convert to dicts"):
+            segments = schedule.to_dicts()
+        return segments, avg_waiting_time, avg_turnaround_time
+
+    def run_table(self):
+        """Like run(), but return the schedule as a ScheduleTable."""
         algorithms = {
-            "FCFS": self.fcfs,
-            "SRTF": self.srtf,
-            "Priority": self.priority,
-            "Round Robin": self.round_robin,
+            "FCFS": self._fcfs_table,
+            "SRTF": self._srtf_table,
+            "Priority": self._priority_table,
+            "Round Robin": self._round_robin_table,
+            "EDF": self._edf_table,
+            "RMS": self._rms_table,
+            "MLFQ": self._multilevel_feedback_table,
         }
-        schedule, _ = algorithms[self.algorithm]()
-        waiting_times, turnaround_times, avg_waiting_time, avg_turnaround_time = (
-            self.calculate_metrics(schedule)
+        cached = None
+        if self.cache is not None:
+            with phase(self.stats, "cache lookup"):
+                cached = self.cache.get(
+                    self.table,
+                    self.algorithm,
+                    self.quantum,
+                    self.merge_slices,
+                    self.cores,
+                    self.queues,
+                    self.mlfq,
+                )
+        self.cache_hit = cached is not None
+        if cached is not None:
+            schedule, self.metrics = cached
+        else:
+            with phase(self.stats, "engine"):
+                if self.cores > 1:
+                    schedule = self._multicore().run()
+                else:
+                    schedule = algorithms[self.algorithm]()
+            # Full metrics (percentiles, utilisation, ...) stay available here
+            with phase(self.stats, "metrics"):
+                self.metrics = compute_metrics(schedule)
+                self._add_feasibility(self.metrics)
+            if self.cache is not None:
+                with phase(self.stats, "cache store"):
+                    self.cache.put(
+                        self.table,
+                        self.algorithm,
+                        self.quantum,
+                        self.merge_slices,
+                        schedule,
+                        self.metrics,
+                        self.cores,
+                        self.queues,
+                        self.mlfq,
+                    )
+        if self.stats is not None:
+            self.stats.events += self.events_processed
+            self.stats.segments += len(schedule)
+            self.stats.context_switches += self.metrics["context_switches"]
+            self.stats.cache_hit = self.cache_hit
+        return (
+            schedule,
+            self.metrics["waiting"]["mean"],
+            self.metrics["turnaround"]["mean"],
         )
-        return schedule, avg_waiting_time, avg_turnaround_time
 
-    def calculate_metrics(self, schedule):
-        arrival_times = {p["Process"]: p["Arrival Time"] for p in self.processes}
-        burst_times = {p["Process"]: p["Burst Time"] for p in self.processes}
-        finish_times = {}
-        for entry in schedule:
-            finish_times[entry["Process"]] = entry["Finish"]
-        turnaround_times = {p: finish_times[p] - arrival_times[p] for p in finish_times}
-        waiting_times = {
-            p: turnaround_times[p] - burst_times[p] for p in turnaround_times
+    def stream(self):
+        """Yield the schedule as consecutive ScheduleTable chunks.
+
+        Chunks are handed out while the engine runs, so the caller never
+        holds more than about PROGRESS_INTERVAL segments at once. The result
+        cache is not used.
+        """
+        engines = {
+            "FCFS": self._fcfs_chunks,
+            "SRTF": self._preemptive_chunks,
+            "Priority": self._priority_chunks,
+            "Round Robin": self._round_robin_chunks,
+            "EDF": self._edf_chunks,
+            "RMS": self._rms_chunks,
+            "MLFQ": self._mlfq_chunks,
         }
-        avg_waiting_time = (
-            sum(waiting_times.values()) / len(waiting_times) if waiting_times else 0
+        self.streaming = True
+        try:
+            if self.cores > 1:
+                chunks = self._multicore().chunks()
+            else:
+                chunks = engines[self.algorithm]()
+            for chunk in chunks:
+                if len(chunk):
+                    yield chunk
+        finally:
+            self.streaming = False
+
+    def run_stream(self, consumer=None):
+        """Run without keeping the schedule, computing metrics in the same pass.
+
+        Each chunk is passed to consumer(chunk) if given. Returns the average
+        waiting and turnaround times; full metrics end up in self.metrics.
+        """
+        accumulator = MetricsAccumulator(self.table, self.cores)
+        segments = 0
+        with phase(self.stats, "engine and metrics"):
+            for chunk in self.stream():
+                accumulator.add(chunk)
+                segments += len(chunk)
+                if consumer is not None:
+                    consumer(chunk)
+            self.metrics = accumulator.result()
+            self._add_feasibility(self.metrics)
+        if self.stats is not None:
+            self.stats.events += self.events_processed
+            self.stats.segments += segments
+            self.stats.context_switches += self.metrics["context_switches"]
+        return self.metrics["waiting"]["mean"], self.metrics["turnaround"]["mean"]
+
+    def calculate_metrics(self, schedule):
+        """Per-process waiting and turnaround times and their means.
+
+        schedule is a ScheduleTable or the list of segment dicts run() returns.
+        """
+        if not isinstance(schedule, ScheduleTable):
+            schedule = ScheduleTable.from_dicts(schedule, self.table)
+        metrics = compute_metrics(schedule)
+        names = [self.table.name(pid) for pid in metrics["per_process"]["pid"].tolist()]
+        waiting_times = dict(zip(names, metrics["per_process"]["waiting"].tolist()))
+        turnaround_times = dict(
+            zip(names, metrics["per_process"]["turnaround"].tolist())
+        )
+        return (
+            waiting_times,
+            turnaround_times,
+            metrics["waiting"]["mean"],
+            metrics["turnaround"]["mean"],
+        )
+
+    def _multicore(self):
+        if self.algorithm == "MLFQ":
+            raise ValueError("MLFQ runs on a single core only")
+        if self.algorithm not in MULTICORE_ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {self.algorithm}")
+        return MultiCoreEngine(self, self.cores, self.queues)
+
+    def _add_feasibility(self, metrics):
+        """Record in EDF/RMS metrics whether any schedule meets every deadline.
+
+        On one preemptive CPU EDF meets every deadline whenever that is
+        possible at all, so the process set is feasible exactly when an EDF
+        run has no misses. RMS runs check with a separate EDF run. On
+        several cores this is only a sufficient test: global EDF is not
+        optimal there.
+        """
+        if self.algorithm not in DEADLINE_ALGORITHMS:
+            return
+        if self.algorithm == "EDF":
+            misses = metrics["deadline_misses"]
+        else:
+            edf = Scheduler(self.table, "EDF", cores=self.cores, queues=self.queues)
+            edf.run_stream()
+            misses = edf.metrics["deadline_misses"]
+        metrics["feasible"] = misses == 0
+
+    def _first_checkpoint(self):
+        """Event count of the first progress checkpoint, or -1 for none."""
+        if self.progress is None and self.cancel_event is None and not self.streaming:
+            return -1
+        return PROGRESS_INTERVAL
+
+    def _checkpoint(self, events, current_time):
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise SchedulingCancelled()
+        if self.progress is not None:
+            self.progress(events, current_time)
+        return events + PROGRESS_INTERVAL
+
+    def _finish(self, events, current_time, pids, starts, finishes):
+        """Record the event count and wrap the last engine output chunk."""
+        self.events_processed = events
+        if self.progress is not None:
+            self.progress(events, current_time)
+        return ScheduleTable(pids, starts, finishes, self.table)
+
+    def _flush(self, pids, starts, finishes):
+        """Move all but the newest segment out of the engine's lists.
+
+        The newest segment stays behind because Round Robin may still
+        extend it when merging slices.
+        """
+        count = len(pids) - 1
+        chunk = ScheduleTable(
+            pids[:count], starts[:count], finishes[:count], self.table
         )
-        avg_turnaround_time = (
-            sum(turnaround_times.values()) / len(turnaround_times)
-            if turnaround_times
-            else 0
+        del pids[:count], starts[:count], finishes[:count]
+        return chunk
+
+    def _collect(self, chunks):
+        """Join an engine's chunks into one ScheduleTable."""
+        chunks = list(chunks)
+        if len(chunks) == 1:
+            return chunks[0]
+        return ScheduleTable(
+            np.concatenate([chunk.pid for chunk in chunks]),
+            np.concatenate([chunk.start for chunk in chunks]),
+            np.concatenate([chunk.finish for chunk in chunks]),
+            self.table,
         )
-        return waiting_times, turnaround_times, avg_waiting_time, avg_turnaround_time
 
     def fcfs(self):
-        schedule = []
-        start_time = 0
-        for process in sorted(self.processes, key=lambda x: x["Arrival Time"]):
-            start_time = max(start_time, process["Arrival Time"])
-            finish_time = start_time + process["Burst Time"]
-            schedule.append(
-                {
-                    "Process": process["Process"],
-                    "Start": start_time,
-                    "Finish": finish_time,
-                }
+        """First come, first served."""
+        return self._fcfs_table().to_dicts(), None
+
+    def _fcfs_table(self):
+        return self._collect(self._fcfs_chunks())
+
+    def _fcfs_chunks(self):
+        if len(self.table) >= FCFS_VECTORIZE_THRESHOLD:
+            schedule = self.fcfs_vectorized()
+            pid, start, finish = schedule.pid, schedule.start, schedule.finish
+            # Streaming hands the closed-form result out in checkpoint-sized
+            # slices; otherwise it is one chunk
+            step = PROGRESS_INTERVAL if self.streaming else len(schedule)
+            last = (len(schedule) - 1) // step * step
+            for begin in range(0, last, step):
+                yield ScheduleTable(
+                    pid[begin : begin + step],
+                    start[begin : begin + step],
+                    finish[begin : begin + step],
+                    self.table,
+                )
+            yield self._finish(
+                len(schedule),
+                finish[-1].item(),
+                pid[last:],
+                start[last:],
+                finish[last:],
             )
+            return
+        pids, starts, finishes = [], [], []
+        order, arrivals = self.table.order_list, self.table.arrival_list
+        burst = self.table.burst_list
+        start_time = 0
+        events = 0
+        next_checkpoint = self._first_checkpoint()
+        for pid, arrival in zip(order, arrivals):
+            events += 1
+            if events == next_checkpoint:
+                next_checkpoint = self._checkpoint(events, start_time)
+                if self.streaming:
+                    yield self._flush(pids, starts, finishes)
+            start_time = max(start_time, arrival)
+            finish_time = start_time + burst[pid]
+            pids.append(pid)
+            starts.append(start_time)
+            finishes.append(finish_time)
             start_time = finish_time
-        return schedule, None
+        yield self._finish(events, start_time, pids, starts, finishes)
+
+    def fcfs_vectorized(self):
+        """Closed-form FCFS over the whole table without a per-process loop."""
+        order = self.table.order
+        arrival = self.table.sorted_arrival
+        burst = self.table.burst[order]
+        # Work queued before each process if the CPU had never been idle
+        queued_before = np.cumsum(burst) - burst
+        # Idle time inserted so far is the running maximum of how far each
+        # arrival lies beyond the queued work (and never below zero)
+        idle = np.maximum.accumulate(arrival - queued_before)
+        np.maximum(idle, 0, out=idle)
+        start = queued_before + idle
+        return ScheduleTable(order, start, start + burst, self.table)
 
     def srtf(self):
-        schedule = []
-        current_time = 0
-        processes = [dict(p, remaining=p["Burst Time"]) for p in self.processes]
-        processes = sorted(processes, key=lambda x: x["Arrival Time"])
-        executed_process = None
+        """Preemptive SRTF driven by arrival and completion events."""
+        return self._srtf_table().to_dicts(), None
+
+    def _srtf_table(self):
+        return self._collect(self._preemptive_chunks())
+
+    def edf(self):
+        """Preemptive Earliest Deadline First; ties go to the earlier arrival."""
+        return self._edf_table().to_dicts(), None
+
+    def _edf_table(self):
+        return self._collect(self._edf_chunks())
+
+    def _edf_chunks(self):
+        return self._preemptive_chunks(self.table.sorted_deadline_list)
+
+    def rms(self):
+        """Preemptive Rate-Monotonic scheduling.
+
+        Processes are one-shot jobs rather than periodic tasks, so each
+        one's period is taken to be its relative deadline (deadline minus
+        arrival), as for tasks whose deadline is the end of their period.
+        """
+        return self._rms_table().to_dicts(), None
+
+    def _rms_table(self):
+        return self._collect(self._rms_chunks())
+
+    def _rms_chunks(self):
+        deadlines = self.table.sorted_deadline_list
+        arrivals = self.table.arrival_list
+        periods = [d - a for d, a in zip(deadlines, arrivals)]
+        return self._preemptive_chunks(periods)
+
+    def _preemptive_chunks(self, keys=None):
+        """Preemptive engine: the ready process with the smallest key runs.
+
+        keys holds a fixed key per process in arrival order; without it the
+        key is the remaining time, which gives SRTF.
+        """
+        pids, starts, finishes = [], [], []
+        order, arrivals = self.table.order_list, self.table.arrival_list
+        remaining = list(self.table.sorted_burst_list)
+        if keys is None:
+            keys = remaining
+        # Ready heap of (key, arrival order); the running process is kept
+        # outside the heap so its remaining time can change freely
+        ready = []
+        next_arrival = 0
+        current = None
         start_time = None
+        current_time = 0
 
-        while processes:
-            available = [p for p in processes if p["Arrival Time"] <= current_time]
-            if not available:
-                current_time += 1
-                continue
-            current_process = min(available, key=lambda x: x["remaining"])
-            if executed_process != current_process:
-                if executed_process and executed_process["remaining"] > 0:
-                    schedule.append(
-                        {
-                            "Process": executed_process["Process"],
-                            "Start": start_time,
-                            "Finish": current_time,
-                        }
-                    )
-                executed_process = current_process
+        events = 0
+        next_checkpoint = self._first_checkpoint()
+        while next_arrival < len(order) or ready or current is not None:
+            events += 1
+            if events == next_checkpoint:
+                next_checkpoint = self._checkpoint(events, current_time)
+                if self.streaming:
+                    yield self._flush(pids, starts, finishes)
+            # CPU idle: jump straight to the next arrival
+            if current is None and not ready:
+                current_time = max(current_time, arrivals[next_arrival])
+            while next_arrival < len(order) and arrivals[next_arrival] <= current_time:
+                heapq.heappush(ready, (keys[next_arrival], next_arrival))
+                next_arrival += 1
+
+            # Preempt when a newly arrived process has a smaller key
+            if current is not None and ready and ready[0] < (keys[current], current):
+                pids.append(order[current])
+                starts.append(start_time)
+                finishes.append(current_time)
+                heapq.heappush(ready, (keys[current], current))
+                current = None
+            if current is None:
+                _, current = heapq.heappop(ready)
                 start_time = current_time
-            current_process["remaining"] -= 1
-            current_time += 1
-            if current_process["remaining"] == 0:
-                schedule.append(
-                    {
-                        "Process": current_process["Process"],
-                        "Start": start_time,
-                        "Finish": current_time,
-                    }
-                )
-                processes.remove(current_process)
-                executed_process = None
-        return schedule, None
+
+            # Run until the next arrival or the completion, whichever is first
+            finish_time = current_time + remaining[current]
+            if next_arrival < len(order) and arrivals[next_arrival] < finish_time:
+                remaining[current] -= arrivals[next_arrival] - current_time
+                current_time = arrivals[next_arrival]
+            else:
+                remaining[current] = 0
+                current_time = finish_time
+                pids.append(order[current])
+                starts.append(start_time)
+                finishes.append(current_time)
+                current = None
+        yield self._finish(events, current_time, pids, starts, finishes)
 
     def round_robin(self):
-        schedule = []
+        """Round Robin; with merge_slices, back-to-back slices form one segment."""
+        return self._round_robin_table().to_dicts(), None
+
+    def _round_robin_table(self):
+        return self._collect(self._round_robin_chunks())
+
+    def _round_robin_chunks(self):
+        pids, starts, finishes = [], [], []
+        order, arrivals = self.table.order_list, self.table.arrival_list
+        remaining = list(self.table.burst_list)
         current_time = 0
-        processes = [dict(p, remaining=p["Burst Time"]) for p in self.processes]
-        processes = sorted(processes, key=lambda x: x["Arrival Time"])
         queue = deque()
-        while processes or queue:
-            while processes and processes[0]["Arrival Time"] <= current_time:
-                queue.append(processes.pop(0))
+        next_arrival = 0
+        events = 0
+        next_checkpoint = self._first_checkpoint()
+        while next_arrival < len(order) or queue:
+            events += 1
+            if events == next_checkpoint:
+                next_checkpoint = self._checkpoint(events, current_time)
+                if self.streaming:
+                    yield self._flush(pids, starts, finishes)
+            while next_arrival < len(order) and arrivals[next_arrival] <= current_time:
+                queue.append(order[next_arrival])
+                next_arrival += 1
             if not queue:
-                if processes:
-                    current_time = processes[0]["Arrival Time"]
-                else:
-                    break
+                current_time = arrivals[next_arrival]
                 continue
-            current_process = queue.popleft()
+            pid = queue.popleft()
             start_time = current_time
-            execution_time = min(self.quantum, current_process["remaining"])
+            execution_time = min(self.quantum, remaining[pid])
+            if self.merge_slices and not queue:
+                # Nothing else is waiting, so the process keeps the CPU for
+                # every quantum that ends before the next arrival is admitted
+                if next_arrival < len(order):
+                    slices = max(
+                        1, ceil((arrivals[next_arrival] - start_time) / self.quantum)
+                    )
+                else:
+                    slices = ceil(remaining[pid] / self.quantum)
+                execution_time = min(slices * self.quantum, remaining[pid])
             current_time += execution_time
-            current_process["remaining"] -= execution_time
-            schedule.append(
-                {
-                    "Process": current_process["Process"],
-                    "Start": start_time,
-                    "Finish": current_time,
-                }
-            )
-            while processes and processes[0]["Arrival Time"] <= current_time:
-                queue.append(processes.pop(0))
-            if current_process["remaining"] > 0:
-                queue.append(current_process)
-        return schedule, None
+            remaining[pid] -= execution_time
+            if (
+                self.merge_slices
+                and pids
+                and pids[-1] == pid
+                and finishes[-1] == start_time
+            ):
+                finishes[-1] = current_time
+            else:
+                pids.append(pid)
+                starts.append(start_time)
+                finishes.append(current_time)
+            while next_arrival < len(order) and arrivals[next_arrival] <= current_time:
+                queue.append(order[next_arrival])
+                next_arrival += 1
+            if remaining[pid] > 0:
+                queue.append(pid)
+        yield self._finish(events, current_time, pids, starts, finishes)
+
+    def multilevel_feedback(self):
+        """Multi-level feedback queue; see _mlfq_chunks for the rules."""
+        return self._multilevel_feedback_table().to_dicts(), None
+
+    def _multilevel_feedback_table(self):
+        return self._collect(self._mlfq_chunks())
+
+    def _mlfq_chunks(self):
+        """MLFQ driven by arrival, slice-end and boost events.
+
+        New processes enter the top level. The CPU runs the head of the
+        highest non-empty level, Round Robin within a level; a process that
+        uses up its level's quantum moves one level down, and an arrival
+        preempts a process running below the top level, which keeps what it
+        used of its quantum and resumes first on its level. Every boost
+        period all processes go back to the top level.
+
+        A bitmap of non-empty levels finds the next level to serve in O(1).
+        A boost costs O(levels) however many processes wait: the lower
+        levels' deques are chained onto the top level whole, and a process's
+        level and used quantum are reset when it is next dispatched.
+        """
+        options = self.mlfq or mlfq_options(self.quantum)
+        quanta, boost = options["quanta"], options["boost"]
+        bottom = len(quanta) - 1
+        pids, starts, finishes = [], [], []
+        order, arrivals = self.table.order_list, self.table.arrival_list
+        count = len(order)
+        # Indexed by arrival position
+        remaining = list(self.table.sorted_burst_list)
+        level = [0] * count
+        used = [0] * count  # Time used of the current level's quantum
+        stamp = [0] * count  # Boost epoch that level and used belong to
+        epoch = 0
+        top = _ChainedQueue()
+        queues = [top] + [deque() for _ in range(bottom)]
+        occupied = 0  # Bit l is set while queues[l] is non-empty
+        current = None
+        start_time = None
+        current_time = 0
+        next_arrival = 0
+        next_boost = boost
+
+        def admit(now):
+            nonlocal next_arrival, occupied
+            while next_arrival < count and arrivals[next_arrival] <= now:
+                top.append(next_arrival)
+                stamp[next_arrival] = epoch
+                next_arrival += 1
+                occupied |= 1
+
+        events = 0
+        next_checkpoint = self._first_checkpoint()
+        while next_arrival < count or occupied or current is not None:
+            events += 1
+            if events == next_checkpoint:
+                next_checkpoint = self._checkpoint(events, current_time)
+                if self.streaming:
+                    yield self._flush(pids, starts, finishes)
+            if current is None and not occupied:
+                # CPU idle: jump straight to the next arrival; boosts in
+                # between would find nothing to move
+                current_time = max(current_time, arrivals[next_arrival])
+                if boost is not None:
+                    next_boost = (current_time // boost + 1) * boost
+            if next_arrival < count and arrivals[next_arrival] <= current_time:
+                admit(current_time)
+
+            if next_boost is not None and current_time >= next_boost:
+                next_boost += boost
+                epoch += 1
+                for below in range(1, bottom + 1):
+                    if queues[below]:
+                        top.extend_with(queues[below])
+                        queues[below] = deque()
+                occupied = 1 if top else 0
+                if current is not None:
+                    level[current] = used[current] = 0
+                    stamp[current] = epoch
+
+            # A process waiting on a higher level preempts the running one
+            if current is not None and occupied & ((1 << level[current]) - 1):
+                pids.append(order[current])
+                starts.append(start_time)
+                finishes.append(current_time)
+                queues[level[current]].appendleft(current)
+                occupied |= 1 << level[current]
+                current = None
+            if current is None:
+                # Lowest set bit: the highest non-empty level
+                serve = (occupied & -occupied).bit_length() - 1
+                current = queues[serve].popleft()
+                if not queues[serve]:
+                    occupied &= ~(1 << serve)
+                if stamp[current] != epoch:
+                    # Boosted while it waited
+                    level[current] = used[current] = 0
+                    stamp[current] = epoch
+                start_time = current_time
+
+            # Run until the slice ends, the next arrival or the next boost
+            quantum = quanta[level[current]]
+            until = current_time + min(quantum - used[current], remaining[current])
+            if next_arrival < count and arrivals[next_arrival] < until:
+                until = arrivals[next_arrival]
+            if next_boost is not None and next_boost < until:
+                until = next_boost
+            ran = until - current_time
+            remaining[current] -= ran
+            used[current] += ran
+            current_time = until
+            if remaining[current] == 0 or used[current] >= quantum:
+                pids.append(order[current])
+                starts.append(start_time)
+                finishes.append(current_time)
+                if remaining[current] > 0:
+                    # As in Round Robin, arrivals at this instant queue first
+                    if next_arrival < count and arrivals[next_arrival] <= current_time:
+                        admit(current_time)
+                    demoted = min(level[current] + 1, bottom)
+                    level[current] = demoted
+                    used[current] = 0
+                    queues[demoted].append(current)
+                    occupied |= 1 << demoted
+                current = None
+        yield self._finish(events, current_time, pids, starts, finishes)
 
     def priority(self):
-        schedule = []
+        """Non-preemptive priority scheduling; lower values run first."""
+        return self._priority_table().to_dicts(), None
+
+    def _priority_table(self):
+        return self._collect(self._priority_chunks())
+
+    def _priority_chunks(self):
+        priority = self.table.priority_list
+        pids, starts, finishes = [], [], []
+        order, arrivals = self.table.order_list, self.table.arrival_list
+        burst = self.table.burst_list
         current_time = 0
-        processes = [dict(p) for p in self.processes]
-        processes = sorted(processes, key=lambda x: x["Arrival Time"])
-        while processes:
-            available = [p for p in processes if p["Arrival Time"] <= current_time]
-            if not available:
-                current_time += 1
-                continue
-            current_process = min(available, key=lambda x: x["Priority"])
-            start = (
-                current_time
-                if current_time >= current_process["Arrival Time"]
-                else current_process["Arrival Time"]
-            )
-            finish = start + current_process["Burst Time"]
-            schedule.append(
-                {
-                    "Process": current_process["Process"],
-                    "Start": start,
-                    "Finish": finish,
-                }
-            )
+        # Ready heap of (priority, arrival order) fed from an arrival cursor
+        ready = []
+        next_arrival = 0
+        events = 0
+        next_checkpoint = self._first_checkpoint()
+        while next_arrival < len(order) or ready:
+            events += 1
+            if events == next_checkpoint:
+                next_checkpoint = self._checkpoint(events, current_time)
+                if self.streaming:
+                    yield self._flush(pids, starts, finishes)
+            # CPU idle: jump straight to the next arrival
+            if not ready:
+                current_time = max(current_time, arrivals[next_arrival])
+            while next_arrival < len(order) and arrivals[next_arrival] <= current_time:
+                heapq.heappush(ready, (priority[order[next_arrival]], next_arrival))
+                next_arrival += 1
+            _, position = heapq.heappop(ready)
+            pid = order[position]
+            finish = current_time + burst[pid]
+            pids.append(pid)
+            starts.append(current_time)
+            finishes.append(finish)
             current_time = finish
-            processes.remove(current_process)
-        return schedule, None
+        yield self._finish(events, current_time, pids, starts, finishes)
@@ -0,0 +1,171 @@
+import math
+import multiprocessing
+import os
+
+import numpy as np
+
+from logic.compare import ALGORITHMS, run_algorithm
+from logic.metrics import summary_fields
+from logic.process_table import ProcessTable
+from logic.scheduler import QUANTUM_ALGORITHMS
+from logic.workload import Workload
+
+# Normal-approximation multiplier for a 95% confidence interval
+CI_Z = 1.96
+
+
+def parse_config(text):
+    """Parse the 4-line workload config used by "Load From File".
+
+    Line 1: number of processes
+    Line 2: arrival time mean and standard deviation
+    Line 3: burst time mean and standard deviation
+    Line 4: lambda of the exponential priority distribution
+    """
+    lines = text.splitlines()
+    if len(lines) < 4:
+        raise ValueError(
+            "File must contain at least 4 lines with the required parameters."
+        )
+
+    try:
+        count = int(lines[0].strip())
+    except ValueError:
+        raise ValueError("Line 1 must contain the number of processes.")
+
+    try:
+        arrival_mean, arrival_std = (float(x) for x in lines[1].split()[:2])
+    except ValueError:
+        raise ValueError(
+            "Line 2 must contain mean and standard deviation for arrival time."
+        )
+
+    try:
+        burst_mean, burst_std = (float(x) for x in lines[2].split()[:2])
+    except ValueError:
+        raise ValueError(
+            "Line 3 must contain mean and standard deviation for burst time."
+        )
+
+    try:
+        priority_lambda = float(lines[3].strip())
+    except ValueError:
+        raise ValueError("Line 4 must contain lambda for priority.")
+
+    return {
+        "count": count,
+        "arrival_mean": arrival_mean,
+        "arrival_std": arrival_std,
+        "burst_mean": burst_mean,
+        "burst_std": burst_std,
+        "priority_lambda": priority_lambda,
+    }
+
+
+def generate_table(config, rng):
+    """Draw one process set with the same distributions as the GUI generator."""
+    count = config["count"]
+    arrival = np.maximum(
+        0, np.rint(rng.normal(config["arrival_mean"], config["arrival_std"], count))
+    ).astype(np.int64)
+    burst = np.maximum(
+        1, np.rint(rng.normal(config["burst_mean"], config["burst_std"], count))
+    ).astype(np.int64)
+    # Lower values have higher priority; ceil keeps the minimum at 1
+    priority = np.maximum(
+        1, np.ceil(rng.exponential(1 / config["priority_lambda"], count))
+    ).astype(np.int64)
+    # Deadlines leave up to 10 units of slack after an uninterrupted run,
+    # as in the GUI generator
+    deadline = arrival + burst + rng.integers(0, 11, count)
+    return ProcessTable(arrival, burst, priority=priority, deadline=deadline)
+
+
+def run_replicas(config, seeds, algorithms, quantum):
+    """Run every algorithm on one replica per seed.
+
+    Returns {algorithm: {metric: [value per replica]}}.
+    """
+    samples = {algorithm: {} for algorithm in algorithms}
+    for seed in seeds:
+        table = Workload(generate_table(config, np.random.default_rng(seed)))
+        for algorithm in algorithms:
+            result = run_algorithm(
+                table, algorithm, quantum if algorithm in QUANTUM_ALGORITHMS else None
+            )
+            for key, value in summary_fields(result["metrics"]).items():
+                samples[algorithm].setdefault(key, []).append(value)
+    return samples
+
+
+def aggregate(samples):
+    """Mean, standard deviation and 95% confidence interval per metric."""
+    summary = {}
+    for algorithm, metrics in samples.items():
+        summary[algorithm] = {}
+        for key, values in metrics.items():
+            values = np.asarray(values, dtype=float)
+            mean = float(values.mean())
+            std = float(values.std(ddof=1)) if len(values) > 1 else 0.0
+            half_width = CI_Z * std / math.sqrt(len(values))
+            summary[algorithm][key] = {
+                "mean": mean,
+                "std": std,
+                "ci_low": mean - half_width,
+                "ci_high": mean + half_width,
+            }
+    return summary
+
+
+def run_sweep(
+    config,
+    replicas,
+    seed=0,
+    algorithms=ALGORITHMS,
+    quantum=2,
+    workers=None,
+    progress=None,
+):
+    """Monte Carlo sweep: run every algorithm over many seeded replicas.
+
+    Each replica gets its own child seed, so results do not depend on the
+    number of workers. progress(done, total) is called as chunks finish.
+    """
+    children = np.random.SeedSequence(seed).spawn(replicas)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # A few chunks per worker keeps the pool busy without much overhead
+    chunk_count = max(1, min(replicas, workers * 4))
+    chunks = [list(chunk) for chunk in np.array_split(children, chunk_count)]
+
+    samples = {algorithm: {} for algorithm in algorithms}
+    done = 0
+
+    def merge(chunk_samples, chunk_size):
+        nonlocal done
+        for algorithm, metrics in chunk_samples.items():
+            for key, values in metrics.items():
+                samples[algorithm].setdefault(key, []).extend(values)
+        done += chunk_size
+        if progress is not None:
+            progress(done, replicas)
+
+    if workers == 1:
+        for chunk in chunks:
+            merge(run_replicas(config, chunk, algorithms, quantum), len(chunk))
+    else:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes=workers) as pool:
+            pending = [
+                (
+                    pool.apply_async(
+                        run_replicas, (config, chunk, algorithms, quantum)
+                    ),
+                    len(chunk),
+                )
+                for chunk in chunks
+            ]
+            for async_result, chunk_size in pending:
+                merge(async_result.get(), chunk_size)
+
+    return {"replicas": replicas, "seed": seed, "metrics": aggregate(samples)}
@@ -0,0 +1,324 @@
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from logic.process_io import canonical_columns, detect_format, read_processes
+from logic.process_table import NameTable, ProcessTable
+from logic.workload import Workload
+
+# Rows parsed into column arrays at a time
+TRACE_CHUNK_ROWS = 100_000
+
+NUMERIC_COLUMNS = ("Arrival Time", "Burst Time", "Priority", "Deadline")
+OPTIONAL_COLUMNS = ("Priority", "Deadline")
+
+
+class TraceImportCancelled(Exception):
+    pass
+
+
+def import_trace(
+    path,
+    fmt=None,
+    default_priority=None,
+    chunk_rows=TRACE_CHUNK_ROWS,
+    progress=None,
+    cancel_event=None,
+):
+    """Read a CSV or JSONL job trace into a Workload, chunk by chunk.
+
+    Rows never become Python dicts: each chunk of rows is turned into
+    numpy columns and the names into one UTF-8 string table, so memory is
+    a few bytes per value. Optional columns are kept only if every row has
+    them; a missing Priority column is filled with default_priority if
+    given. The processes are sorted by arrival (stably), so process IDs
+    follow arrival order.
+
+    progress(rows, fraction) is called after each chunk; fraction is None
+    when the input size is unknown, e.g. for stdin.
+    """
+    started = time.perf_counter()
+    if path == "-":
+        file = sys.stdin.buffer
+        size = None
+    else:
+        file = open(path, "rb")
+        size = os.fstat(file.fileno()).st_size
+    text = io.TextIOWrapper(file, encoding="utf-8", newline="")
+    try:
+        if fmt is None:
+            fmt = detect_format(path, _peek(file))
+        if fmt == "json" and _is_json_document(_peek(file)):
+            # A JSON document has to be parsed whole; only JSONL streams
+            table = read_processes(text.read(), "json")
+        else:
+            chunks = (
+                _jsonl_chunks(text, chunk_rows)
+                if fmt == "json"
+                else _csv_chunks(text, chunk_rows)
+            )
+            columns = _TraceColumns()
+            for records, first_row in chunks:
+                if cancel_event is not None and cancel_event.is_set():
+                    raise TraceImportCancelled()
+                columns.add(records, first_row)
+                if progress is not None:
+                    fraction = None if not size else min(file.tell() / size, 1.0)
+                    progress(columns.rows, fraction)
+            table = columns.table()
+    finally:
+        if path == "-":
+            # Leave stdin open for the rest of the program
+            text.detach()
+        else:
+            text.close()
+
+    if default_priority is not None:
+        table.fill_missing_priority(default_priority)
+    order = table.arrival_order()
+    reordered = bool(len(order)) and not np.array_equal(order, table.pid)
+    if reordered:
+        table = ProcessTable(
+            table.arrival[order],
+            table.burst[order],
+            priority=None if table.priority is None else table.priority[order],
+            deadline=None if table.deadline is None else table.deadline[order],
+            names=_take_names(table.names, order),
+        )
+    workload = Workload(table)
+    seconds = time.perf_counter() - started
+    return {
+        "processes": workload,
+        "rows": len(workload),
+        "seconds": seconds,
+        "rows_per_second": len(workload) / seconds if seconds > 0 else 0.0,
+        "reordered": reordered,
+    }
+
+
+def _take_names(names, order):
+    if names is None:
+        return None
+    if isinstance(names, NameTable):
+        return names.take(order)
+    return [names[pid] for pid in order.tolist()]
+
+
+def _peek(file):
+    """The start of a binary file as text, without consuming it."""
+    if hasattr(file, "peek"):
+        head = file.peek(4096)[:4096]
+    else:
+        position = file.tell()
+        head = file.read(4096)
+        file.seek(position)
+    return head.decode("utf-8", errors="ignore")
+
+
+def _is_json_document(head):
+    """Whether JSON text starting with head is one document (a list, or an
+    object with a "processes" list) rather than one object per line."""
+    head = head.lstrip()
+    if head[:1] == "[":
+        return True
+    if head[:1] != "{":
+        return False
+    try:
+        first = json.loads(head.split("\n", 1)[0])
+    except json.JSONDecodeError:
+        # An object spread over several lines, or a first line longer than
+        # the peek; read_processes still splits JSONL it can't parse whole
+        return True
+    return isinstance(first, dict) and "processes" in first
+
+
+def _csv_chunks(text, chunk_rows):
+    """Yield ({canonical column: list of raw values}, first row number)."""
+    reader = csv.reader(text)
+    header = next(reader, None)
+    if header is None:
+        return
+    fields = canonical_columns(header)
+    index = {canonical: header.index(field) for canonical, field in fields.items()}
+    width = len(header)
+    row_number = 1
+    while True:
+        rows = list(itertools.islice(reader, chunk_rows))
+        if not rows:
+            return
+        if set(map(len, rows)) != {width}:
+            rows = _check_widths(rows, width, row_number)
+        yield {
+            canonical: [row[i] for row in rows] for canonical, i in index.items()
+        }, row_number
+        row_number += len(rows)
+
+
+def _check_widths(rows, width, first_row):
+    """Drop blank lines; any other row of the wrong width is an error."""
+    kept = []
+    for row in rows:
+        if not row:
+            continue
+        if len(row) != width:
+            raise ValueError(
+                f"Row {first_row + len(kept)}: expected {width} fields,"
+                f" got {len(row)}"
+            )
+        kept.append(row)
+    return kept
+
+
+def _jsonl_chunks(text, chunk_rows):
+    fields = None
+    row_number = 1
+    lines = (line for line in text if line.strip())
+    while True:
+        records = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Row {row_number + len(records)}: {e}")
+            if not isinstance(record, dict):
+                raise ValueError(
+                    f"Row {row_number + len(records)}: expected a JSON object"
+                )
+            records.append(record)
+            if len(records) == chunk_rows:
+                break
+        if not records:
+            return
+        if fields is None:
+            fields = canonical_columns(records[0].keys())
+        yield {
+            canonical: [record.get(field) for record in records]
+            for canonical, field in fields.items()
+        }, row_number
+        row_number += len(records)
+
+
+def _parse_numbers(values, label, first_row):
+    """A numeric array of raw values, int64 where every value is whole."""
+    numbers = None
+    if isinstance(values[0], str):
+        # CSV text; parsing straight into the dtype is much faster than
+        # going through a string array
+        try:
+            return np.array(values, dtype=np.int64)
+        except ValueError:
+            pass
+        try:
+            numbers = np.array(values, dtype=np.float64)
+        except ValueError:
+            pass
+    else:
+        # JSON values: let numpy infer, so floats aren't truncated
+        try:
+            numbers = np.array(values)
+        except ValueError:
+            pass
+        if numbers is not None and numbers.dtype.kind == "i":
+            return numbers.astype(np.int64, copy=False)
+        if numbers is not None and numbers.dtype.kind != "f":
+            # e.g. null, strings or booleans among the numbers
+            numbers = None
+    if numbers is not None and np.isfinite(numbers).all():
+        return numbers
+    # Slow path, only to name the offending row
+    for i, value in enumerate(values):
+        if value is None or value == "":
+            raise ValueError(f"Row {first_row + i}: missing {label}")
+        try:
+            valid = not isinstance(value, bool) and np.isfinite(float(value))
+        except (ValueError, TypeError):
+            valid = False
+        if not valid:
+            raise ValueError(
+                f"Row {first_row + i}: {label} must be a number, got {value!r}"
+            )
+    # Numeric JSON strings such as "3"
+    return _parse_numbers([str(value) for value in values], label, first_row)
+
+
+def _encode_names(names):
+    """UTF-8 bytes of names joined by NUL, with each name's byte range."""
+    data = "\0".join(names).encode("utf-8")
+    separators = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 0)
+    if len(separators) != len(names) - 1:
+        # A name contains NUL itself; fall back to counting each name
+        lengths = np.fromiter(
+            (len(name.encode("utf-8")) + 1 for name in names), np.int64, len(names)
+        )
+        separators = np.cumsum(lengths)[:-1] - 1
+    starts = np.concatenate([[0], separators + 1])
+    ends = np.concatenate([separators, [len(data)]])
+    return data, starts, ends
+
+
+class _TraceColumns:
+    """Column chunks of a trace being imported."""
+
+    def __init__(self):
+        self.rows = 0
+        self.numbers = {}  # Canonical column -> list of arrays
+        self.dropped = set()  # Optional columns some row lacks
+        # Name bytes and byte ranges, one entry per chunk
+        self.name_data = []
+        self.name_starts = []
+        self.name_ends = []
+        self.name_size = 0
+
+    def add(self, records, first_row):
+        count = len(next(iter(records.values())))
+        for label in NUMERIC_COLUMNS:
+            if label not in records or label in self.dropped:
+                continue
+            values = records[label]
+            if label in OPTIONAL_COLUMNS and ("" in values or None in values):
+                self.dropped.add(label)
+                self.numbers.pop(label, None)
+                continue
+            self.numbers.setdefault(label, []).append(
+                _parse_numbers(values, label, first_row)
+            )
+        names = records.get("Process")
+        if names is None:
+            names = [f"P{first_row + i}" for i in range(count)]
+        elif not all(isinstance(name, str) and name for name in names):
+            names = [
+                f"P{first_row + i}" if name is None or name == "" else str(name)
+                for i, name in enumerate(names)
+            ]
+        data, starts, ends = _encode_names(names)
+        self.name_starts.append(starts + self.name_size)
+        self.name_ends.append(ends + self.name_size)
+        self.name_data.append(data)
+        self.name_size += len(data) + 1  # Chunks are joined by NUL too
+        self.rows += count
+
+    def table(self):
+        if not self.rows:
+            raise ValueError("The trace has no processes")
+        columns = {
+            label: np.concatenate(arrays) for label, arrays in self.numbers.items()
+        }
+        names = NameTable(
+            np.concatenate(self.name_starts),
+            np.concatenate(self.name_ends),
+            np.frombuffer(b"\0".join(self.name_data), dtype=np.uint8),
+        )
+        self.name_data = self.name_starts = self.name_ends = None
+        return ProcessTable(
+            columns["Arrival Time"],
+            columns["Burst Time"],
+            priority=columns.get("Priority"),
+            deadline=columns.get("Deadline"),
+            names=names,
+        )
@@ -0,0 +1,153 @@
+import hashlib
+
+import numpy as np
+
+from logic.process_table import NameTable, ProcessTable
+
+
+def column_digest(column):
+    """SHA-256 of a column's dtype and values, independent of memory layout."""
+    digest = hashlib.sha256()
+    column = np.ascontiguousarray(column)
+    digest.update(column.dtype.str.encode())
+    digest.update(column.tobytes())
+    return digest.digest()
+
+
+def _read_only(column):
+    if column is None:
+        return None
+    # A view, so the caller's own array stays writeable
+    view = np.asarray(column).view()
+    view.flags.writeable = False
+    return view
+
+
+def _frozen_names(names):
+    if names is None or isinstance(names, (tuple, NameTable)):
+        return names
+    return tuple(names)
+
+
+class Workload(ProcessTable):
+    """A process set validated, sorted by arrival and indexed once.
+
+    Engines, metrics and the result cache only read from it, so one instance
+    can back any number of runs, e.g. every algorithm of a comparison. The
+    columns are read-only views; build a new Workload after changing the
+    process set.
+    """
+
+    def __init__(self, processes):
+        if not isinstance(processes, ProcessTable):
+            processes = ProcessTable.from_dicts(processes)
+        super().__init__(
+            _read_only(processes.arrival),
+            _read_only(processes.burst),
+            priority=_read_only(processes.priority),
+            deadline=_read_only(processes.deadline),
+            names=_frozen_names(processes.names),
+        )
+        self.validate()
+        # The arrival order, tuples for the engines' per-event loops and
+        # column hashes for the result cache are each built on first use,
+        # so e.g. a cache hit never sorts
+        self._order = self._sorted_arrival = None
+        self._sequences = {}
+        self._digests = {}
+
+    @classmethod
+    def of(cls, processes):
+        """processes itself if it is already a Workload, else a new one."""
+        if isinstance(processes, cls):
+            return processes
+        return cls(processes)
+
+    def validate(self):
+        columns = {"Arrival time": self.arrival, "Burst time": self.burst}
+        if self.priority is not None:
+            columns["Priority"] = self.priority
+        if self.deadline is not None:
+            columns["Deadline"] = self.deadline
+        for label, column in columns.items():
+            if column.dtype.kind not in "iuf":
+                raise ValueError(f"{label} must be numeric")
+            if column.dtype.kind == "f" and not np.isfinite(column).all():
+                raise ValueError(f"{label} must be finite for every process")
+        for label in ("Arrival time", "Burst time"):
+            negative = np.flatnonzero(columns[label] < 0)
+            if len(negative):
+                raise ValueError(
+                    f"{label} of {self.name(int(negative[0]))} must not be negative"
+                )
+
+    @property
+    def order(self):
+        """Process IDs sorted by arrival time, ties kept in input order."""
+        if self._order is None:
+            self._order = _read_only(super().arrival_order())
+        return self._order
+
+    @property
+    def sorted_arrival(self):
+        if self._sorted_arrival is None:
+            self._sorted_arrival = _read_only(self.arrival[self.order])
+        return self._sorted_arrival
+
+    def arrival_order(self):
+        return self.order
+
+    def __getstate__(self):
+        # Worker processes rebuild the caches if they need them
+        state = dict(self.__dict__)
+        state.update(_sequences={}, _digests={})
+        return state
+
+    def _sequence(self, name, build):
+        sequence = self._sequences.get(name)
+        if sequence is None:
+            sequence = self._sequences[name] = tuple(build().tolist())
+        return sequence
+
+    @property
+    def order_list(self):
+        """Process IDs in arrival order."""
+        return self._sequence("order", lambda: self.order)
+
+    @property
+    def arrival_list(self):
+        """Arrival times in arrival order."""
+        return self._sequence("arrival", lambda: self.sorted_arrival)
+
+    @property
+    def burst_list(self):
+        """Burst times indexed by process ID."""
+        return self._sequence("burst", lambda: self.burst)
+
+    @property
+    def sorted_burst_list(self):
+        """Burst times in arrival order."""
+        return self._sequence("sorted burst", lambda: self.burst[self.order])
+
+    @property
+    def priority_list(self):
+        """Priorities indexed by process ID; an empty table needs none."""
+        if self.priority is None:
+            if len(self) == 0:
+                return ()
+            raise ValueError("Priority scheduling needs a priority for every process")
+        return self._sequence("priority", lambda: self.priority)
+
+    @property
+    def sorted_deadline_list(self):
+        """Deadlines in arrival order."""
+        if self.deadline is None:
+            raise ValueError("EDF and RMS need a deadline for every process")
+        return self._sequence("sorted deadline", lambda: self.deadline[self.order])
+
+    def column_digest(self, name):
+        """column_digest() of one column, hashed only once."""
+        digest = self._digests.get(name)
+        if digest is None:
+            digest = self._digests[name] = column_digest(getattr(self, name))
+        return digest
@@ -1,15 +1,15 @@
 import sys
+import time
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QPalette
-from PySide6.QtWidgets import QApplication
+# Run with this flag to print per-module import times and the time until the
+# window is shown, then exit
+STARTUP_REPORT_FLAG = "--startup-report"
 
-from ui.main_window import MainWindow
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
+def apply_dark_palette(app):
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QColor, QPalette
 
-    app.setApplicationName("ShadFlow CPU Scheduler")
     dark_palette = QPalette()
     dark_color = QColor(45, 45, 45)
     nearly_black = QColor(35, 35, 35)
@@ -31,11 +31,53 @@ if __name__ == "__main__":
 
     app.setPalette(dark_palette)
 
+
+def main():
+    started = time.perf_counter()
+    timer = None
+    if STARTUP_REPORT_FLAG in sys.argv:
+        sys.argv.remove(STARTUP_REPORT_FLAG)
+        from logic.profiling import ImportTimer
+
+        timer = ImportTimer()
+        timer.start()
+
+    # Imported here so the startup report can time them
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from ui.main_window import MainWindow
+
+    imported = time.perf_counter()
+    app = QApplication(sys.argv)
+    app.setApplicationName("ShadFlow CPU Scheduler")
+    apply_dark_palette(app)
+
     window = MainWindow()
     window.show()
 
+    if timer is not None:
+
+        def report():
+            timer.stop()
+            print(
+                f"imports: {(imported - started) * 1000:.0f} ms\n"
+                f"window shown: {(time.perf_counter() - started) * 1000:.0f} ms\n"
+                f"matplotlib loaded: {'matplotlib' in sys.modules}\n\n"
+                f"{timer.format()}",
+                file=sys.stderr,
+            )
+            app.quit()
+
+        # Runs once the event loop has handled the window's first events
+        QTimer.singleShot(0, report)
+
     try:
-        sys.exit(app.exec())
+        return app.exec()
     except Exception as e:
         print("An unexpected error occurred:", e)
-        sys.exit(1)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+import pytest
+
+from logic.incremental import IncrementalScheduler
+from logic.process_table import ProcessTable
+from logic.scheduler import Scheduler
+
+
+def random_table(rng, count):
+    # Few distinct arrivals and priorities, so ties and busy periods are common
+    return ProcessTable(
+        [rng.randrange(0, count * 2) for _ in range(count)],
+        [rng.randrange(1, 8) for _ in range(count)],
+        priority=[rng.randrange(1, 6) for _ in range(count)],
+    )
+
+
+def assert_matches_full_run(incremental, algorithm):
+    table = incremental.table
+    expected = Scheduler(
+        ProcessTable(table.arrival.copy(), table.burst.copy(), table.priority.copy()),
+        algorithm,
+    )
+    schedule, waiting, turnaround = expected.run_table()
+    assert np.array_equal(incremental.schedule.pid, schedule.pid)
+    assert np.array_equal(incremental.schedule.start, schedule.start)
+    assert np.array_equal(incremental.schedule.finish, schedule.finish)
+    assert incremental.average_times() == pytest.approx((waiting, turnaround))
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "Priority"])
+def test_random_edits_match_full_run(algorithm):
+    rng = random.Random(algorithm)
+    # Enough processes for several engine checkpoints
+    incremental = IncrementalScheduler(random_table(rng, 300), algorithm)
+    assert_matches_full_run(incremental, algorithm)
+    for _ in range(200):
+        count = len(incremental.table)
+        action = rng.choice(["update", "update", "insert", "delete"])
+        if action == "update":
+            before = incremental.schedule
+            first, end = incremental.update(
+                rng.randrange(count),
+                arrival=rng.choice([None, rng.randrange(0, count * 2)]),
+                burst=rng.choice([None, rng.randrange(1, 8)]),
+                priority=rng.choice([None, rng.randrange(1, 6)]),
+            )
+            # Rows outside the reported range are unchanged
+            after = incremental.schedule
+            for column in ("pid", "start", "finish"):
+                old, new = getattr(before, column), getattr(after, column)
+                assert np.array_equal(old[:first], new[:first])
+                assert np.array_equal(old[end:], new[end:])
+        elif action == "insert":
+            incremental.insert(
+                rng.randrange(count + 1),
+                rng.randrange(0, count * 2),
+                rng.randrange(1, 8),
+                priority=rng.randrange(1, 6),
+            )
+        elif count > 1:
+            incremental.delete(rng.randrange(count))
+        assert_matches_full_run(incremental, algorithm)
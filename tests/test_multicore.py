@@ -0,0 +1,15 @@
+from logic.process_table import ProcessTable
+from logic.scheduler import Scheduler
+
+
+def test_arrival_as_core_frees_takes_that_core():
+    # P4 arrives at t=4 just as P2 finishes on CPU1: it should run there
+    # rather than preempting P3 and moving P3 to another core
+    table = ProcessTable([0, 1, 2, 4, 6], [5, 3, 8, 2, 4])
+    for queues in ("global", "per-core"):
+        scheduler = Scheduler(table, "SRTF", cores=3, queues=queues)
+        schedule, _, _ = scheduler.run_table()
+        assert scheduler.metrics["migrations"] == 0
+        assert scheduler.metrics["context_switches"] == 2
+        p3 = [row for row in schedule.to_dicts() if row["Process"] == "P3"]
+        assert [(row["Start"], row["Finish"]) for row in p3] == [(2, 10)]
@@ -0,0 +1,75 @@
+import os
+
+from logic.process_table import ProcessTable
+from logic.result_cache import ResultCache, result_key
+from logic.scheduler import Scheduler
+
+
+def table(count, offset=0):
+    return ProcessTable(list(range(offset, offset + count)), [2] * count)
+
+
+def run(cache, processes):
+    scheduler = Scheduler(processes, "FCFS", cache=cache)
+    scheduler.run_table()
+    return scheduler.cache_hit
+
+
+def test_key_ignores_names_and_unused_columns():
+    plain = ProcessTable([0, 1], [3, 2])
+    named = ProcessTable([0, 1], [3, 2], priority=[2, 1], names=["A", "B"])
+    assert result_key(plain, "FCFS") == result_key(named, "FCFS")
+    assert result_key(plain, "FCFS", quantum=4) == result_key(plain, "FCFS")
+    assert result_key(plain, "Round Robin", 2) != result_key(plain, "Round Robin", 3)
+    assert result_key(named, "Priority") != result_key(
+        ProcessTable([0, 1], [3, 2], priority=[1, 2]), "Priority"
+    )
+
+
+def test_memory_evicts_least_recently_used_by_bytes():
+    cache = ResultCache()
+    run(cache, table(100))
+    entry_bytes = cache.stats()["bytes"]
+    cache = ResultCache(max_bytes=int(entry_bytes * 2.5))
+    first, second, third = table(100), table(100, 1), table(100, 2)
+    run(cache, first)
+    run(cache, second)
+    assert run(cache, first)
+    run(cache, third)
+    assert len(cache) == 2
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    assert run(cache, first)
+    assert not run(cache, second)
+
+
+def test_entry_over_budget_is_not_kept_in_memory():
+    cache = ResultCache(max_bytes=1)
+    run(cache, table(10))
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_disk_store_is_pruned_oldest_first(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    run(cache, table(100))
+    (only,) = os.listdir(tmp_path)
+    file_bytes = os.path.getsize(tmp_path / only)
+    cache.clear(disk=True)
+
+    cache = ResultCache(
+        max_entries=0, directory=str(tmp_path), max_disk_bytes=int(file_bytes * 2.5)
+    )
+    first, second, third = table(100), table(100, 1), table(100, 2)
+    run(cache, first)
+    run(cache, second)
+    # Age the files explicitly; mtimes may not differ within one test
+    for age, processes in ((200, first), (100, second)):
+        path = tmp_path / f"{result_key(processes, 'FCFS')}.npz"
+        os.utime(path, (0, os.path.getmtime(path) - age))
+    # Loading the oldest file marks it as recently used
+    assert run(cache, first)
+    run(cache, third)
+    assert sorted(os.listdir(tmp_path)) == sorted(
+        f"{result_key(processes, 'FCFS')}.npz" for processes in (first, third)
+    )
+    assert cache.stats()["disk_hits"] == 1
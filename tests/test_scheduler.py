@@ -0,0 +1,33 @@
+from logic.scheduler import Scheduler
+
+PROCESSES = [
+    {"Process": "A", "Arrival Time": 0, "Burst Time": 3},
+    {"Process": "B", "Arrival Time": 1, "Burst Time": 2},
+]
+
+
+def test_engine_methods_return_segment_dicts():
+    scheduler = Scheduler(PROCESSES, "FCFS")
+    for engine in (scheduler.fcfs, scheduler.srtf, scheduler.round_robin):
+        scheduler.quantum = 5
+        assert engine() == (
+            [
+                {"Process": "A", "Start": 0, "Finish": 3},
+                {"Process": "B", "Start": 3, "Finish": 5},
+            ],
+            None,
+        )
+
+
+def test_empty_priority_run():
+    assert Scheduler([], "Priority").run() == ([], 0.0, 0.0)
+
+
+def test_calculate_metrics_accepts_segment_dicts():
+    scheduler = Scheduler(PROCESSES, "FCFS")
+    assert scheduler.calculate_metrics(scheduler.run()[0]) == (
+        {"A": 0, "B": 2},
+        {"A": 3, "B": 4},
+        1.0,
+        3.5,
+    )
@@ -0,0 +1,237 @@
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import (
+    QDialog,
+    QGroupBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QScrollArea,
+    QTableView,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from logic.compare import available_algorithms
+from logic.multicore import GLOBAL_QUEUE
+from ui.table_models import ScheduleTableModel
+from ui.workers import ComparisonJob
+from visuals.gantt_chart import GanttChart
+
+
+class ComparisonDialog(QDialog):
+    """Algorithm comparison that fills in as each algorithm finishes."""
+
+    # Emitted with the results in algorithm order once every algorithm is done
+    comparison_finished = Signal(list)
+    # Emitted with the status text when the comparison fails or is cancelled
+    comparison_stopped = Signal(str)
+    export_requested = Signal(list)
+
+    def __init__(
+        self,
+        processes,
+        algorithms=None,
+        quantum=2,
+        cache=None,
+        cores=1,
+        queues=GLOBAL_QUEUE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.setWindowTitle("Algorithm Comparison")
+        self.setMinimumSize(1200, 800)  # Larger size to fit all charts
+        self.processes = processes
+        if algorithms is None:
+            # Every algorithm the process set and machine support
+            algorithms = available_algorithms(processes, cores=cores)
+        self.algorithms = list(algorithms)
+        self.results = {}
+        self.best_algorithm = None
+
+        # Use scroll area to ensure all content is accessible
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_content = QWidget()
+        layout = QVBoxLayout(scroll_content)
+
+        # Progress and cancel controls
+        progress_layout = QHBoxLayout()
+        self.progress_label = QLabel("Starting comparison...")
+        progress_layout.addWidget(self.progress_label)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel)
+        progress_layout.addWidget(self.cancel_button, alignment=Qt.AlignRight)
+        layout.addLayout(progress_layout)
+
+        # Results table, one row per algorithm filled in as results arrive
+        headers = ["Algorithm", "Avg. Waiting Time", "Avg. Turnaround Time"]
+        if processes.deadline is not None:
+            headers.append("Deadline Misses")
+        self.results_table = QTableWidget(len(self.algorithms), len(headers))
+        self.results_table.setHorizontalHeaderLabels(headers)
+        self.results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.results_table.setMaximumHeight(150)
+        for i, algorithm in enumerate(self.algorithms):
+            self.results_table.setItem(i, 0, QTableWidgetItem(algorithm))
+            for column in range(1, len(headers)):
+                self.results_table.setItem(i, column, QTableWidgetItem("Running..."))
+        layout.addWidget(QLabel("<b>Performance Comparison:</b>"))
+        layout.addWidget(self.results_table)
+
+        self.summary = QLabel("")
+        self.summary.setStyleSheet("color: green; font-size: 14px;")
+        layout.addWidget(self.summary)
+
+        # A placeholder section per algorithm keeps the display order stable
+        self.sections = {}
+        for algorithm in self.algorithms:
+            section = QGroupBox(algorithm)
+            section.setStyleSheet("QGroupBox { font-weight: bold; font-size: 16px; }")
+            section_layout = QVBoxLayout(section)
+            section_layout.addWidget(QLabel("Running..."))
+            self.sections[algorithm] = section
+            layout.addWidget(section)
+
+        # Add export button
+        self.export_button = QPushButton("Export Results")
+        self.export_button.setEnabled(False)
+        self.export_button.clicked.connect(
+            lambda: self.export_requested.emit(self.ordered_results())
+        )
+        layout.addWidget(self.export_button, alignment=Qt.AlignCenter)
+
+        # Set up scroll area
+        scroll_area.setWidget(scroll_content)
+        dialog_layout = QVBoxLayout(self)
+        dialog_layout.addWidget(scroll_area)
+
+        self.job = ComparisonJob(
+            processes, self.algorithms, quantum, cache, cores, queues, parent=self
+        )
+        self.job.result_ready.connect(self.add_result)
+        self.job.progress.connect(self.update_progress)
+        self.job.failed.connect(self.show_failure)
+        self.job.finished.connect(self.on_job_finished)
+
+    def start(self):
+        self.job.start()
+
+    def cancel(self):
+        self.job.cancel()
+        self.cancel_button.setEnabled(False)
+        self.progress_label.setText("Cancelling...")
+
+    def done(self, result):
+        # Stop the workers when the dialog is closed mid-run
+        if self.job.isRunning():
+            # Report the cancellation now; the dialog may be gone by the time
+            # the job's finished signal would arrive
+            self.job.finished.disconnect(self.on_job_finished)
+            self.job.cancel()
+            self.job.wait()
+            self.on_job_finished()
+        super().done(result)
+
+    def ordered_results(self):
+        return [self.results[a] for a in self.algorithms if a in self.results]
+
+    def update_progress(self, done, total):
+        self.progress_label.setText(f"Completed {done} of {total} algorithms")
+
+    def show_failure(self, message):
+        self.progress_label.setText(f"Comparison failed: {message}")
+
+    def add_result(self, result):
+        alg_name = result["algorithm"]
+        self.results[alg_name] = result
+        schedule = result["schedule"]
+
+        row = self.algorithms.index(alg_name)
+        self.results_table.setItem(
+            row, 1, QTableWidgetItem(f"{result['avg_waiting_time']:.2f}")
+        )
+        self.results_table.setItem(
+            row, 2, QTableWidgetItem(f"{result['avg_turnaround_time']:.2f}")
+        )
+        metrics = result["metrics"]
+        if "deadline_misses" in metrics:
+            self.results_table.setItem(
+                row, 3, QTableWidgetItem(f"{metrics['deadline_misses']:,}")
+            )
+
+        section = self.sections[alg_name]
+        alg_layout = section.layout()
+        # Drop the "Running..." placeholder
+        placeholder = alg_layout.takeAt(0).widget()
+        placeholder.deleteLater()
+
+        # Add metrics for this algorithm
+        text = (
+            f"Average Waiting Time: {result['avg_waiting_time']:.2f} units | "
+            f"Average Turnaround Time: {result['avg_turnaround_time']:.2f} units"
+        )
+        if "deadline_misses" in metrics:
+            text += (
+                f" | Deadline Misses: {metrics['deadline_misses']:,}"
+                f" | Lateness p95: {metrics['lateness']['p95']:.2f}"
+            )
+        if "feasible" in metrics:
+            text += " | Feasible" if metrics["feasible"] else " | Infeasible"
+        metrics_label = QLabel(text)
+        alg_layout.addWidget(metrics_label)
+
+        # Add schedule table, a view over the schedule arrays
+        schedule_table = QTableView()
+        schedule_table.setModel(ScheduleTableModel(schedule, schedule_table))
+        schedule_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        schedule_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        schedule_table.setMaximumHeight(200)
+
+        alg_layout.addWidget(QLabel("<b>Schedule:</b>"))
+        alg_layout.addWidget(schedule_table)
+
+        # Add Gantt chart for this algorithm
+        alg_layout.addWidget(QLabel("<b>Gantt Chart:</b>"))
+        chart = GanttChart()
+        chart.update_chart(schedule, self.processes)
+        chart.setMinimumHeight(250)  # Set minimum height to ensure visibility
+        alg_layout.addWidget(chart)
+
+    def on_job_finished(self):
+        self.cancel_button.setEnabled(False)
+        results = self.ordered_results()
+        if len(results) < len(self.algorithms):
+            if self.job.is_cancelled():
+                self.progress_label.setText(
+                    f"Cancelled after {len(results)} of {len(self.algorithms)} algorithms"
+                )
+            self.comparison_stopped.emit(self.progress_label.text())
+            return
+
+        # Track best algorithm based on waiting time
+        best = min(results, key=lambda x: x["avg_waiting_time"])
+        self.best_algorithm = best["algorithm"]
+
+        # Highlight best algorithm in the table
+        row = self.algorithms.index(self.best_algorithm)
+        for j in range(self.results_table.columnCount()):
+            self.results_table.item(row, j).setBackground(
+                QColor(152, 251, 152)
+            )  # Light green
+        section = self.sections[self.best_algorithm]
+        section.setTitle(f"{self.best_algorithm} [BEST]")
+        section.setStyleSheet(
+            "QGroupBox { color: green; font-weight: bold; font-size: 16px; }"
+        )
+
+        self.summary.setText(
+            f"<b>Best Algorithm:</b> {self.best_algorithm} with "
+            f"{best['avg_waiting_time']:.2f} avg. waiting time"
+        )
+        self.progress_label.setText("Comparison complete")
+        self.export_button.setEnabled(True)
+        self.comparison_finished.emit(results)
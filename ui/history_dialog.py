@@ -0,0 +1,131 @@
+import datetime
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from logic.compare import ALGORITHMS
+
+# Newest runs listed at once
+HISTORY_LIMIT = 500
+
+# Longest wait, in seconds, for queued runs before listing without them
+FLUSH_TIMEOUT = 2
+
+HISTORY_HEADERS = [
+    "ID",
+    "Time",
+    "Algorithm",
+    "Quantum",
+    "Cores",
+    "Processes",
+    "Avg. Waiting Time",
+    "Avg. Turnaround Time",
+    "Workload",
+]
+
+
+class HistoryDialog(QDialog):
+    """Lists recorded runs; opening one shows it without re-simulating."""
+
+    # Emitted with the ID of the run to open
+    run_selected = Signal(int)
+
+    def __init__(self, history, current_workload=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Run History")
+        self.setMinimumSize(900, 500)
+        self.history = history
+        # Hash of the process set in the main window, for the filter
+        self.current_workload = current_workload
+
+        layout = QVBoxLayout(self)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Algorithm:"))
+        self.algorithm_filter = QComboBox()
+        self.algorithm_filter.addItems(["All"] + ALGORITHMS)
+        self.algorithm_filter.currentTextChanged.connect(self.refresh)
+        filter_layout.addWidget(self.algorithm_filter)
+        self.workload_filter = QCheckBox("Only the current process set")
+        self.workload_filter.setEnabled(current_workload is not None)
+        self.workload_filter.toggled.connect(self.refresh)
+        filter_layout.addWidget(self.workload_filter)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self.runs_table = QTableWidget(0, len(HISTORY_HEADERS))
+        self.runs_table.setHorizontalHeaderLabels(HISTORY_HEADERS)
+        self.runs_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.runs_table.verticalHeader().setVisible(False)
+        self.runs_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.runs_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.runs_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.runs_table.cellDoubleClicked.connect(lambda row, column: self.open_run())
+        layout.addWidget(self.runs_table)
+
+        button_layout = QHBoxLayout()
+        self.status_label = QLabel("")
+        button_layout.addWidget(self.status_label)
+        open_button = QPushButton("Open")
+        open_button.clicked.connect(self.open_run)
+        button_layout.addWidget(open_button, alignment=Qt.AlignRight)
+        layout.addLayout(button_layout)
+
+        self.refresh()
+
+    def refresh(self):
+        algorithm = self.algorithm_filter.currentText()
+        # Include runs the writer thread hasn't committed yet
+        flushed = self.history.flush(FLUSH_TIMEOUT)
+        runs = self.history.runs(
+            algorithm=None if algorithm == "All" else algorithm,
+            workload=(
+                self.current_workload if self.workload_filter.isChecked() else None
+            ),
+            limit=HISTORY_LIMIT,
+        )
+        self.runs_table.setRowCount(len(runs))
+        for row, run in enumerate(runs):
+            created = datetime.datetime.fromtimestamp(run["created"])
+            values = [
+                str(run["id"]),
+                created.strftime("%Y-%m-%d %H:%M:%S"),
+                run["algorithm"],
+                "" if run["quantum"] is None else str(run["quantum"]),
+                str(run["metrics"].get("cores", 1)),
+                f"{run['process_count']:,}",
+                f"{run['avg_waiting_time']:.2f}",
+                f"{run['avg_turnaround_time']:.2f}",
+                run["workload_hash"][:12],
+            ]
+            for column, value in enumerate(values):
+                self.runs_table.setItem(row, column, QTableWidgetItem(value))
+        self.status_label.setText(
+            f"{len(runs)} run(s)"
+            + (" (newest shown)" if len(runs) == HISTORY_LIMIT else "")
+            + ("" if flushed else " | Some runs are still being saved")
+        )
+        if self.history.last_error is not None:
+            self.status_label.setText(
+                self.status_label.text()
+                + f" | Last write failed: {self.history.last_error}"
+            )
+
+    def open_run(self):
+        row = self.runs_table.currentRow()
+        if row < 0:
+            return
+        self.run_selected.emit(int(self.runs_table.item(row, 0).text()))
+        self.accept()
@@ -4,12 +4,13 @@ import random
 import sys
 from math import ceil, floor
 
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QIcon
+import numpy as np
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QAbstractItemView,
+    QCheckBox,
     QComboBox,
-    QDialog,
     QDockWidget,
     QDoubleSpinBox,
     QFileDialog,
@@ -22,16 +23,41 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QScrollArea,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from logic.scheduler import Scheduler
-from visuals.gantt_chart import GanttChart
+from logic.incremental import INCREMENTAL_ALGORITHMS, IncrementalScheduler
+from logic.multicore import QUEUE_MODES
+from logic.profiling import RunStats, phase
+from logic.result_cache import ResultCache
+from logic.run_history import HISTORY_FILE, RunHistory, workload_hash
+from logic.scheduler import DEADLINE_ALGORITHMS, QUANTUM_ALGORITHMS
+from logic.schedule_file import FILE_EXTENSION, load_schedule, write_schedule
+from logic.sweep import parse_config
+from ui.history_dialog import HistoryDialog
+from ui.table_models import ProcessTableModel, ScheduleTableModel
+from ui.workers import ScheduleJob, TraceImportJob
+
+# Repeated "Generate" clicks within this window start a single run
+GENERATE_DEBOUNCE_MS = 250
+
+
+def metrics_summary(metrics):
+    """Core and deadline figures of a run, for the end of the metrics label."""
+    text = ""
+    if metrics.get("cores", 1) > 1:
+        text += (
+            f" | {metrics['cores']} cores, {metrics['cpu_utilisation']:.0%} busy,"
+            f" {metrics['migrations']:,} migrations"
+        )
+    if "deadline_misses" in metrics:
+        text += f" | Deadline Misses: {metrics['deadline_misses']:,}"
+    if "feasible" in metrics:
+        text += " (feasible)" if metrics["feasible"] else " (infeasible)"
+    return text
 
 
 class MainWindow(QMainWindow):
@@ -48,8 +74,15 @@ class MainWindow(QMainWindow):
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
-        # Default output file
-        self.output_file = os.path.join(self.output_dir, "scheduling_results.txt")
+        # Every run is recorded here by a background writer and can be
+        # reopened from "Run History"
+        self.run_history = RunHistory(os.path.join(self.output_dir, HISTORY_FILE))
+
+        # Reruns of the same process set, algorithm and quantum reuse earlier
+        # results, including ones from previous sessions
+        self.result_cache = ResultCache(
+            directory=os.path.join(self.output_dir, "cache")
+        )
 
         # Set up central widget and main layout
         central_widget = QWidget()
@@ -83,7 +116,9 @@ class MainWindow(QMainWindow):
         dock_layout.addWidget(alg_label)
 
         self.algorithm_selector = QComboBox()
-        self.algorithm_selector.addItems(["FCFS", "SRTF", "Priority", "Round Robin"])
+        self.algorithm_selector.addItems(
+            ["FCFS", "SRTF", "Priority", "Round Robin", "EDF", "RMS", "MLFQ"]
+        )
         self.algorithm_selector.setStyleSheet("font-size: 13px; color: #000;")
         self.algorithm_selector.currentTextChanged.connect(self.on_algorithm_changed)
         dock_layout.addWidget(self.algorithm_selector)
@@ -93,11 +128,12 @@ class MainWindow(QMainWindow):
         table_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #FFFFFF;")
         dock_layout.addWidget(table_label)
 
-        self.process_table = QTableWidget(0, 5)
-        self.process_table.setHorizontalHeaderLabels(
-            ["Process", "Arrival Time", "Burst Time", "Priority", "Deadline"]
-        )
+        # Model/view table: only the visible rows are ever formatted
+        self.process_model = ProcessTableModel(self)
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
         self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.process_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.process_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.process_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.process_table.setEditTriggers(
@@ -105,6 +141,12 @@ class MainWindow(QMainWindow):
         )
         dock_layout.addWidget(self.process_table)
 
+        # The last FCFS/Priority run, kept so edits can be applied to it
+        self.live_run = None
+        self.live_schedule = None
+        self.process_model.dataChanged.connect(self.on_process_edited)
+        self.process_model.modelReset.connect(self.end_live_updates)
+
         # Quantum input
         self.quantum_input = QSpinBox()
         self.quantum_input.setRange(1, 100)
@@ -114,6 +156,29 @@ class MainWindow(QMainWindow):
         self.quantum_input.setVisible(False)
         dock_layout.addWidget(self.quantum_input)
 
+        # Simulated machine: cores and, with more than one, where ready
+        # processes wait
+        machine_layout = QHBoxLayout()
+        self.cores_input = QSpinBox()
+        self.cores_input.setRange(1, 256)
+        self.cores_input.setValue(1)
+        self.cores_input.setPrefix("Cores: ")
+        self.cores_input.setStyleSheet("font-size: 13px; color: #FFFFFF;")
+        self.cores_input.valueChanged.connect(
+            lambda cores: self.queue_selector.setEnabled(cores > 1)
+        )
+        machine_layout.addWidget(self.cores_input)
+        self.queue_selector = QComboBox()
+        self.queue_selector.addItems(QUEUE_MODES)
+        self.queue_selector.setToolTip(
+            "global: one ready queue shared by all cores\n"
+            "per-core: a queue per core; idle cores steal work"
+        )
+        self.queue_selector.setStyleSheet("font-size: 13px; color: #000;")
+        self.queue_selector.setEnabled(False)
+        machine_layout.addWidget(self.queue_selector)
+        dock_layout.addLayout(machine_layout)
+
         # Statistical parameters group for random data generation
         stats_group = QGroupBox("Random Data Parameters")
         stats_group.setStyleSheet("color: #FFFFFF; font-weight: bold;")
@@ -184,7 +249,19 @@ class MainWindow(QMainWindow):
             "Load process parameters from a configuration file"
         )
         import_config_button.clicked.connect(self.load_config_from_file)
-        dock_layout.addWidget(import_config_button, alignment=Qt.AlignCenter)
+        import_trace_button = QPushButton("Import Trace")
+        import_trace_button.setStyleSheet(import_config_button.styleSheet())
+        import_trace_button.setToolTip(
+            "Replace the processes with a CSV or JSONL job trace"
+        )
+        import_trace_button.clicked.connect(self.import_trace_file)
+        import_layout = QHBoxLayout()
+        import_layout.addStretch()
+        import_layout.addWidget(import_config_button)
+        import_layout.addWidget(import_trace_button)
+        import_layout.addStretch()
+        dock_layout.addLayout(import_layout)
+        self.trace_job = None
 
         # Unified button style
         button_style = """
@@ -215,13 +292,50 @@ class MainWindow(QMainWindow):
 
         dock_layout.addLayout(extra_actions_layout)
 
-        # Generate button
-        generate_button = QPushButton("Generate Schedule")
-        generate_button.setStyleSheet(
+        # Row editing; after an FCFS or Priority run, edits, inserts and
+        # deletes patch the shown schedule instead of needing a new run
+        row_actions_layout = QHBoxLayout()
+
+        add_process_button = QPushButton("Add Process")
+        add_process_button.setStyleSheet(button_style)
+        add_process_button.clicked.connect(self.add_process)
+        row_actions_layout.addWidget(add_process_button)
+
+        remove_process_button = QPushButton("Remove Process")
+        remove_process_button.setStyleSheet(button_style)
+        remove_process_button.clicked.connect(self.remove_process)
+        row_actions_layout.addWidget(remove_process_button)
+
+        dock_layout.addLayout(row_actions_layout)
+
+        # Generate button; clicks are debounced so a burst of clicks
+        # starts only one run
+        self.generate_debounce = QTimer(self)
+        self.generate_debounce.setSingleShot(True)
+        self.generate_debounce.setInterval(GENERATE_DEBOUNCE_MS)
+        self.generate_debounce.timeout.connect(self.generate_schedule)
+
+        generate_layout = QHBoxLayout()
+        self.generate_button = QPushButton("Generate Schedule")
+        self.generate_button.setStyleSheet(
             button_style + "font-size: 14px; padding: 8px 15px;"
         )
-        generate_button.clicked.connect(self.generate_schedule)
-        dock_layout.addWidget(generate_button, alignment=Qt.AlignCenter)
+        self.generate_button.clicked.connect(self.generate_debounce.start)
+        generate_layout.addWidget(self.generate_button)
+
+        # Cancel button, shown only while a run is in progress
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setStyleSheet(
+            button_style.replace("#4CAF50", "#C0392B")
+            + "font-size: 14px; padding: 8px 15px;"
+        )
+        self.cancel_button.clicked.connect(self.cancel_schedule)
+        self.cancel_button.setVisible(False)
+        generate_layout.addWidget(self.cancel_button)
+        dock_layout.addLayout(generate_layout)
+        self.schedule_job = None
+        # (algorithm, quantum) of the schedule in the output table
+        self.shown_algorithm = None
 
         # Compare All Algorithms button
         compare_button = QPushButton("Compare All Algorithms")
@@ -246,6 +360,45 @@ class MainWindow(QMainWindow):
         compare_button.clicked.connect(self.compare_all_algorithms)
         dock_layout.addWidget(compare_button, alignment=Qt.AlignCenter)
 
+        saved_runs_layout = QHBoxLayout()
+        history_button = QPushButton("Run History")
+        history_button.setStyleSheet(button_style)
+        history_button.setToolTip("Browse and reopen earlier runs")
+        history_button.clicked.connect(self.show_run_history)
+        saved_runs_layout.addWidget(history_button)
+        save_schedule_button = QPushButton("Save Schedule")
+        save_schedule_button.setStyleSheet(button_style)
+        save_schedule_button.setToolTip(
+            "Save the schedule and its processes in the binary schedule format"
+        )
+        save_schedule_button.clicked.connect(self.save_schedule_file)
+        saved_runs_layout.addWidget(save_schedule_button)
+        open_schedule_button = QPushButton("Open Schedule")
+        open_schedule_button.setStyleSheet(button_style)
+        open_schedule_button.setToolTip(
+            "Browse a saved schedule without loading it all into memory"
+        )
+        open_schedule_button.clicked.connect(self.open_schedule_file)
+        saved_runs_layout.addWidget(open_schedule_button)
+        dock_layout.addLayout(saved_runs_layout)
+
+        # Run diagnostics: per-phase timings of the last run, collected only
+        # while the group is checked
+        self.diagnostics_group = QGroupBox("Run diagnostics")
+        self.diagnostics_group.setCheckable(True)
+        self.diagnostics_group.setChecked(False)
+        diagnostics_layout = QVBoxLayout()
+        self.track_memory_checkbox = QCheckBox("Track peak memory (slower)")
+        diagnostics_layout.addWidget(self.track_memory_checkbox)
+        self.diagnostics_label = QLabel("Enable and generate a schedule.")
+        self.diagnostics_label.setStyleSheet(
+            "font-family: monospace; font-size: 11px; color: #E0E0E0;"
+        )
+        self.diagnostics_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        diagnostics_layout.addWidget(self.diagnostics_label)
+        self.diagnostics_group.setLayout(diagnostics_layout)
+        dock_layout.addWidget(self.diagnostics_group)
+
         # Separator line
         spacer_frame = QFrame()
         spacer_frame.setFrameShape(QFrame.HLine)
@@ -271,11 +424,11 @@ class MainWindow(QMainWindow):
         )
         right_layout.addWidget(output_label)
 
-        self.output_table = QTableWidget(0, 3)
-        self.output_table.setHorizontalHeaderLabels(
-            ["Process", "Start Time", "Finish Time"]
-        )
+        self.output_model = ScheduleTableModel(parent=self)
+        self.output_table = QTableView()
+        self.output_table.setModel(self.output_model)
         self.output_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.output_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         right_layout.addWidget(self.output_table)
 
         # Metrics display
@@ -285,9 +438,14 @@ class MainWindow(QMainWindow):
         )
         right_layout.addWidget(self.metrics_label)
 
-        # Gantt chart
-        self.chart = GanttChart()
-        right_layout.addWidget(self.chart)
+        # Gantt chart. matplotlib takes longer to import than the rest of
+        # the window, so the chart is created on first use (gantt_chart())
+        self.chart = None
+        self.chart_layout = right_layout
+        self.chart_placeholder = QLabel("The Gantt chart appears after the first run")
+        self.chart_placeholder.setAlignment(Qt.AlignCenter)
+        self.chart_placeholder.setStyleSheet("color: #808080; font-size: 13px;")
+        right_layout.addWidget(self.chart_placeholder)
 
         # Finalize right side
         right_container = QWidget()
@@ -300,8 +458,8 @@ class MainWindow(QMainWindow):
     def on_algorithm_changed(self, algorithm):
         priority_required = algorithm == "Priority"
         self.process_table.setColumnHidden(3, not priority_required)
-        self.process_table.setColumnHidden(4, True)
-        self.quantum_input.setVisible(algorithm == "Round Robin")
+        self.process_table.setColumnHidden(4, algorithm not in DEADLINE_ALGORITHMS)
+        self.quantum_input.setVisible(algorithm in QUANTUM_ALGORITHMS)
 
     def load_config_from_file(self):
         """Load process configuration from a text file."""
@@ -317,93 +475,104 @@ class MainWindow(QMainWindow):
 
         try:
             with open(file_path, "r") as file:
-                lines = file.readlines()
-
-                if len(lines) < 4:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Format",
-                        "File must contain at least 4 lines with the required parameters.",
-                    )
-                    return
-
-                # Parse number of processes
-                try:
-                    num_processes = int(lines[0].strip())
-                except ValueError:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Format",
-                        "Line 1 must contain the number of processes.",
-                    )
-                    return
-
-                # Parse arrival time mean and std dev
-                try:
-                    arrival_params = lines[1].strip().split()
-                    if len(arrival_params) < 2:
-                        raise ValueError("Not enough parameters")
-                    arrival_mean = float(arrival_params[0])
-                    arrival_std = float(arrival_params[1])
-                except (ValueError, IndexError):
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Format",
-                        "Line 2 must contain mean and standard deviation for arrival time.",
-                    )
-                    return
-
-                # Parse burst time mean and std dev
                 try:
-                    burst_params = lines[2].strip().split()
-                    if len(burst_params) < 2:
-                        raise ValueError("Not enough parameters")
-                    burst_mean = float(burst_params[0])
-                    burst_std = float(burst_params[1])
-                except (ValueError, IndexError):
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Format",
-                        "Line 3 must contain mean and standard deviation for burst time.",
-                    )
-                    return
-
-                # Parse lambda for priority
-                try:
-                    priority_lambda = float(lines[3].strip())
-                except ValueError:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Format",
-                        "Line 4 must contain lambda for priority.",
-                    )
+                    config = parse_config(file.read())
+                except ValueError as e:
+                    QMessageBox.warning(self, "Invalid Format", str(e))
                     return
 
-                # Update the UI controls with loaded values
-                self.arrival_mean.setValue(arrival_mean)
-                self.arrival_std.setValue(arrival_std)
-                self.burst_mean.setValue(burst_mean)
-                self.burst_std.setValue(burst_std)
+            # Update the UI controls with loaded values
+            self.arrival_mean.setValue(config["arrival_mean"])
+            self.arrival_std.setValue(config["arrival_std"])
+            self.burst_mean.setValue(config["burst_mean"])
+            self.burst_std.setValue(config["burst_std"])
 
-                # Generate the processes with the loaded parameters
-                self.generate_from_config(num_processes, priority_lambda)
+            # Generate the processes with the loaded parameters
+            self.generate_from_config(config["count"], config["priority_lambda"])
 
-                QMessageBox.information(
-                    self,
-                    "Configuration Loaded",
-                    f"Successfully loaded configuration for {num_processes} processes.",
-                )
+            QMessageBox.information(
+                self,
+                "Configuration Loaded",
+                f"Successfully loaded configuration for {config['count']} processes.",
+            )
 
         except Exception as e:
             QMessageBox.critical(
                 self, "Error", f"Failed to load configuration: {str(e)}"
             )
 
+    def import_trace_file(self):
+        """Replace the process table with a job trace, read in chunks."""
+        if self.trace_job is not None or self.schedule_job is not None:
+            return
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Job Trace",
+            "",
+            "Job Traces (*.csv *.jsonl *.json);;All Files (*)",
+        )
+        if not file_path:
+            return
+
+        self.trace_job = TraceImportJob(file_path, self)
+        self.trace_job.progress.connect(self.on_trace_progress)
+        self.trace_job.result_ready.connect(self.on_trace_imported)
+        self.trace_job.cancelled.connect(
+            lambda: self.metrics_label.setText("Import cancelled")
+        )
+        self.trace_job.failed.connect(
+            lambda message: QMessageBox.critical(
+                self, "Import Failed", f"Failed to import trace: {message}"
+            )
+        )
+        self.trace_job.finished.connect(self.on_trace_finished)
+
+        self.generate_button.setEnabled(False)
+        self.cancel_button.setVisible(True)
+        self.metrics_label.setText("Importing trace...")
+        self.trace_job.start()
+
+    def on_trace_progress(self, rows, fraction):
+        text = f"Importing trace... {rows:,} rows"
+        if fraction is not None:
+            text += f" ({fraction:.0%})"
+        self.metrics_label.setText(text)
+
+    def on_trace_imported(self, result):
+        processes = result["processes"]
+        if processes.arrival.dtype.kind == "f" or processes.burst.dtype.kind == "f":
+            QMessageBox.warning(
+                self,
+                "Fractional Times",
+                "The process table holds whole time units. Run traces with "
+                "fractional times through cli.py instead.",
+            )
+            self.metrics_label.setText("")
+            return
+        self.clear_table()
+        self.process_model.set_processes(
+            processes.arrival,
+            processes.burst,
+            priority=processes.priority,
+            deadline=processes.deadline,
+            names=processes.names,
+        )
+        self.metrics_label.setText(
+            f"Imported {result['rows']:,} processes in {result['seconds']:.2f} s "
+            f"({result['rows_per_second']:,.0f} rows/s)"
+            + (" | Sorted by arrival time" if result["reordered"] else "")
+        )
+
+    def on_trace_finished(self):
+        self.trace_job.deleteLater()
+        self.trace_job = None
+        self.generate_button.setEnabled(True)
+        self.cancel_button.setVisible(False)
+
     def generate_from_config(self, num_processes, priority_lambda):
         """Generate processes based on loaded configuration."""
         self.clear_table()
         algorithm = self.algorithm_selector.currentText()
-        self.process_table.setRowCount(num_processes)
 
         # Get statistical parameters from UI controls
         arrival_mean = self.arrival_mean.value()
@@ -411,35 +580,37 @@ class MainWindow(QMainWindow):
         burst_mean = self.burst_mean.value()
         burst_std = self.burst_std.value()
 
-        for i in range(num_processes):
-            process_name = f"P{i+1}"
+        arrivals = np.empty(num_processes, dtype=np.int64)
+        bursts = np.empty(num_processes, dtype=np.int64)
+        priorities = None
+        if "Priority" in algorithm:
+            priorities = np.empty(num_processes, dtype=np.int64)
+        deadlines = None
+        if "EDF" in algorithm or "RMS" in algorithm:
+            deadlines = np.empty(num_processes, dtype=np.int64)
 
+        for i in range(num_processes):
             # Generate arrival time using normal distribution
             arrival_time = max(0, round(random.gauss(arrival_mean, arrival_std)))
 
             # Generate burst time using normal distribution
             burst_time = max(1, round(random.gauss(burst_mean, burst_std)))
 
+            arrivals[i] = arrival_time
+            bursts[i] = burst_time
+
             # Generate priority using exponential distribution
-            priority = None
-            if "Priority" in algorithm:
+            if priorities is not None:
                 # Lower values have higher priority (1 is highest priority)
                 # We use ceil to avoid 0 priority and ensure minimum of 1
-                priority = ceil(random.expovariate(priority_lambda))
+                priorities[i] = ceil(random.expovariate(priority_lambda))
 
             # Generate deadline for EDF/RMS algorithms
-            deadline = None
-            if "EDF" in algorithm or "RMS" in algorithm:
-                deadline = arrival_time + burst_time + random.randint(0, 10)
-
-            # Populate the table
-            self.process_table.setItem(i, 0, QTableWidgetItem(process_name))
-            self.process_table.setItem(i, 1, QTableWidgetItem(str(arrival_time)))
-            self.process_table.setItem(i, 2, QTableWidgetItem(str(burst_time)))
-            if priority is not None:
-                self.process_table.setItem(i, 3, QTableWidgetItem(str(priority)))
-            if deadline is not None:
-                self.process_table.setItem(i, 4, QTableWidgetItem(str(deadline)))
+            if deadlines is not None:
+                deadlines[i] = arrival_time + burst_time + random.randint(0, 10)
+
+        # Populate the table with one model reset; names default to P1, P2, ...
+        self.process_model.set_processes(arrivals, bursts, priorities, deadlines)
 
     def fill_random_sample_data(self):
         """Generate random sample data using UI parameters."""
@@ -453,68 +624,54 @@ class MainWindow(QMainWindow):
         self.generate_from_config(num_processes, priority_lambda)
 
     def clear_table(self):
-        self.process_table.setRowCount(0)
-        self.output_table.setRowCount(0)
+        self.process_model.clear()
+        self.output_model.clear()
+        self.shown_algorithm = None
         self.metrics_label.setText("")
-        self.chart.init_chart()
+        if self.chart is not None:
+            self.chart.init_chart()
 
     def generate_schedule(self):
-        processes = []
         algorithm = self.algorithm_selector.currentText()
-        for row in range(self.process_table.rowCount()):
-            process_item = self.process_table.item(row, 0)
-            arrival_time_item = self.process_table.item(row, 1)
-            burst_time_item = self.process_table.item(row, 2)
-            priority_item = self.process_table.item(row, 3)
-            deadline_item = self.process_table.item(row, 4)
-
-            if process_item and arrival_time_item and burst_time_item:
-                try:
-                    arrival_time = int(arrival_time_item.text())
-                    burst_time = int(burst_time_item.text())
-                    p_data = {
-                        "Process": process_item.text(),
-                        "Arrival Time": arrival_time,
-                        "Burst Time": burst_time,
-                    }
-                    if (
-                        "Priority" in algorithm
-                        and priority_item
-                        and priority_item.text()
-                    ):
-                        p_data["Priority"] = int(priority_item.text())
-                    if (
-                        ("EDF" in algorithm or "RMS" in algorithm)
-                        and deadline_item
-                        and deadline_item.text()
-                    ):
-                        p_data["Deadline"] = int(deadline_item.text())
-                    processes.append(p_data)
-                except ValueError:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Input",
-                        "Please ensure all fields are valid integers.",
-                    )
-                    return
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Missing Data",
-                    "Ensure every process has a name, arrival time, and burst time.",
-                )
-                return
+        # Every column is kept, even ones the algorithm ignores, so all runs
+        # on this process set share one workload in the run history
+        processes = self.process_model.process_table()
+        if "Priority" in algorithm and processes.priority is None and len(processes):
+            QMessageBox.warning(
+                self,
+                "Missing Data",
+                "Ensure every process has a priority.",
+            )
+            return
+
+        if algorithm in DEADLINE_ALGORITHMS and processes.deadline is None:
+            QMessageBox.warning(
+                self,
+                "Missing Data",
+                "Ensure every process has a deadline.",
+            )
+            return
 
-        quantum = self.quantum_input.value() if algorithm == "Round Robin" else None
-        if algorithm == "Round Robin" and not quantum:
+        quantum = (
+            self.quantum_input.value() if algorithm in QUANTUM_ALGORITHMS else None
+        )
+        if algorithm in QUANTUM_ALGORITHMS and not quantum:
             QMessageBox.warning(
                 self,
                 "Invalid Quantum",
-                "Set a valid quantum time for Round Robin scheduling.",
+                f"Set a valid quantum time for {algorithm} scheduling.",
             )
             return
 
-        if not processes:
+        if algorithm == "MLFQ" and self.cores_input.value() > 1:
+            QMessageBox.warning(
+                self,
+                "Single Core Only",
+                "MLFQ runs on a single core. Set Cores to 1.",
+            )
+            return
+
+        if not len(processes):
             QMessageBox.warning(
                 self,
                 "No Processes",
@@ -522,67 +679,201 @@ class MainWindow(QMainWindow):
             )
             return
 
-        scheduler = Scheduler(processes, algorithm, quantum)
-        schedule, avg_waiting_time, avg_turnaround_time = scheduler.run()
+        # Ignore new requests while a run or an import is still in progress
+        if self.schedule_job is not None or self.trace_job is not None:
+            return
+        self.end_live_updates()
+
+        # Schedule in a worker thread
+        stats = None
+        if self.diagnostics_group.isChecked():
+            stats = RunStats(track_memory=self.track_memory_checkbox.isChecked())
+        self.schedule_job = ScheduleJob(
+            processes,
+            algorithm,
+            quantum,
+            self.result_cache,
+            stats,
+            self.cores_input.value(),
+            self.queue_selector.currentText(),
+            parent=self,
+        )
+        self.schedule_job.progress.connect(self.on_schedule_progress)
+        self.schedule_job.result_ready.connect(
+            lambda result: self.on_schedule_ready(result, processes)
+        )
+        self.schedule_job.cancelled.connect(
+            lambda: self.metrics_label.setText("Scheduling cancelled")
+        )
+        self.schedule_job.failed.connect(
+            lambda message: QMessageBox.critical(
+                self, "Scheduling Failed", f"Failed to generate schedule: {message}"
+            )
+        )
+        self.schedule_job.finished.connect(self.on_schedule_finished)
+
+        self.generate_button.setEnabled(False)
+        self.cancel_button.setVisible(True)
+        self.metrics_label.setText(f"Running {algorithm}...")
+        self.schedule_job.start()
+
+    def gantt_chart(self):
+        """The Gantt chart, created in place of its placeholder on first use."""
+        if self.chart is None:
+            from visuals.gantt_chart import GanttChart
+
+            self.chart = GanttChart()
+            self.chart_layout.replaceWidget(self.chart_placeholder, self.chart)
+            self.chart_placeholder.deleteLater()
+        return self.chart
+
+    def end_live_updates(self):
+        self.live_run = None
+        self.live_schedule = None
+
+    def live_scheduler(self):
+        """IncrementalScheduler for the last run, or None if edits can't be
+        applied to what is shown."""
+        if self.live_run is None or self.schedule_job is not None:
+            return None
+        algorithm, processes = self.live_run
+        if self.algorithm_selector.currentText() != algorithm:
+            return None
+        if self.live_schedule is None:
+            # Built on the first edit; later edits only replay what changed
+            self.live_schedule = IncrementalScheduler(processes, algorithm)
+        return self.live_schedule
+
+    def on_process_edited(self, top_left, bottom_right, roles=()):
+        live = self.live_scheduler()
+        if live is None:
+            return
+        row, column = top_left.row(), top_left.column()
+        model = self.process_model
+        if column == 0:
+            live.table.names = [model.name(i) for i in range(len(model.arrival))]
+            self.show_live_schedule(0, len(live.schedule))
+            return
+        if column == 3 and live.algorithm == "Priority":
+            if np.isnan(model.priority[row]):
+                # Can't schedule without a priority; wait for a new run
+                self.end_live_updates()
+                return
+            first, end = live.update(row, priority=int(model.priority[row]))
+        elif column in (1, 2):
+            first, end = live.update(
+                row, arrival=model.arrival[row].item(), burst=model.burst[row].item()
+            )
+        else:
+            return
+        self.show_live_schedule(first, end)
+
+    def add_process(self):
+        """Insert a process below the selected row (or at the end)."""
+        model = self.process_model
+        selected = self.process_table.selectionModel().selectedRows()
+        row = selected[0].row() + 1 if selected else len(model.arrival)
+        arrival = model.arrival[row - 1].item() if row > 0 else 0
+        priority = 1 if model.has_priorities() else np.nan
+
+        # Grab the live schedule before the row count changes
+        live = self.live_scheduler()
+        model.insert_process(row, arrival, 1, priority)
+        if live is not None:
+            first, end = live.insert(
+                row, arrival, 1, priority=None if np.isnan(priority) else 1
+            )
+            self.show_live_schedule(first, end)
+        self.process_table.selectRow(row)
+
+    def remove_process(self):
+        selected = self.process_table.selectionModel().selectedRows()
+        if not selected:
+            return
+        row = selected[0].row()
+        live = self.live_scheduler()
+        self.process_model.remove_process(row)
+        if live is not None:
+            if len(live.table) == 1:
+                self.clear_table()
+                return
+            first, end = live.delete(row)
+            self.show_live_schedule(first, end)
+
+    def show_live_schedule(self, first, end):
+        """Patch the output table, chart and averages after an edit."""
+        live = self.live_schedule
+        self.output_model.patch_schedule(live.schedule, first, end)
+        self.gantt_chart().update_chart(live.schedule, live.table, keep_view=True)
+        avg_waiting_time, avg_turnaround_time = live.average_times()
+        self.metrics_label.setText(
+            f"Average Waiting Time: {avg_waiting_time:.2f} units  |  "
+            f"Average Turnaround Time: {avg_turnaround_time:.2f} units"
+            " | Updated from edit (not saved)"
+        )
+
+    def cancel_schedule(self):
+        if self.schedule_job is not None:
+            self.schedule_job.cancel()
+            self.metrics_label.setText("Cancelling...")
+        if self.trace_job is not None:
+            self.trace_job.cancel()
+            self.metrics_label.setText("Cancelling...")
 
-        self.output_table.setRowCount(len(schedule))
-        for row, entry in enumerate(schedule):
-            self.output_table.setItem(row, 0, QTableWidgetItem(str(entry["Process"])))
-            self.output_table.setItem(row, 1, QTableWidgetItem(str(entry["Start"])))
-            self.output_table.setItem(row, 2, QTableWidgetItem(str(entry["Finish"])))
+    def on_schedule_progress(self, events, current_time):
+        self.metrics_label.setText(
+            f"Running... {events:,} events processed, simulated time {current_time}"
+        )
+
+    def on_schedule_ready(self, result, processes):
+        schedule = result["schedule"]
+        stats = self.schedule_job.stats
+        # Edits are only replayed on single-core schedules
+        if result["algorithm"] in INCREMENTAL_ALGORITHMS and result["cores"] == 1:
+            self.live_run = (result["algorithm"], processes)
+        with phase(stats, "table"):
+            self.output_model.set_schedule(schedule)
+        self.shown_algorithm = (result["algorithm"], result["quantum"])
 
         self.metrics_label.setText(
-            f"Average Waiting Time: {avg_waiting_time:.2f} units  |  Average Turnaround Time: {avg_turnaround_time:.2f} units"
+            f"Average Waiting Time: {result['avg_waiting_time']:.2f} units  |  "
+            f"Average Turnaround Time: {result['avg_turnaround_time']:.2f} units"
+            + metrics_summary(result["metrics"])
         )
 
-        self.chart.update_chart(schedule, processes)
+        with phase(stats, "chart"):
+            self.gantt_chart().update_chart(schedule, processes)
+        if stats is not None:
+            self.diagnostics_label.setText(stats.format())
 
-        # Save results to file
-        self.save_results_to_file(
-            algorithm, schedule, avg_waiting_time, avg_turnaround_time
+        self.run_history.record(processes, result)
+        self.metrics_label.setText(
+            self.metrics_label.text()
+            + " | Saved to run history"
+            + (" | Cached result" if result["cached"] else "")
         )
+        self.update_cache_tooltip()
+
+    def update_cache_tooltip(self):
+        stats = self.result_cache.stats()
+        self.metrics_label.setToolTip(
+            f"Result cache: {stats['entries']} in memory, "
+            f"{stats['hits']} memory hits, {stats['disk_hits']} disk hits, "
+            f"{stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)"
+        )
+
+    def on_schedule_finished(self):
+        self.schedule_job.deleteLater()
+        self.schedule_job = None
+        self.generate_button.setEnabled(True)
+        self.cancel_button.setVisible(False)
 
     def compare_all_algorithms(self):
         """Run all scheduling algorithms on the same process set and compare results."""
         # Get processes from the table
-        processes = []
-        for row in range(self.process_table.rowCount()):
-            process_item = self.process_table.item(row, 0)
-            arrival_time_item = self.process_table.item(row, 1)
-            burst_time_item = self.process_table.item(row, 2)
-            priority_item = self.process_table.item(row, 3)
-            deadline_item = self.process_table.item(row, 4)
-
-            if process_item and arrival_time_item and burst_time_item:
-                try:
-                    arrival_time = int(arrival_time_item.text())
-                    burst_time = int(burst_time_item.text())
-                    p_data = {
-                        "Process": process_item.text(),
-                        "Arrival Time": arrival_time,
-                        "Burst Time": burst_time,
-                    }
-                    if priority_item and priority_item.text():
-                        p_data["Priority"] = int(priority_item.text())
-                    if deadline_item and deadline_item.text():
-                        p_data["Deadline"] = int(deadline_item.text())
-                    processes.append(p_data)
-                except ValueError:
-                    QMessageBox.warning(
-                        self,
-                        "Invalid Input",
-                        "Please ensure all fields are valid integers.",
-                    )
-                    return
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Missing Data",
-                    "Ensure every process has a name, arrival time, and burst time.",
-                )
-                return
+        processes = self.process_model.process_table()
 
-        if not processes:
+        if not len(processes):
             QMessageBox.warning(
                 self,
                 "No Processes",
@@ -590,205 +881,178 @@ class MainWindow(QMainWindow):
             )
             return
 
-        # Check if Priority data is available
-        has_priority = all("Priority" in p for p in processes)
-        if not has_priority:
-            # Assign default priorities (1 to all)
-            for p in processes:
-                p["Priority"] = 1
-
-        # Run all algorithms
-        algorithms = ["FCFS", "SRTF", "Priority", "Round Robin"]
-        results = []
+        # Assign default priorities (1 to all) if Priority data is incomplete,
+        # in a copy: the run history records the process set as entered, the
+        # same one show_run_history() filters by
+        compared = self.process_model.process_table()
+        compared.fill_missing_priority(1)
 
         # Prepare the output display
         self.metrics_label.setText("Comparing algorithms...")
 
-        # Create a dialog to display results
-        comparison_dialog = QDialog(self)
-        comparison_dialog.setWindowTitle("Algorithm Comparison")
-        comparison_dialog.setMinimumSize(1200, 800)  # Larger size to fit all charts
-
-        # Use scroll area to ensure all content is accessible
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_content = QWidget()
-        layout = QVBoxLayout(scroll_content)
-
-        # Results table
-        results_table = QTableWidget(len(algorithms), 3)
-        results_table.setHorizontalHeaderLabels(
-            ["Algorithm", "Avg. Waiting Time", "Avg. Turnaround Time"]
-        )
-        results_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        results_table.setMaximumHeight(150)
-        layout.addWidget(QLabel("<b>Performance Comparison:</b>"))
-        layout.addWidget(results_table)
-
-        # Run each algorithm and store results
-        best_algorithm = None
-        min_waiting_time = float("inf")
-
-        for i, algorithm in enumerate(algorithms):
-            quantum = 2 if algorithm == "Round Robin" else None
-            scheduler = Scheduler(processes.copy(), algorithm, quantum)
-            schedule, avg_waiting_time, avg_turnaround_time = scheduler.run()
-
-            results.append(
-                {
-                    "algorithm": algorithm,
-                    "schedule": schedule,
-                    "avg_waiting_time": avg_waiting_time,
-                    "avg_turnaround_time": avg_turnaround_time,
-                }
-            )
+        # Imported here because the dialog pulls in matplotlib
+        from ui.comparison_dialog import ComparisonDialog
+
+        # The dialog runs the algorithms in the background and fills in as
+        # each one finishes, so the main window stays responsive
+        comparison_dialog = ComparisonDialog(
+            compared,
+            cache=self.result_cache,
+            cores=self.cores_input.value(),
+            queues=self.queue_selector.currentText(),
+            parent=self,
+        )
+        comparison_dialog.setAttribute(Qt.WA_DeleteOnClose)
+        comparison_dialog.comparison_finished.connect(
+            lambda results: self.on_comparison_finished(results, processes)
+        )
+        comparison_dialog.comparison_stopped.connect(self.metrics_label.setText)
+        comparison_dialog.export_requested.connect(self.export_comparison_results)
+        comparison_dialog.show()
+        comparison_dialog.start()
 
-            # Update result table
-            results_table.setItem(i, 0, QTableWidgetItem(algorithm))
-            results_table.setItem(i, 1, QTableWidgetItem(f"{avg_waiting_time:.2f}"))
-            results_table.setItem(i, 2, QTableWidgetItem(f"{avg_turnaround_time:.2f}"))
-
-            # Track best algorithm based on waiting time
-            if avg_waiting_time < min_waiting_time:
-                min_waiting_time = avg_waiting_time
-                best_algorithm = algorithm
-
-        # Highlight best algorithm in the table
-        for i in range(results_table.rowCount()):
-            if results_table.item(i, 0).text() == best_algorithm:
-                for j in range(results_table.columnCount()):
-                    results_table.item(i, j).setBackground(
-                        QColor(152, 251, 152)
-                    )  # Light green
-
-        # Add summary label
-        summary = QLabel(
-            f"<b>Best Algorithm:</b> {best_algorithm} with {min_waiting_time:.2f} avg. waiting time"
-        )
-        summary.setStyleSheet("color: green; font-size: 14px;")
-        layout.addWidget(summary)
-
-        # Create a section for each algorithm with detailed output and chart
-        for result in results:
-            alg_name = result["algorithm"]
-            schedule = result["schedule"]
-
-            # Add algorithm header with metrics
-            is_best = alg_name == best_algorithm
-            header_style = (
-                "color: green; font-weight: bold; font-size: 16px;"
-                if is_best
-                else "font-weight: bold; font-size: 16px;"
-            )
-            best_badge = " [BEST]" if is_best else ""
+    def on_comparison_finished(self, results, processes):
+        """Show the best algorithm in the main window and save all results."""
+        sorted_results = sorted(results, key=lambda x: x["avg_waiting_time"])
+        best = sorted_results[0]
+        schedule = best["schedule"]
+        self.end_live_updates()
 
-            algorithm_section = QGroupBox(f"{alg_name}{best_badge}")
-            algorithm_section.setStyleSheet(f"QGroupBox {{ {header_style} }}")
-            alg_layout = QVBoxLayout(algorithm_section)
+        self.output_model.set_schedule(schedule)
 
-            # Add metrics for this algorithm
-            metrics_label = QLabel(
-                f"Average Waiting Time: {result['avg_waiting_time']:.2f} units | "
-                f"Average Turnaround Time: {result['avg_turnaround_time']:.2f} units"
-            )
-            alg_layout.addWidget(metrics_label)
+        self.metrics_label.setText(
+            f"Best Algorithm: {best['algorithm']} | "
+            f"Average Waiting Time: {best['avg_waiting_time']:.2f} units | "
+            f"Average Turnaround Time: {best['avg_turnaround_time']:.2f} units"
+            + metrics_summary(best["metrics"])
+        )
 
-            # Add schedule table
-            schedule_table = QTableWidget(len(schedule), 3)
-            schedule_table.setHorizontalHeaderLabels(
-                ["Process", "Start Time", "Finish Time"]
-            )
-            schedule_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-            schedule_table.setMaximumHeight(200)
-
-            for row, entry in enumerate(schedule):
-                schedule_table.setItem(row, 0, QTableWidgetItem(str(entry["Process"])))
-                schedule_table.setItem(row, 1, QTableWidgetItem(str(entry["Start"])))
-                schedule_table.setItem(row, 2, QTableWidgetItem(str(entry["Finish"])))
-
-            alg_layout.addWidget(QLabel("<b>Schedule:</b>"))
-            alg_layout.addWidget(schedule_table)
-
-            # Add Gantt chart for this algorithm
-            alg_layout.addWidget(QLabel("<b>Gantt Chart:</b>"))
-            chart = GanttChart()
-            chart.update_chart(schedule, processes)
-            chart.setMinimumHeight(250)  # Set minimum height to ensure visibility
-            alg_layout.addWidget(chart)
-
-            layout.addWidget(algorithm_section)
-
-            # If this is the best algorithm, also update the main window
-            if alg_name == best_algorithm:
-                self.output_table.setRowCount(len(schedule))
-                for row, entry in enumerate(schedule):
-                    self.output_table.setItem(
-                        row, 0, QTableWidgetItem(str(entry["Process"]))
-                    )
-                    self.output_table.setItem(
-                        row, 1, QTableWidgetItem(str(entry["Start"]))
-                    )
-                    self.output_table.setItem(
-                        row, 2, QTableWidgetItem(str(entry["Finish"]))
-                    )
+        self.gantt_chart().update_chart(schedule, processes)
+        self.update_cache_tooltip()
 
-                self.metrics_label.setText(
-                    f"Best Algorithm: {best_algorithm} | "
-                    f"Average Waiting Time: {result['avg_waiting_time']:.2f} units | "
-                    f"Average Turnaround Time: {result['avg_turnaround_time']:.2f} units"
-                )
-
-                self.chart.update_chart(schedule, processes)
-
-        # Add export button
-        export_button = QPushButton("Export Results")
-        export_button.clicked.connect(lambda: self.export_comparison_results(results))
-        layout.addWidget(export_button, alignment=Qt.AlignCenter)
-
-        # Save all results to the output file, replacing any previous content
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Open in 'w' mode to clear the file before writing new results
-        with open(self.output_file, "w") as file:
-            file.write(f"{'='*50}\n")
-            file.write(f"ALGORITHM COMPARISON ({timestamp})\n")
-            file.write(f"{'='*50}\n\n")
-
-            # Sort results by average waiting time
-            sorted_results = sorted(results, key=lambda x: x["avg_waiting_time"])
-
-            for i, result in enumerate(sorted_results):
-                file.write(f"{i+1}. {result['algorithm']}\n")
-                file.write(
-                    f"   Average Waiting Time: {result['avg_waiting_time']:.2f}\n"
-                )
-                file.write(
-                    f"   Average Turnaround Time: {result['avg_turnaround_time']:.2f}\n"
-                )
-                file.write(f"   Schedule: \n")
-
-                for entry in result["schedule"]:
-                    file.write(
-                        f"      {entry['Process']}: Start={entry['Start']}, Finish={entry['Finish']}\n"
-                    )
+        self.run_history.record_comparison(processes, results)
+        self.metrics_label.setText(
+            self.metrics_label.text() + " | Saved to run history"
+        )
 
-                file.write("\n")
+    def show_run_history(self):
+        current = self.process_model.process_table()
+        dialog = HistoryDialog(
+            self.run_history,
+            current_workload=workload_hash(current) if len(current) else None,
+            parent=self,
+        )
+        dialog.run_selected.connect(self.open_history_run)
+        dialog.exec()
 
-            file.write(f"Best Algorithm: {sorted_results[0]['algorithm']}\n")
+    def open_history_run(self, run_id):
+        """Show a recorded run and its process set without re-running it."""
+        try:
+            run = self.run_history.load(run_id)
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Open Failed", f"Failed to open run {run_id}: {str(e)}"
+            )
+            return
+        processes = run["processes"]
+        self.process_model.set_processes(
+            processes.arrival,
+            processes.burst,
+            priority=processes.priority,
+            deadline=processes.deadline,
+            names=processes.names,
+        )
+        self.algorithm_selector.setCurrentText(run["algorithm"])
+        if run["quantum"] is not None:
+            self.quantum_input.setValue(run["quantum"])
+        self.cores_input.setValue(run["schedule"].cores)
+
+        self.output_model.set_schedule(run["schedule"])
+        self.shown_algorithm = (run["algorithm"], run["quantum"])
+        self.gantt_chart().update_chart(run["schedule"], processes)
+        created = datetime.datetime.fromtimestamp(run["created"])
+        self.metrics_label.setText(
+            f"Run {run_id}: {run['algorithm']} ({created:%Y-%m-%d %H:%M:%S}) | "
+            f"Average Waiting Time: {run['avg_waiting_time']:.2f} units | "
+            f"Average Turnaround Time: {run['avg_turnaround_time']:.2f} units"
+            + metrics_summary(run["metrics"])
+        )
 
-        # Show a notification about the saved file
+    def save_schedule_file(self):
+        schedule = self.output_model.schedule
+        if schedule is None or self.shown_algorithm is None:
+            QMessageBox.warning(
+                self, "No Schedule", "Generate or open a schedule to save first."
+            )
+            return
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Schedule",
+            "",
+            f"Schedule Files (*{FILE_EXTENSION});;All Files (*)",
+        )
+        if not file_path:
+            return
+        algorithm, quantum = self.shown_algorithm
+        try:
+            # Metrics are recomputed on the way, as live edits may have
+            # changed the schedule since its run
+            write_schedule(file_path, schedule, algorithm, quantum)
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Save Failed", f"Failed to save schedule: {str(e)}"
+            )
+            return
         self.metrics_label.setText(
-            self.metrics_label.text()
-            + f" | Results saved to {os.path.basename(self.output_file)}"
+            self.metrics_label.text() + f" | Saved to {os.path.basename(file_path)}"
         )
 
-        # Set up scroll area
-        scroll_area.setWidget(scroll_content)
-        dialog_layout = QVBoxLayout(comparison_dialog)
-        dialog_layout.addWidget(scroll_area)
+    def open_schedule_file(self):
+        """Show a saved schedule; its segments stay on disk until viewed."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Open Schedule",
+            "",
+            f"Schedule Files (*{FILE_EXTENSION});;All Files (*)",
+        )
+        if not file_path:
+            return
+        try:
+            saved = load_schedule(file_path)
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Open Failed", f"Failed to open schedule: {str(e)}"
+            )
+            return
+        processes = saved["processes"]
+        self.process_model.set_processes(
+            processes.arrival,
+            processes.burst,
+            priority=processes.priority,
+            deadline=processes.deadline,
+            names=processes.names,
+        )
+        if saved["algorithm"] is not None:
+            self.algorithm_selector.setCurrentText(saved["algorithm"])
+        if saved["quantum"] is not None:
+            self.quantum_input.setValue(saved["quantum"])
+        self.cores_input.setValue(saved["schedule"].cores)
+
+        self.output_model.set_schedule(saved["schedule"])
+        self.shown_algorithm = (saved["algorithm"], saved["quantum"])
+        self.gantt_chart().update_chart(saved["schedule"], processes)
+        metrics = saved["metrics"]
+        self.metrics_label.setText(
+            f"{os.path.basename(file_path)}: {saved['algorithm']} | "
+            f"Average Waiting Time: {metrics['waiting']['mean']:.2f} units | "
+            f"Average Turnaround Time: {metrics['turnaround']['mean']:.2f} units"
+            + metrics_summary(metrics)
+        )
 
-        # Show the dialog
-        comparison_dialog.exec()
+    def closeEvent(self, event):
+        # Write out any runs still queued for the history
+        self.run_history.close()
+        super().closeEvent(event)
 
     def export_comparison_results(self, results):
         """Export comparison results to a file."""
@@ -817,9 +1081,9 @@ class MainWindow(QMainWindow):
                     )
                     file.write(f"   Schedule: \n")
 
-                    for entry in result["schedule"]:
+                    for process, start, finish in result["schedule"].rows():
                         file.write(
-                            f"      {entry['Process']}: Start={entry['Start']}, Finish={entry['Finish']}\n"
+                            f"      {process}: Start={start}, Finish={finish}\n"
                         )
 
                     file.write("\n")
@@ -836,30 +1100,3 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(
                 self, "Export Failed", f"Failed to export results: {str(e)}"
             )
-
-    def save_results_to_file(
-        self, algorithm, schedule, avg_waiting_time, avg_turnaround_time
-    ):
-        """Save scheduling results to the output file."""
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # Open in 'w' mode to clear the file before writing new results
-        with open(self.output_file, "w") as file:
-            file.write(f"{'='*50}\n")
-            file.write(f"SINGLE ALGORITHM RUN: {algorithm} ({timestamp})\n")
-            file.write(f"{'='*50}\n\n")
-
-            file.write(f"Average Waiting Time: {avg_waiting_time:.2f}\n")
-            file.write(f"Average Turnaround Time: {avg_turnaround_time:.2f}\n")
-            file.write("Schedule:\n")
-
-            for entry in schedule:
-                file.write(
-                    f"   {entry['Process']}: Start={entry['Start']}, Finish={entry['Finish']}\n"
-                )
-
-        # Show a notification about the saved file
-        self.metrics_label.setText(
-            self.metrics_label.text()
-            + f" | Results saved to {os.path.basename(self.output_file)}"
-        )
@@ -0,0 +1,227 @@
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+from logic.process_table import NameTable, ProcessTable
+
+# Largest value an edited cell may take; exact in the float Priority and
+# Deadline columns too
+MAX_VALUE = 2**53
+
+PROCESS_HEADERS = ["Process", "Arrival Time", "Burst Time", "Priority", "Deadline"]
+SCHEDULE_HEADERS = ["Process", "Start Time", "Finish Time"]
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """Editable process table backed by column arrays.
+
+    Cells are formatted only when the view asks for them, so the cost of
+    showing the table depends on the visible rows rather than on the
+    number of processes. Empty Priority/Deadline cells are stored as NaN.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.clear()
+
+    def clear(self):
+        self.set_processes(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    def set_processes(self, arrival, burst, priority=None, deadline=None, names=None):
+        """Replace every row at once with a single model reset."""
+        self.beginResetModel()
+        self.arrival = np.asarray(arrival, dtype=np.int64)
+        self.burst = np.asarray(burst, dtype=np.int64)
+        count = len(self.arrival)
+        self.priority = (
+            np.full(count, np.nan)
+            if priority is None
+            else np.asarray(priority, dtype=float)
+        )
+        self.deadline = (
+            np.full(count, np.nan)
+            if deadline is None
+            else np.asarray(deadline, dtype=float)
+        )
+        # Default names ("P1", "P2", ...) are generated on demand. A NameTable,
+        # e.g. from an imported trace, stays compact until a name changes.
+        if names is None or isinstance(names, NameTable):
+            self.names = names
+        else:
+            self.names = list(names)
+        self.endResetModel()
+
+    def insert_process(self, row, arrival, burst, priority=np.nan, deadline=np.nan):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.arrival = np.insert(self.arrival, row, arrival)
+        self.burst = np.insert(self.burst, row, burst)
+        self.priority = np.insert(self.priority, row, priority)
+        self.deadline = np.insert(self.deadline, row, deadline)
+        if self.names is not None:
+            self.editable_names().insert(row, f"P{len(self.arrival)}")
+        self.endInsertRows()
+
+    def remove_process(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.arrival = np.delete(self.arrival, row)
+        self.burst = np.delete(self.burst, row)
+        self.priority = np.delete(self.priority, row)
+        self.deadline = np.delete(self.deadline, row)
+        if self.names is not None:
+            del self.editable_names()[row]
+        self.endRemoveRows()
+
+    def editable_names(self):
+        """The names as a list, built on the first edit."""
+        if not isinstance(self.names, list):
+            self.names = [self.name(i) for i in range(len(self.arrival))]
+        return self.names
+
+    def name(self, row):
+        if self.names is None:
+            return f"P{row + 1}"
+        return self.names[row]
+
+    def has_priorities(self):
+        return len(self.priority) > 0 and not np.isnan(self.priority).any()
+
+    def has_deadlines(self):
+        return len(self.deadline) > 0 and not np.isnan(self.deadline).any()
+
+    def process_table(self, include_priority=True, include_deadline=True):
+        """The current rows as a ProcessTable.
+
+        Optional columns are included only when every row has a value.
+        """
+        priority = None
+        if include_priority and self.has_priorities():
+            priority = self.priority.astype(np.int64)
+        deadline = None
+        if include_deadline and self.has_deadlines():
+            deadline = self.deadline.astype(np.int64)
+        return ProcessTable(
+            self.arrival.copy(),
+            self.burst.copy(),
+            priority=priority,
+            deadline=deadline,
+            names=self.names if not isinstance(self.names, list) else list(self.names),
+        )
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.arrival)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(PROCESS_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return PROCESS_HEADERS[section]
+        return str(section + 1)
+
+    def _column(self, column):
+        return (self.arrival, self.burst, self.priority, self.deadline)[column - 1]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            return self.name(row)
+        value = self._column(column)[row]
+        if isinstance(value, float):
+            return "" if np.isnan(value) else str(int(value))
+        return str(value)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsEditable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, column = index.row(), index.column()
+        text = str(value).strip()
+        if column == 0:
+            if not text:
+                return False
+            self.editable_names()[row] = text
+        elif column >= 3 and not text:
+            # Priority and Deadline may be left empty
+            self._column(column)[row] = np.nan
+        else:
+            # Whole, non-negative numbers only, so a bad edit is refused here
+            # rather than failing Workload validation at the next run
+            try:
+                number = int(text)
+            except ValueError:
+                return False
+            if not 0 <= number <= MAX_VALUE:
+                return False
+            self._column(column)[row] = number
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+
+class ScheduleTableModel(QAbstractTableModel):
+    """Read-only view over a ScheduleTable's pid/start/finish arrays.
+
+    Multi-CPU schedules get a fourth column with each segment's core.
+    """
+
+    def __init__(self, schedule=None, parent=None):
+        super().__init__(parent)
+        self.schedule = schedule
+
+    def set_schedule(self, schedule):
+        self.beginResetModel()
+        self.schedule = schedule
+        self.endResetModel()
+
+    def patch_schedule(self, schedule, first, end):
+        """Show an edited schedule where only rows first..end-1 changed."""
+        if self.schedule is None or len(schedule) != len(self.schedule):
+            self.set_schedule(schedule)
+            return
+        self.schedule = schedule
+        if end > first:
+            self.dataChanged.emit(
+                self.index(first, 0),
+                self.index(end - 1, self.columnCount() - 1),
+                [Qt.DisplayRole],
+            )
+
+    def clear(self):
+        self.set_schedule(None)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.schedule is None:
+            return 0
+        return len(self.schedule)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self.schedule is not None and self.schedule.cpu is not None:
+            return len(SCHEDULE_HEADERS) + 1
+        return len(SCHEDULE_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return (SCHEDULE_HEADERS + ["CPU"])[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        if index.column() == 0:
+            return str(self.schedule.processes.name(int(self.schedule.pid[row])))
+        if index.column() == 1:
+            return str(self.schedule.start[row].item())
+        if index.column() == 3:
+            return str(self.schedule.cpu[row].item())
+        return str(self.schedule.finish[row].item())
@@ -0,0 +1,163 @@
+import threading
+
+from PySide6.QtCore import QThread, Signal
+
+from logic.compare import available_algorithms, compare_algorithms
+from logic.multicore import GLOBAL_QUEUE
+from logic.scheduler import Scheduler, SchedulingCancelled
+from logic.trace_import import TraceImportCancelled, import_trace
+
+
+class ComparisonJob(QThread):
+    """Runs compare_algorithms off the GUI thread and streams back results."""
+
+    result_ready = Signal(dict)
+    progress = Signal(int, int)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        processes,
+        algorithms=None,
+        quantum=2,
+        cache=None,
+        cores=1,
+        queues=GLOBAL_QUEUE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.processes = processes
+        if algorithms is None:
+            algorithms = available_algorithms(processes, cores=cores)
+        self.algorithms = list(algorithms)
+        self.quantum = quantum
+        self.cache = cache
+        self.cores = cores
+        self.queues = queues
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def run(self):
+        done = 0
+        self.progress.emit(done, len(self.algorithms))
+        try:
+            for result in compare_algorithms(
+                self.processes,
+                self.algorithms,
+                self.quantum,
+                cancel_event=self.cancel_event,
+                cache=self.cache,
+                cores=self.cores,
+                queues=self.queues,
+            ):
+                done += 1
+                self.result_ready.emit(result)
+                self.progress.emit(done, len(self.algorithms))
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class ScheduleJob(QThread):
+    """Runs one algorithm off the GUI thread."""
+
+    # (events, simulated time); object, as Qt's int is 32-bit and both can
+    # pass 2**31 on large traces
+    progress = Signal(object, object)
+    result_ready = Signal(dict)
+    cancelled = Signal()
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        processes,
+        algorithm,
+        quantum,
+        cache=None,
+        stats=None,
+        cores=1,
+        queues=GLOBAL_QUEUE,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.processes = processes
+        self.algorithm = algorithm
+        self.quantum = quantum
+        self.cache = cache
+        self.stats = stats
+        self.cores = cores
+        self.queues = queues
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        scheduler = Scheduler(
+            self.processes,
+            self.algorithm,
+            self.quantum,
+            progress=self.progress.emit,
+            cancel_event=self.cancel_event,
+            cache=self.cache,
+            stats=self.stats,
+            cores=self.cores,
+            queues=self.queues,
+        )
+        try:
+            schedule, avg_waiting_time, avg_turnaround_time = scheduler.run_table()
+            if self.cancel_event.is_set():
+                raise SchedulingCancelled()
+        except SchedulingCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.result_ready.emit(
+            {
+                "algorithm": self.algorithm,
+                "quantum": self.quantum,
+                "cores": self.cores,
+                "queues": self.queues,
+                "schedule": schedule,
+                "avg_waiting_time": avg_waiting_time,
+                "avg_turnaround_time": avg_turnaround_time,
+                "metrics": scheduler.metrics,
+                "cached": scheduler.cache_hit,
+            }
+        )
+
+
+class TraceImportJob(QThread):
+    """Imports a job trace off the GUI thread."""
+
+    progress = Signal(object, object)  # (rows, fraction or None)
+    result_ready = Signal(dict)
+    cancelled = Signal()
+    failed = Signal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            result = import_trace(
+                self.path, progress=self.progress.emit, cancel_event=self.cancel_event
+            )
+        except TraceImportCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.result_ready.emit(result)
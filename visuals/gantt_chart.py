@@ -1,6 +1,43 @@
 import matplotlib.pyplot as plt
-from matplotlib import cm
+import numpy as np
+from matplotlib import colormaps
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.ticker import MaxNLocator
+
+# Level-of-detail thresholds, all in screen pixels
+LABEL_MIN_PIXELS = 60  # Narrower segments get no process label
+LABEL_MIN_HEIGHT_PIXELS = 30  # Lanes with shorter bars get no process labels
+TIME_LABEL_MIN_PIXELS = 25  # Average spacing needed to label every time point
+EDGE_MIN_PIXELS = 4  # Narrower segments are drawn without white edges
+MAX_LABELS = 200
+ZOOM_STEP = 1.25
+# Segments scanned at a time when loading, so e.g. a memory-mapped schedule
+# is never copied whole
+SCAN_CHUNK = 1 << 20
+
+
+def _is_sorted(values):
+    for begin in range(0, len(values), SCAN_CHUNK):
+        # Overlap by one so pairs across chunk borders are compared too
+        part = values[max(begin - 1, 0) : begin + SCAN_CHUNK]
+        if np.any(part[1:] < part[:-1]):
+            return False
+    return True
+
+
+def _first_appearance_rank(codes):
+    """Rank of every code by its first segment, and how many codes appear."""
+    never = len(codes)
+    first = np.full(int(codes.max()) + 1, never, dtype=np.int64)
+    for begin in range(0, len(codes), SCAN_CHUNK):
+        part = codes[begin : begin + SCAN_CHUNK]
+        unseen = np.flatnonzero(first[part] == never)
+        new_codes, index = np.unique(part[unseen], return_index=True)
+        first[new_codes] = begin + unseen[index]
+    appeared = np.flatnonzero(first < never)
+    rank = np.zeros(len(first), dtype=np.int64)
+    rank[appeared[np.argsort(first[appeared])]] = np.arange(len(appeared))
+    return rank, len(appeared)
 
 
 class GanttChart(FigureCanvas):
@@ -9,16 +46,23 @@ class GanttChart(FigureCanvas):
         super().__init__(self.figure)
         self.init_chart()
         self.processes = []
-        self.bars = []
         self.schedule = []
-        self.process_remaining_times = {}
+        self.lanes = []
+        self.detail_artists = []
 
         # Disable all interactive elements
         plt.rcParams["interactive"] = False
         plt.rcParams["toolbar"] = "None"
 
+        # Mouse wheel zooms the time axis; double-click resets the view
+        self.mpl_connect("scroll_event", self.on_scroll)
+        self.mpl_connect("button_press_event", self.on_click)
+        self.mpl_connect("resize_event", lambda event: self.render_visible())
+
     def init_chart(self):
         self.ax.clear()
+        self.detail_artists = []
+        self.lanes = []
         self.ax.set_title(
             "CPU Scheduling Gantt Chart", fontsize=16, color="#3070C0", weight="bold"
         )
@@ -32,74 +76,71 @@ class GanttChart(FigureCanvas):
         self.ax.set_yticks([])
         self.ax.set_xticks([])
 
-    def update_chart(self, schedule, processes):
+    def _schedule_arrays(self, schedule):
+        """Start/finish arrays, per-segment process codes, a name lookup and
+        the per-segment cores (None for a single-core schedule)."""
+        if hasattr(schedule, "pid"):
+            # Columnar ScheduleTable: read the arrays directly
+            return (
+                schedule.start,
+                schedule.finish,
+                schedule.pid,
+                schedule.processes.name,
+                schedule.cpu,
+            )
+        codes = {}
+        names = []
+        for entry in schedule:
+            if entry["Process"] not in codes:
+                codes[entry["Process"]] = len(names)
+                names.append(entry["Process"])
+        return (
+            np.array([entry["Start"] for entry in schedule]),
+            np.array([entry["Finish"] for entry in schedule]),
+            np.array([codes[entry["Process"]] for entry in schedule], dtype=np.int64),
+            names.__getitem__,
+            (
+                np.array([entry["CPU"] for entry in schedule])
+                if schedule and "CPU" in schedule[0]
+                else None
+            ),
+        )
+
+    def update_chart(self, schedule, processes, keep_view=False):
+        """Draw a new schedule.
+
+        keep_view keeps the current zoom and pan and only swaps the bars,
+        which is much cheaper than setting the axes up again.
+        """
+        if keep_view and self.lanes and len(schedule):
+            self.processes = processes
+            self.schedule = schedule
+            self._load_segments(schedule)
+            self.summary_text.set_text(f"Total Execution Time: {self.max_finish_time}")
+            xmin, xmax = self.ax.get_xlim()
+            if xmax > self.max_finish_time + 1:
+                # Changing the limits redraws through the xlim callback
+                self.ax.set_xlim(
+                    min(xmin, self.max_finish_time), self.max_finish_time + 1
+                )
+            else:
+                self.render_visible()
+            return
+
         self.init_chart()
         self.processes = processes
         self.schedule = schedule
-        self.bars = []
-        time_points = set()
-        max_finish_time = 0
-
-        num_processes = len(set(p["Process"] for p in schedule))
-        colors = cm.get_cmap("cool", num_processes)  # Blue-focused colormap
-        process_colors = {}
-        self.process_remaining_times = {}
-
-        for p in self.processes:
-            self.process_remaining_times[p["Process"]] = p["Burst Time"]
-
-        for process in schedule:
-            start = process["Start"]
-            finish = process["Finish"]
-            proc_name = process["Process"]
-            max_finish_time = max(max_finish_time, finish)
-            time_points.update([start, finish])
-            if proc_name not in process_colors:
-                process_colors[proc_name] = colors(len(process_colors))
-
-            executed_time = finish - start
-            bar = self.ax.barh(
-                y=0,
-                width=executed_time,
-                left=start,
-                color=process_colors[proc_name],
-                edgecolor="#FFFFFF",
-                height=0.5,
-                alpha=0.95,
-            )[0]
-            self.bars.append((bar, process))
-            remaining_time = self.process_remaining_times[proc_name] - executed_time
-            self.process_remaining_times[proc_name] = remaining_time
-            self.ax.text(
-                x=start + executed_time / 2,
-                y=0,
-                s=f"{proc_name}\nTime: {executed_time}",
-                ha="center",
-                va="center",
-                fontsize=10,
-                weight="bold",
-                color="#FFFFFF",
-            )
-
-        # Add time labels at each point
-        for time in sorted(time_points):
-            self.ax.text(
-                x=time,
-                y=-0.6,
-                s=str(time),
-                ha="center",
-                va="center",
-                fontsize=9,
-                color="#E0E0E0",
-            )
-            # Add vertical grid lines at time points
-            self.ax.axvline(x=time, color="#3070C0", alpha=0.2, linestyle=":")
+        if len(schedule) == 0:
+            self.draw()
+            return
+        self._load_segments(schedule)
 
         # Add a summary label showing total execution time
-        self.ax.text(
-            x=max_finish_time / 2,
-            y=-0.8,
-            s=f"Total Execution Time: {max_finish_time}",
+        self.summary_text = self.ax.text(
+            x=0.5,
+            y=0.1,
+            s=f"Total Execution Time: {self.max_finish_time}",
+            transform=self.ax.transAxes,
             ha="center",
             va="center",
             fontsize=11,
@@ -113,11 +154,195 @@ class GanttChart(FigureCanvas):
             ),
         )
 
-        # Set fixed axis limits
-        self.ax.set_xlim(0, max_finish_time + 1)
-        self.ax.set_ylim(-1, 1)
+        # Adaptive ticks instead of one tick per time unit
+        self.ax.xaxis.set_major_locator(MaxNLocator(nbins="auto", integer=True))
+        if len(self.lanes) == 1:
+            self.ax.set_ylim(-1, 1)
+        else:
+            # CPU 0 on top; the bottom margin keeps the summary box and time
+            # labels below the last lane as on a single-core chart
+            self.ax.set_yticks(
+                [lane[0] for lane in self.lanes],
+                [f"CPU {core}" for core in range(len(self.lanes))],
+            )
+            self.ax.set_ylim(
+                -(0.1 * len(self.lanes) + 0.75) / 0.9, len(self.lanes) - 0.5
+            )
+        self.ax.set_xlim(0, self.max_finish_time + 1)
+        self.ax.callbacks.connect("xlim_changed", lambda ax: self.render_visible())
+        self.render_visible()
+
+    def _load_segments(self, schedule):
+        """Sorted segment arrays per lane, colour ranks and the end time of a
+        schedule."""
+        start, finish, codes, self.name_of, cpu = self._schedule_arrays(schedule)
+        # Keep segments ordered by start so visible ranges are a binary search
+        if not _is_sorted(start):
+            order = np.argsort(start, kind="stable")
+            start, finish, codes = start[order], finish[order], codes[order]
+            cpu = None if cpu is None else cpu[order]
+        # One lane of (y, start, finish, codes) per core, CPU 0 at the top
+        if cpu is None:
+            self.lanes = [(0, start, finish, codes)]
+        else:
+            cores = max(getattr(schedule, "cores", 1), int(cpu.max()) + 1)
+            by_core = np.argsort(cpu, kind="stable")
+            bounds = np.searchsorted(cpu[by_core], np.arange(cores + 1))
+            self.lanes = []
+            for core in range(cores):
+                lane = by_core[bounds[core] : bounds[core + 1]]
+                self.lanes.append(
+                    (cores - 1 - core, start[lane], finish[lane], codes[lane])
+                )
+
+        # Colour processes in order of first appearance. The rank is kept per
+        # process and looked up only for drawn bars.
+        self.code_rank, appeared = _first_appearance_rank(codes)
+        # Blue-focused colormap
+        self.colors = colormaps["cool"].resampled(appeared)
+        self.max_finish_time = finish.max().item()
+
+    def render_visible(self):
+        """Redraw only what the current view can show at its pixel width."""
+        for artist in self.detail_artists:
+            artist.remove()
+        self.detail_artists = []
+        if not self.lanes:
+            return
+
+        xmin, xmax = self.ax.get_xlim()
+        extent = self.ax.get_window_extent()
+        width_px = max(1, int(extent.width))
+        units_per_px = (xmax - xmin) / width_px
+        ymin, ymax = self.ax.get_ylim()
+        # Process labels need bars at least this tall
+        labels = extent.height * 0.5 / (ymax - ymin) >= LABEL_MIN_HEIGHT_PIXELS
+
+        visible = []
+        for y, start, finish, codes in self.lanes:
+            # Segments overlapping the view (both columns are sorted)
+            lo = np.searchsorted(finish, xmin, side="right")
+            hi = np.searchsorted(start, xmax, side="left")
+            if hi <= lo:
+                continue
+            visible.append((start[lo:hi], finish[lo:hi]))
+            if hi - lo > width_px:
+                self._draw_aggregated(
+                    y, start, finish, codes, xmin, width_px, units_per_px
+                )
+            else:
+                self._draw_segments(
+                    y, start[lo:hi], finish[lo:hi], codes[lo:hi], units_per_px, labels
+                )
+
+        # Label every time point only while they are far enough apart; n
+        # visible segments always have more than n distinct time points
+        count = sum(len(lane_start) for lane_start, _ in visible)
+        if not count or count >= width_px / TIME_LABEL_MIN_PIXELS:
+            self.draw_idle()
+            return
+        time_points = np.unique(np.concatenate([np.concatenate(v) for v in visible]))
+        time_points = time_points[(time_points >= xmin) & (time_points <= xmax)]
+        if 0 < len(time_points) <= width_px / TIME_LABEL_MIN_PIXELS:
+            self.detail_artists.append(
+                self.ax.vlines(
+                    time_points,
+                    -1,
+                    len(self.lanes),
+                    colors="#3070C0",
+                    alpha=0.2,
+                    linestyles=":",
+                )
+            )
+            for time in time_points.tolist():
+                self.detail_artists.append(
+                    self.ax.text(
+                        x=time,
+                        y=-0.6,
+                        s=str(time),
+                        ha="center",
+                        va="center",
+                        fontsize=9,
+                        color="#E0E0E0",
+                    )
+                )
+        self.draw_idle()
+
+    def _draw_segments(self, y, start, finish, codes, units_per_px, labels=True):
+        width = finish - start
+        width_px = width / units_per_px if units_per_px > 0 else width
+        # White edges only help while segments are wide enough to see them
+        edge = "#FFFFFF" if np.median(width_px) >= EDGE_MIN_PIXELS else "none"
+        self.detail_artists.append(
+            self.ax.broken_barh(
+                np.column_stack([start, width]),
+                (y - 0.25, 0.5),
+                facecolors=self.colors(self.code_rank[codes]),
+                edgecolor=edge,
+                alpha=0.95,
+            )
+        )
+        if not labels:
+            return
+
+        name_of = self.name_of
+        labelled = np.flatnonzero(width_px >= LABEL_MIN_PIXELS)[:MAX_LABELS]
+        for i in labelled.tolist():
+            executed_time = width[i].item()
+            self.detail_artists.append(
+                self.ax.text(
+                    x=start[i].item() + executed_time / 2,
+                    y=y,
+                    s=f"{name_of(codes[i].item())}\nTime: {executed_time}",
+                    ha="center",
+                    va="center",
+                    fontsize=10,
+                    weight="bold",
+                    color="#FFFFFF",
+                    clip_on=True,
+                )
+            )
+
+    def _draw_aggregated(self, y, start, finish, codes, xmin, width_px, units_per_px):
+        """Draw one bar per run of pixels showing the same process."""
+        centers = xmin + (np.arange(width_px) + 0.5) * units_per_px
+        index = np.searchsorted(start, centers, side="right") - 1
+        covered = index >= 0
+        covered[covered] = finish[index[covered]] > centers[covered]
+        # -1 marks idle pixels; runs break wherever the process changes
+        column_rank = np.where(covered, self.code_rank[codes[index]], -1)
+        breaks = np.flatnonzero(np.diff(column_rank)) + 1
+        run_starts = np.concatenate([[0], breaks])
+        run_ends = np.concatenate([breaks, [width_px]])
+        busy = column_rank[run_starts] >= 0
+        run_starts, run_ends = run_starts[busy], run_ends[busy]
+        if len(run_starts) == 0:
+            return
+        self.detail_artists.append(
+            self.ax.broken_barh(
+                np.column_stack(
+                    [
+                        xmin + run_starts * units_per_px,
+                        (run_ends - run_starts) * units_per_px,
+                    ]
+                ),
+                (y - 0.25, 0.5),
+                facecolors=self.colors(column_rank[run_starts]),
+                edgecolor="none",
+                alpha=0.95,
+            )
+        )
 
-        # Add proper x-axis ticks
-        self.ax.set_xticks(list(range(0, max_finish_time + 1)))
+    def on_scroll(self, event):
+        if event.inaxes is not self.ax or not self.lanes:
+            return
+        xmin, xmax = self.ax.get_xlim()
+        scale = 1 / ZOOM_STEP if event.button == "up" else ZOOM_STEP
+        # Keep the time under the cursor fixed while zooming
+        new_min = event.xdata - (event.xdata - xmin) * scale
+        new_max = event.xdata + (xmax - event.xdata) * scale
+        self.ax.set_xlim(max(0, new_min), min(self.max_finish_time + 1, new_max))
 
-        self.draw()
+    def on_click(self, event):
+        if event.dblclick and self.lanes:
+            self.ax.set_xlim(0, self.max_finish_time + 1)